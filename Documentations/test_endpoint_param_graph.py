@@ -0,0 +1,79 @@
+"""
+Endpoint/Parameter Graph Testing
+Purpose: Validate endpoint_param_graph tool targeting queries
+
+Tests:
+  1. Tool name dispatch
+  2. Stable (crawl-order) query results
+"""
+
+import unittest
+
+from endpoint_param_graph import EndpointParamGraph
+
+
+def make_graph() -> EndpointParamGraph:
+    """Graph with one reflectable, one command-style and one plain endpoint"""
+    graph = EndpointParamGraph()
+    graph.build_from_crawl({
+        "endpoints": [
+            "https://example.com/search?q=1",
+            "https://example.com/run?cmd=ls",
+            "https://example.com/item?id=7",
+        ],
+        "reflections": ["q"],
+    })
+    return graph
+
+
+class TestToolDispatch(unittest.TestCase):
+    """Test tool names map to the right endpoint query"""
+
+    def setUp(self):
+        self.graph = make_graph()
+
+    def test_known_and_fuzzy_names(self):
+        self.assertEqual(self.graph.get_endpoints_for_tool("XSStrike"), ["https://example.com/search?q=1"])
+        self.assertEqual(self.graph.get_endpoints_for_tool("my-xss-scanner"), ["https://example.com/search?q=1"])
+        self.assertEqual(self.graph.get_endpoints_for_tool("ghauri-sql"), self.graph.get_endpoints_for_sqlmap())
+        self.assertEqual(self.graph.get_endpoints_for_tool("nuclei"), [])
+
+    def test_unknown_names_leave_shared_table_alone(self):
+        before = dict(EndpointParamGraph._TOOL_DISPATCH)
+        for i in range(50):
+            self.graph.get_endpoints_for_tool(f"tool-{i}")
+
+        self.assertEqual(dict(EndpointParamGraph._TOOL_DISPATCH), before)
+        with self.assertRaises(TypeError):
+            EndpointParamGraph._TOOL_DISPATCH["nuclei"] = None
+
+
+class TestQueryOrder(unittest.TestCase):
+    """Test indexed queries return endpoints in the order they were crawled"""
+
+    def setUp(self):
+        self.urls = [f"https://example.com/p{i}?{name}=1"
+                     for i, name in enumerate(["text", "cmd", "id", "q", "shell", "search", "exec"] * 3)]
+        self.graph = EndpointParamGraph()
+        self.graph.build_from_crawl({"endpoints": self.urls, "reflections": ["q", "text", "search"]})
+
+    def expected(self, names):
+        return [url for url in self.urls if url.split("?")[1].split("=")[0] in names]
+
+    def test_reflections_in_crawl_order(self):
+        self.assertEqual(self.graph.get_endpoints_with_reflections(), self.expected({"q", "text", "search"}))
+        self.assertEqual(self.graph.get_endpoints_for_xsstrike(), self.expected({"q", "text", "search"}))
+
+    def test_param_union_in_crawl_order(self):
+        self.assertEqual(self.graph.get_endpoints_for_commix(),
+                         self.expected({"cmd", "q", "shell", "search", "exec", "text"}))
+        self.assertEqual(self.graph.get_endpoints_with_params({"id", "cmd"}), self.expected({"id", "cmd"}))
+
+
+def run_tests():
+    """Run all tests"""
+    unittest.main(argv=[""], verbosity=2, exit=False)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,239 @@
+"""
+External Intel Testing
+Purpose: Validate the intel cache and bulk host lookups
+
+Tests:
+  1. IntelCache policies (enabled/readonly/replay/disabled)
+  2. Bulk Shodan/Censys host lookups
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+try:
+    import requests
+    from external_intel_connector import (
+        CensysConnector, ExternalIntelResult, IntelCache, ShodanConnector, TokenBucket
+    )
+except ImportError:  # requests/urllib3 not installed
+    ExternalIntelResult = IntelCache = None
+
+
+def intel_result(subject: str) -> ExternalIntelResult:
+    return ExternalIntelResult(
+        source="shodan",
+        data_type="host_info",
+        results=[{"ip": subject, "ports": [443]}],
+        success=True
+    )
+
+
+class CountingQuery:
+    """Stand-in for a live API query that records what it was asked for"""
+
+    def __init__(self):
+        self.calls = []
+
+    def one(self, subject: str):
+        return lambda: self._answer([subject])[subject]
+
+    def many(self, subjects):
+        return self._answer(subjects)
+
+    def _answer(self, subjects):
+        self.calls.append(list(subjects))
+        return {subject: intel_result(subject) for subject in subjects}
+
+
+@unittest.skipIf(IntelCache is None, "requests not installed")
+class TestIntelCachePolicy(unittest.TestCase):
+    """Test each cache policy against a shared on-disk cache"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.cache_dir, "intel.sqlite")
+        self.query = CountingQuery()
+        # Seed one entry through an enabled cache
+        IntelCache(self.path, policy="enabled").fetch("shodan", "10.0.0.1", self.query.one("10.0.0.1"))
+        self.query.calls.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_enabled_round_trip(self):
+        """Test a miss is queried and stored, then served from disk"""
+        cache = IntelCache(self.path, policy="enabled")
+        first = cache.fetch("shodan", "10.0.0.2", self.query.one("10.0.0.2"))
+        second = IntelCache(self.path, policy="enabled").fetch("shodan", "10.0.0.2", self.query.one("10.0.0.2"))
+
+        self.assertEqual(self.query.calls, [["10.0.0.2"]])
+        self.assertEqual(first, second)
+
+    def test_readonly_never_writes(self):
+        """Test readonly serves hits but leaves misses uncached"""
+        cache = IntelCache(self.path, policy="readonly")
+        hit = cache.fetch("shodan", "10.0.0.1", self.query.one("10.0.0.1"))
+        cache.fetch("shodan", "10.0.0.2", self.query.one("10.0.0.2"))
+        cache.fetch("shodan", "10.0.0.2", self.query.one("10.0.0.2"))
+
+        self.assertEqual(hit, intel_result("10.0.0.1"))
+        self.assertEqual(self.query.calls, [["10.0.0.2"], ["10.0.0.2"]])
+
+    def test_replay_miss_is_an_error(self):
+        """Test replay serves hits and never reaches the live API"""
+        cache = IntelCache(self.path, policy="replay")
+        results = cache.fetch_many("shodan", ["10.0.0.1", "10.0.0.2"], self.query.many)
+
+        self.assertEqual(self.query.calls, [])
+        self.assertTrue(results["10.0.0.1"].success)
+        self.assertFalse(results["10.0.0.2"].success)
+        self.assertEqual(results["10.0.0.2"].error, "replay_cache_miss")
+
+    def test_disabled_always_queries(self):
+        """Test disabled bypasses the cache even for cached subjects"""
+        cache = IntelCache(self.path, policy="disabled")
+        cache.fetch("shodan", "10.0.0.1", self.query.one("10.0.0.1"))
+
+        self.assertEqual(self.query.calls, [["10.0.0.1"]])
+
+    def test_unknown_policy_disables_cache(self):
+        """Test a bad policy value falls back to disabled instead of raising"""
+        cache = IntelCache(self.path, policy="sometimes")
+        cache.fetch("shodan", "10.0.0.1", self.query.one("10.0.0.1"))
+
+        self.assertEqual(cache.policy.value, "disabled")
+        self.assertEqual(self.query.calls, [["10.0.0.1"]])
+
+    def test_off_unless_configured(self):
+        """Test no policy and no path means no cache; a path alone enables it"""
+        with mock.patch.dict(os.environ, clear=True):
+            self.assertEqual(IntelCache().policy.value, "disabled")
+            self.assertEqual(IntelCache(self.path).policy.value, "enabled")
+            with mock.patch.dict(os.environ, {"VAPT_INTEL_CACHE": self.path}):
+                self.assertEqual(IntelCache().policy.value, "enabled")
+
+    def test_unreadable_entry_is_a_miss(self):
+        """Test corrupt or old-schema rows are re-queried instead of raising"""
+        conn = sqlite3.connect(self.path)
+        for subject, raw in (("10.0.0.2", "{not json"), ("10.0.0.3", '{"ip": "10.0.0.3"}')):
+            conn.execute("INSERT INTO intel VALUES (?, ?, ?)",
+                         (IntelCache.make_key("shodan", subject), time.time(), raw))
+        conn.commit()
+        conn.close()
+
+        cache = IntelCache(self.path, policy="enabled")
+        for subject in ("10.0.0.2", "10.0.0.3"):
+            self.assertEqual(cache.fetch("shodan", subject, self.query.one(subject)), intel_result(subject))
+        self.assertEqual(self.query.calls, [["10.0.0.2"], ["10.0.0.3"]])
+
+    def test_fetch_many_queries_only_misses(self):
+        """Test bulk fetch sends the misses in one query and keeps input order"""
+        cache = IntelCache(self.path, policy="enabled")
+        subjects = ["10.0.0.3", "10.0.0.1", "10.0.0.2"]
+        results = cache.fetch_many("shodan", subjects, self.query.many)
+
+        self.assertEqual(self.query.calls, [["10.0.0.3", "10.0.0.2"]])
+        self.assertEqual(list(results), subjects)
+
+        cache.fetch_many("shodan", subjects, self.query.many)
+        self.assertEqual(len(self.query.calls), 1)
+
+
+class FakeResponse:
+    """Minimal requests.Response carrying a JSON body"""
+
+    def __init__(self, data, status_code: int = 200):
+        self.content = json.dumps(data).encode()
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)
+
+
+class FakeHostSession:
+    """Answers Shodan/Censys bulk host requests for the known IPs only"""
+
+    def __init__(self, known):
+        self.known = set(known)
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        if "shodan" in url:
+            ips = url.split("/shodan/host/")[1].split("?")[0].split(",")
+            self.requests.append(ips)
+            hosts = [{"ip_str": ip, "ports": [443]} for ip in ips if ip in self.known]
+            if not hosts:
+                return FakeResponse({"error": "No information available"}, status_code=404)
+            return FakeResponse(hosts if len(ips) > 1 else hosts[0])
+
+        ips = [term.split(": ")[1] for term in params["q"].split(" or ")]
+        self.requests.append(ips)
+        hits = [{"ip": ip, "services": [{"service_name": "HTTP"}]} for ip in ips if ip in self.known]
+        return FakeResponse({"result": {"hits": hits}})
+
+
+@unittest.skipIf(IntelCache is None, "requests not installed")
+class TestBulkHostQueries(unittest.TestCase):
+    """Test bulk host lookups map each IP to its own result"""
+
+    def setUp(self):
+        self.ips = [f"10.0.{i // 250}.{i % 250 + 1}" for i in range(150)]
+        self.missing = self.ips[7]
+        self.session = FakeHostSession(ip for ip in self.ips if ip != self.missing)
+
+    def _connector(self, connector):
+        connector._bucket = TokenBucket(rpm=1e6)  # No rate-limit waits in tests
+        return connector
+
+    def test_shodan_bulk_mapping(self):
+        """Test Shodan chunks by BULK_SIZE and marks absent hosts not found"""
+        shodan = self._connector(ShodanConnector(api_key="key"))
+        results = shodan.query_hosts(self.ips, session=self.session)
+
+        self.assertEqual([len(chunk) for chunk in self.session.requests], [100, 50])
+        self.assertEqual(list(results), self.ips)
+        self.assertEqual(results[self.ips[0]].results[0]["ip"], self.ips[0])
+        self.assertEqual(results[self.ips[0]].results[0]["ports"], [443])
+        self.assertFalse(results[self.missing].success)
+        self.assertEqual(results[self.missing].error, "ip_not_found")
+
+    def test_shodan_single_host_not_found(self):
+        """Test a 404 for a one-IP chunk maps to ip_not_found"""
+        shodan = self._connector(ShodanConnector(api_key="key"))
+        results = shodan.query_hosts([self.missing], session=self.session)
+
+        self.assertEqual(results[self.missing].error, "ip_not_found")
+
+    def test_censys_bulk_mapping(self):
+        """Test Censys searches BULK_SIZE IPs at once and maps hits back"""
+        censys = self._connector(CensysConnector(api_id="id", api_secret="secret"))
+        results = censys.query_hosts(self.ips, session=self.session)
+
+        self.assertEqual([len(chunk) for chunk in self.session.requests], [100, 50])
+        self.assertEqual(results[self.ips[-1]].results[0]["ip"], self.ips[-1])
+        self.assertEqual(results[self.ips[-1]].results[0]["services"], [{"service_name": "HTTP"}])
+        self.assertEqual(results[self.missing].error, "ip_not_found")
+
+    def test_bulk_results_match_single_lookups(self):
+        """Test a bulk lookup stores the same result a single-host lookup would"""
+        shodan = self._connector(ShodanConnector(api_key="key"))
+        bulk = shodan.query_hosts(self.ips[:2], session=self.session)
+        single = shodan.query_host(self.ips[0], session=self.session)
+
+        self.assertEqual(bulk[self.ips[0]], single)
+
+
+def run_tests():
+    """Run all tests"""
+    unittest.main(argv=[""], verbosity=2, exit=False)
+
+
+if __name__ == "__main__":
+    run_tests()
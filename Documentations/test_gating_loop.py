@@ -0,0 +1,149 @@
+"""
+Gating Loop Testing
+Purpose: Validate crawl-gated payload tool targeting
+
+Tests:
+  1. Ledger decisions (including runtime changes)
+  2. Per-tool targets
+  3. Partial rebuild on a refreshed crawl
+"""
+
+import tempfile
+import unittest
+
+from crawl_adapter import CrawlAdapter
+from decision_ledger import DecisionLedger, Decision
+from gating_loop import GatingLoopOrchestrator, ToolTargets
+
+
+def make_adapter(**signals) -> CrawlAdapter:
+    """CrawlAdapter carrying the given gating signals (no crawl run)"""
+    adapter = CrawlAdapter("https://example.com", output_dir=tempfile.gettempdir())
+    adapter.gating_signals = {**CrawlAdapter._empty_signals(), **signals}
+    return adapter
+
+
+def make_ledger() -> DecisionLedger:
+    """Built ledger allowing all four payload tools"""
+    ledger = DecisionLedger(profile=None)
+    ledger.add_decision("xsstrike", Decision.CONDITIONAL, "If reflections found", priority=3)
+    ledger.add_decision("dalfox", Decision.CONDITIONAL, "If reflections found", priority=5)
+    ledger.add_decision("sqlmap", Decision.CONDITIONAL, "If parameters found", priority=4)
+    ledger.add_decision("commix", Decision.CONDITIONAL, "If parameters found", priority=1)
+    return ledger.build()
+
+
+class TestGatingLoopLedger(unittest.TestCase):
+    """Test that gating follows the decision ledger"""
+
+    def setUp(self):
+        self.ledger = make_ledger()
+        self.adapter = make_adapter(
+            reflection_count=2, reflectable_params=["q"],
+            parameter_count=3, parameter_names=["id", "q", "page"]
+        )
+        self.orchestrator = GatingLoopOrchestrator(self.ledger, self.adapter)
+
+    def test_signals_enable_tools(self):
+        targets = self.orchestrator.build_targets()
+        self.assertTrue(all(t.can_run for t in targets.values()))
+        self.assertEqual(targets["sqlmap"].priority, 4)
+        self.assertEqual(targets["xsstrike"].reflections, ["q"])
+
+    def test_runtime_deny_is_honored(self):
+        self.assertTrue(self.orchestrator.should_run_tool("sqlmap"))
+        self.orchestrator.build_targets()
+
+        self.ledger.record_tool_decision("sqlmap", Decision.DENY, "Blocked at runtime")
+
+        self.assertFalse(self.orchestrator.should_run_tool("sqlmap"))
+        self.assertEqual(self.orchestrator.get_tool_targets("sqlmap"), [])
+        self.assertFalse(self.orchestrator.build_targets()["sqlmap"].can_run)
+        self.assertTrue(self.orchestrator.should_run_tool("commix"))
+
+
+class TestGatingLoopTargets(unittest.TestCase):
+    """Test per-tool targets built from crawl signals"""
+
+    def test_disabled_targets_are_independent(self):
+        first = GatingLoopOrchestrator(make_ledger(), make_adapter()).build_targets()
+        second = GatingLoopOrchestrator(make_ledger(), make_adapter()).build_targets()
+        self.assertFalse(first["sqlmap"].can_run)
+        self.assertIsNot(first["sqlmap"], second["sqlmap"])
+
+        first["sqlmap"].add_parameter("/search", "q")
+        self.assertEqual(second["sqlmap"].parameters, {})
+        self.assertEqual(second["sqlmap"].param_count, 0)
+
+    def test_param_count_follows_direct_mutation(self):
+        targets = ToolTargets(tool_name="sqlmap", can_run=True, parameters={"/a": ["id"]})
+        self.assertEqual(targets.param_count, 1)
+
+        targets.add_parameter("/a", "q")
+        targets.parameters["/a"] = ["id", "q", "page"]
+        targets.parameters.update({"/b": ["x"]})
+        self.assertEqual(targets.param_count, 4)
+        self.assertEqual(targets.to_dict()["param_count"], 4)
+        self.assertIn("params=4", repr(targets))
+
+        del targets.parameters["/a"]
+        self.assertEqual(targets.param_count, 1)
+        with self.assertRaises(AttributeError):
+            targets.parameters["/b"].append("y")  # Read-only: would bypass the count
+
+        targets.parameters = {"/c": ["a", "b"]}
+        self.assertEqual(targets.param_count, 2)
+
+
+class TestGatingLoopUpdate(unittest.TestCase):
+    """Test update_adapter rebuilds only tools whose signals changed"""
+
+    def setUp(self):
+        self.ledger = make_ledger()
+        self.orchestrator = GatingLoopOrchestrator(
+            self.ledger, make_adapter(reflection_count=1, reflectable_params=["q"])
+        )
+        self.orchestrator.build_targets()
+
+    def test_parameter_change_rebuilds_param_tools(self):
+        refreshed = make_adapter(
+            reflection_count=1, reflectable_params=["q"],
+            parameter_count=2, parameter_names=["id", "q"]
+        )
+        before = self.orchestrator._targets_cache
+
+        self.assertEqual(self.orchestrator.update_adapter(refreshed), ["sqlmap", "commix"])
+
+        after = self.orchestrator._targets_cache  # Published map, not a fresh build
+        self.assertIs(after["xsstrike"], before["xsstrike"])
+        self.assertTrue(after["sqlmap"].can_run)
+
+        fresh = GatingLoopOrchestrator(self.ledger, refreshed)
+        self.assertEqual(self.orchestrator.to_dict(), fresh.to_dict())
+        self.assertEqual(self.orchestrator.get_summary(), fresh.get_summary())
+
+    def test_unchanged_signals_rebuild_nothing(self):
+        same = make_adapter(reflection_count=1, reflectable_params=["q"])
+        self.assertEqual(self.orchestrator.update_adapter(same), [])
+
+    def test_reflection_change_rebuilds_xss_tools(self):
+        refreshed = make_adapter(reflection_count=2, reflectable_params=["q", "name"])
+        self.assertEqual(self.orchestrator.update_adapter(refreshed), ["xsstrike", "dalfox"])
+        self.assertEqual(self.orchestrator.build_targets()["dalfox"].reflections, ["q", "name"])
+
+    def test_ledger_change_rebuilds_everything(self):
+        self.ledger.record_tool_decision("dalfox", Decision.DENY, "Blocked at runtime")
+        same = make_adapter(reflection_count=1, reflectable_params=["q"])
+
+        self.assertEqual(sorted(self.orchestrator.update_adapter(same)),
+                         sorted(["xsstrike", "dalfox", "sqlmap", "commix"]))
+        self.assertFalse(self.orchestrator.build_targets()["dalfox"].can_run)
+
+
+def run_tests():
+    """Run all tests"""
+    unittest.main(argv=[""], verbosity=2, exit=False)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -130,6 +130,36 @@ def test_payload_strategy():
     return True
 
 
+def test_payload_commands():
+    """Test payload commands built from the endpoint graph"""
+    print("\nTesting payload command building...")
+    
+    from endpoint_graph import EndpointGraph
+    from payload_strategy import PayloadStrategy
+    from payload_command_builder import PayloadCommandBuilder
+    
+    graph = EndpointGraph("https://x.com")
+    graph.add_crawl_result("https://x.com/search?q=1", "GET", {"q": ["1"]})
+    graph.mark_reflectable("q")
+    graph.mark_injectable_sql("q")
+    graph.finalize()
+    assert graph.get_endpoint("/search").to_dict()["methods"] == ["GET"], "Methods should serialize as names"
+    
+    builder = PayloadCommandBuilder(PayloadStrategy(), graph)
+    dalfox = builder.build_dalfox_commands("https://x.com")
+    assert dalfox and dalfox[0]["method"] == "GET", "dalfox should target GET"
+    assert dalfox[0]["command"] == "dalfox url https://x.com/search?q=<script>alert(1)</script>", \
+        "GET payload should be in the query string"
+    print("✓ dalfox command carries the payload")
+    
+    sqlmap = builder.build_sqlmap_commands("https://x.com")
+    assert sqlmap and sqlmap[0]["method"] == "GET", "sqlmap should target GET"
+    assert "https://x.com/search?q=1" in sqlmap[0]["command"], "sqlmap should keep the query string"
+    print("✓ sqlmap command keeps the query string")
+    
+    return True
+
+
 def test_enhanced_confidence():
     """Test enhanced confidence scoring"""
     print("\nTesting enhanced confidence scoring...")
@@ -300,6 +330,7 @@ def main():
         ("Discovery Classification", test_discovery_classification),
         ("OWASP Mapping", test_owasp_mapping),
         ("Payload Strategy", test_payload_strategy),
+        ("Payload Commands", test_payload_commands),
         ("Enhanced Confidence", test_enhanced_confidence),
         ("Deduplication", test_deduplication),
         ("Scanner Integration", test_scanner_integration),
@@ -14,6 +14,8 @@ Tests:
 import unittest
 import json
 import os
+import shutil
+import signal
 import tempfile
 from datetime import datetime
 
@@ -27,10 +29,36 @@ from risk_aggregation import RiskAggregator, RiskLevel
 from scan_profiles import ScanProfileManager, ProfileType
 from engine_resilience import (
     ResilienceEngine, TimeoutHandler, ToolCrashIsolator, PartialFailureHandler,
-    CheckpointManager, TimeoutException
+    CheckpointManager, ScanCheckpoint, TimeoutException
 )
 
 
+def _double(value):
+    """Picklable tool function for process-isolation tests"""
+    return [value * 2]
+
+
+def _sleep_then_return(value):
+    """Picklable tool function that outlives short timeouts"""
+    import time
+    time.sleep(5)
+    return [value]
+
+
+def _sleep_for(seconds):
+    """Picklable tool function that runs for the given time"""
+    import time
+    time.sleep(seconds)
+    return [seconds]
+
+
+def _slow_endpoint(endpoint):
+    """Picklable batch tool: "/slow" hangs, other endpoints take a second"""
+    import time
+    time.sleep(10 if endpoint == "/slow" else 1)
+    return [endpoint]
+
+
 class TestTrafficCapture(unittest.TestCase):
     """Test HTTP traffic capture and replay"""
 
@@ -550,6 +578,343 @@ class TestEngineResilience(unittest.TestCase):
         self.assertEqual(report["scan_id"], "test_scan")
 
 
+@unittest.skipUnless(hasattr(signal, "setitimer"), "SIGALRM interval timers not available")
+class TestInterruptingTimeouts(unittest.TestCase):
+    """Test opt-in SIGALRM timeouts for in-process tools"""
+
+    def tearDown(self):
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+    def test_default_is_advisory(self):
+        """Test no interval timer is armed around a call unless asked for"""
+        isolator = ToolCrashIsolator()
+        result = isolator.execute_tool_safe(
+            "tool", lambda: [signal.getitimer(signal.ITIMER_REAL)[0]], timeout_seconds=5
+        )
+        self.assertEqual(result, [0.0])
+
+    def test_interrupt_stops_hanging_call(self):
+        """Test interrupt_timeouts=True aborts a call that never polls check()"""
+        import time
+
+        isolator = ToolCrashIsolator(interrupt_timeouts=True)
+        started = time.monotonic()
+        result = isolator.execute_tool_safe("hung_tool", lambda: time.sleep(5), timeout_seconds=0.2)
+
+        self.assertEqual(result, [])
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(isolator.get_crash_report()["crashes_by_tool"], {"hung_tool": 1})
+
+    def test_existing_timer_is_restored(self):
+        """Test an interval timer armed before the call survives it"""
+        fired = []
+        handler = lambda signum, frame: fired.append(signum)
+        previous = signal.signal(signal.SIGALRM, handler)
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 30)
+            isolator = ToolCrashIsolator(interrupt_timeouts=True)
+            self.assertEqual(isolator.execute_tool_safe("tool", lambda: [1], timeout_seconds=5), [1])
+
+            self.assertGreater(signal.getitimer(signal.ITIMER_REAL)[0], 25)
+            self.assertIs(signal.getsignal(signal.SIGALRM), handler)
+            os.kill(os.getpid(), signal.SIGALRM)
+            self.assertEqual(fired, [signal.SIGALRM])
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    def test_sooner_outer_timer_still_fires(self):
+        """Test a displaced timer due before the tool's timeout runs on time"""
+        import time
+
+        fired = []
+        previous = signal.signal(signal.SIGALRM, lambda signum, frame: fired.append(time.monotonic()))
+        try:
+            started = time.monotonic()
+            signal.setitimer(signal.ITIMER_REAL, 0.2)
+            isolator = ToolCrashIsolator(interrupt_timeouts=True)
+            self.assertEqual(
+                isolator.execute_tool_safe("tool", lambda: time.sleep(0.5) or [1], timeout_seconds=5), [1]
+            )
+            self.assertEqual(len(fired), 1)
+            self.assertLess(fired[0] - started, 0.4)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+class TestProcessIsolation(unittest.TestCase):
+    """Test tools run in the killable process pool"""
+
+    def setUp(self):
+        self.isolator = ToolCrashIsolator(max_workers=2)
+
+    def tearDown(self):
+        self.isolator.shutdown()
+
+    def test_timeout_kills_pool_and_recovers(self):
+        """Test concurrent timeouts replace the pool once and later calls still run"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as threads:
+            timed_out = list(threads.map(
+                lambda v: self.isolator.execute_tool_safe(
+                    "slow_tool", _sleep_then_return, timeout_seconds=0.5, args=(v,)
+                ),
+                [1, 2]
+            ))
+        self.assertEqual(timed_out, [[], []])
+        self.assertEqual(self.isolator.get_crash_report()["total_crashes"], 2)
+
+        result = self.isolator.execute_tool_safe("fast_tool", _double, timeout_seconds=30, args=(21,))
+        self.assertEqual(result, [42])
+
+    def test_sibling_survives_pool_kill(self):
+        """Test a call whose worker dies with another call's timeout is rerun, not reported"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as threads:
+            slow = threads.submit(
+                self.isolator.execute_tool_safe, "slow_tool", _sleep_for, timeout_seconds=0.5, args=(10,)
+            )
+            sibling = threads.submit(
+                self.isolator.execute_tool_safe, "sibling_tool", _sleep_for, timeout_seconds=10, args=(1,)
+            )
+            self.assertEqual(slow.result(), [])
+            self.assertEqual(sibling.result(), [1])
+
+        self.assertEqual(self.isolator.get_crash_report()["crashes_by_tool"], {"slow_tool": 1})
+
+    def test_batch_runs_in_killable_workers(self):
+        """Test execute_batch results, and that only the timed-out call is killed and failed"""
+        import asyncio
+        import time
+
+        engine = ResilienceEngine(scan_id="batch_scan", checkpoint_enabled=False)
+
+        async def collect(tool_fn, timeout):
+            return dict([
+                item async for item in engine.execute_batch(
+                    "tool", ["/a", "/b"], tool_fn, concurrency=2, timeout_override=timeout
+                )
+            ])
+
+        self.assertEqual(asyncio.run(collect(_double, 30)), {"/a": ["/a/a"], "/b": ["/b/b"]})
+
+        async def collect_slow():
+            # "/b" starts when "/a" finishes and is still running when "/slow" times out
+            return dict([
+                item async for item in engine.execute_batch(
+                    "slow_tool", ["/slow", "/a", "/b"], _slow_endpoint, concurrency=2, timeout_override=1.5
+                )
+            ])
+
+        started = time.monotonic()
+        self.assertEqual(asyncio.run(collect_slow()),
+                         {"/slow": [], "/a": ["/a"], "/b": ["/b"]})
+        self.assertLess(time.monotonic() - started, 8)
+        self.assertEqual(engine.crash_isolator.get_crash_report()["crashes_by_tool"], {"slow_tool": 1})
+        stats = engine.partial_failure_handler.endpoint_stats
+        self.assertEqual({url: s["failures"] for url, s in stats.items()}, {"/a": 0, "/b": 0, "/slow": 1})
+
+
+class TestCheckpointManager(unittest.TestCase):
+    """Test checkpoint persistence"""
+
+    def setUp(self):
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.manager = CheckpointManager(checkpoint_dir=self.checkpoint_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+
+    def test_snapshot_round_trip(self):
+        """Test snapshot save/load, including non-string dict keys"""
+        checkpoint = ScanCheckpoint(
+            scan_id="scan_1",
+            scan_start_time="2024-01-01T00:00:00",
+            completed_endpoints=["/a"],
+            pending_endpoints=["/b"],
+            accumulated_results=[{"open_ports": {80: "http"}}]
+        )
+        self.manager.save_checkpoint("scan_1", checkpoint)
+
+        loaded = self.manager.load_checkpoint("scan_1")
+        self.assertEqual(loaded.completed_endpoints, ["/a"])
+        self.assertEqual(loaded.pending_endpoints, ["/b"])
+        self.assertEqual(loaded.accumulated_results, [{"open_ports": {"80": "http"}}])
+
+    def test_failed_save_keeps_previous_snapshot(self):
+        """Test an unserializable checkpoint does not clobber the last good one"""
+        good = ScanCheckpoint(scan_id="scan_1", scan_start_time="t0", completed_endpoints=["/a"])
+        self.manager.save_checkpoint("scan_1", good)
+
+        bad = ScanCheckpoint(scan_id="scan_1", scan_start_time="t0", accumulated_results=[object()])
+        with self.assertRaises(TypeError):
+            self.manager.save_checkpoint("scan_1", bad)
+
+        self.assertEqual(self.manager.load_checkpoint("scan_1").completed_endpoints, ["/a"])
+
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "needs POSIX ownership checks")
+    def test_fast_checkpoint_round_trip(self):
+        """Test binary snapshot save/load in a private directory"""
+        checkpoint = ScanCheckpoint(scan_id="scan_1", scan_start_time="t0", pending_endpoints=["/b"])
+        self.manager.save_checkpoint_fast("scan_1", checkpoint)
+
+        loaded = self.manager.load_checkpoint_fast("scan_1")
+        self.assertEqual(loaded.pending_endpoints, ["/b"])
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "needs POSIX ownership checks")
+    def test_fast_checkpoint_refused_in_shared_dir(self):
+        """Test binary snapshots are neither written nor unpickled from a shared directory"""
+        self.manager.save_checkpoint_fast("scan_1", ScanCheckpoint(scan_id="scan_1", scan_start_time="t0"))
+        os.chmod(self.checkpoint_dir, 0o777)
+
+        self.assertIsNone(self.manager.load_checkpoint_fast("scan_1"))
+        with self.assertRaises(PermissionError):
+            self.manager.save_checkpoint_fast("scan_1", ScanCheckpoint(scan_id="scan_1", scan_start_time="t0"))
+
+
+class TestCheckpointLog(unittest.TestCase):
+    """Test delta-log checkpoints: replay and compaction"""
+
+    def setUp(self):
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.engine = ResilienceEngine(scan_id="log_scan")
+        self.engine.checkpoint_manager = CheckpointManager(checkpoint_dir=self.checkpoint_dir)
+        self.manager = self.engine.checkpoint_manager
+
+    def tearDown(self):
+        self.engine.shutdown()
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+
+    def _progress(self):
+        self.engine.mark_endpoint_completed("/a")
+        self.engine.scan_checkpoint.progress["nuclei"] = 1
+        self.engine.checkpoint()
+        self.engine.mark_endpoint_completed("/b")
+        self.engine.scan_checkpoint.pending_endpoints = ["/c"]
+        self.engine.scan_checkpoint.progress["nuclei"] = 2
+        self.engine.checkpoint()
+
+    def test_log_replay_round_trip(self):
+        """Test successive deltas replay into the full checkpoint"""
+        self._progress()
+
+        self.assertFalse(os.path.exists(self.manager._snapshot_path("log_scan")))
+        loaded = self.manager.load_checkpoint("log_scan")
+        self.assertEqual(loaded.completed_endpoints, ["/a", "/b"])
+        self.assertEqual(loaded.pending_endpoints, ["/c"])
+        self.assertEqual(loaded.progress, {"nuclei": 2})
+
+    def test_compaction_then_more_deltas(self):
+        """Test compaction drops the log and later deltas apply on the snapshot"""
+        self._progress()
+        self.engine.compact_checkpoint()
+        self.assertFalse(os.path.exists(self.manager._log_path("log_scan")))
+
+        self.engine.mark_endpoint_completed("/c")
+        self.engine.scan_checkpoint.pending_endpoints = []
+        self.engine.checkpoint()
+
+        loaded = self.manager.load_checkpoint("log_scan")
+        self.assertEqual(loaded.completed_endpoints, ["/a", "/b", "/c"])
+        self.assertEqual(loaded.pending_endpoints, [])
+
+    def test_crash_before_log_removal(self):
+        """Test a snapshot next to the log it already holds does not replay it twice"""
+        self._progress()
+        log_path = self.manager._log_path("log_scan")
+        stale_log = log_path + ".copy"
+        shutil.copy(log_path, stale_log)
+        self.engine.compact_checkpoint()
+        os.replace(stale_log, log_path)  # As if we crashed before removing it
+
+        loaded = self.manager.load_checkpoint("log_scan")
+        self.assertEqual(loaded.completed_endpoints, ["/a", "/b"])
+
+        # Deltas appended to the leftover log still apply
+        self.engine.mark_endpoint_completed("/c")
+        self.engine.checkpoint()
+        loaded = self.manager.load_checkpoint("log_scan")
+        self.assertEqual(loaded.completed_endpoints, ["/a", "/b", "/c"])
+
+    def test_torn_log_tail_is_ignored(self):
+        """Test an interrupted final write does not lose earlier deltas"""
+        self._progress()
+        with open(self.manager._log_path("log_scan"), 'ab') as f:
+            f.write(b'{"t":"endpoint_done","ur')
+
+        loaded = self.manager.load_checkpoint("log_scan")
+        self.assertEqual(loaded.completed_endpoints, ["/a", "/b"])
+
+
+class TestStreamedResults(unittest.TestCase):
+    """Test NDJSON result streaming and its committed offset"""
+
+    def setUp(self):
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.engine = ResilienceEngine(scan_id="stream_scan")
+        self.engine.checkpoint_manager = CheckpointManager(checkpoint_dir=self.checkpoint_dir)
+        self.manager = self.engine.checkpoint_manager
+
+    def tearDown(self):
+        self.engine.shutdown()
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+
+    def test_only_committed_results_are_read_back(self):
+        """Test results past the checkpointed offset are not part of the resumable scan"""
+        self.engine.record_result({"n": 1})
+        self.engine.record_result({"n": 2})
+        self.engine.checkpoint()
+        self.engine.record_result({"n": 3})
+        self.engine._results_stream.flush()  # On disk, but never checkpointed
+
+        offset = self.manager.load_checkpoint("stream_scan").results_offset
+        committed = list(self.manager.iter_results("stream_scan", upto=offset))
+        self.assertEqual(committed, [{"n": 1}, {"n": 2}])
+
+        # The live engine commits before reading, so it sees its own results
+        self.assertEqual(list(self.engine.iter_results()), [{"n": 1}, {"n": 2}, {"n": 3}])
+
+    def test_cleanup_closes_results_stream(self):
+        """Test cleanup closes the append stream before deleting its file"""
+        self.engine.record_result({"n": 1})
+        stream = self.engine._results_stream
+        self.manager.cleanup_checkpoint("stream_scan")
+
+        self.assertTrue(stream.closed)
+        self.assertFalse(os.path.exists(self.manager._results_path("stream_scan")))
+
+        self.engine.record_result({"n": 2})
+        self.assertEqual(list(self.engine.iter_results()), [{"n": 2}])
+
+    def test_resume_drops_uncommitted_results(self):
+        """Test a resumed scan appends after the committed offset, not after stray bytes"""
+        self.engine.record_result({"n": 1})
+        self.engine.record_result({"n": 2})
+        self.engine.checkpoint()
+        self.engine.record_result({"n": 3})  # Never checkpointed: redone on resume
+        self.engine._results_stream.write(b'{"n": 4')  # Torn write
+        self.engine._results_stream.close()  # Crash
+
+        resumed = ResilienceEngine(scan_id="stream_scan")
+        resumed.checkpoint_manager = self.manager
+        resumed.scan_checkpoint = self.manager.load_checkpoint("stream_scan")
+        try:
+            resumed.record_result({"n": 5})
+            self.assertEqual(list(resumed.iter_results()), [{"n": 1}, {"n": 2}, {"n": 5}])
+        finally:
+            resumed.shutdown()
+
+    def test_torn_result_line_is_ignored(self):
+        """Test reading stops at a partial final line instead of raising"""
+        with open(self.manager._results_path("stream_scan"), 'wb') as f:
+            f.write(b'{"n": 1}\n{"n": 2}\n{"n": ')
+
+        self.assertEqual(list(self.manager.iter_results("stream_scan")), [{"n": 1}, {"n": 2}])
+
+
 def run_tests():
     """Run all tests"""
     unittest.main(argv=[""], verbosity=2, exit=False)
@@ -141,8 +141,8 @@ class ArchitectureValidator:
         plan = executor.get_execution_plan()
         
         # Validate each tool
-        for tool_name, cmd, meta in plan:
-            guard_tool_allowed_by_ledger(tool_name, ledger)
+        for spec in plan:
+            guard_tool_allowed_by_ledger(spec.name, ledger)
         
         # Plan should not be empty (at least ping + nmap always run)
         if not plan:
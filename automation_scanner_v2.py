@@ -10,6 +10,8 @@ import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from enum import Enum
+from itertools import chain, groupby, islice
+from operator import attrgetter
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 from urllib.request import Request, urlopen
@@ -1016,8 +1018,7 @@ class AutomationScannerV2:
         
         # Use unified parser for supported tools
         findings = parse_tool_output(tool, stdout, stderr, self.target)
-        for finding in findings:
-            self.findings.add(finding)
+        self.findings.bulk_add(findings)
         
         # Legacy parsers for nuclei/dalfox with OWASP enforcement
         if tool.startswith("nuclei"):
@@ -1139,7 +1140,7 @@ class AutomationScannerV2:
         plan = self.executor.get_execution_plan()
 
         # Deduplication guard: hard-fail on duplicate tools in plan
-        tool_names = [t[0] for t in plan]
+        tool_names = [t.name for t in plan]
         if len(tool_names) != len(set(tool_names)):
             from architecture_guards import ArchitectureViolation
             raise ArchitectureViolation(f"Duplicate tool in execution plan: {tool_names}")
@@ -1160,6 +1161,12 @@ class AutomationScannerV2:
                 "Nuclei": {"tools": {"nuclei_crit", "nuclei_high", "nuclei_all", "nuclei_cves", "nuclei_ssl"}},
         }
         
+        # Tool -> phase, built once instead of scanning every phase per tool
+        phase_of_tool: dict[str, str] = {}
+        for phase, info in phases.items():
+            for tool in info["tools"]:
+                phase_of_tool.setdefault(tool, phase)
+        
         # Track phase success
         phase_success = {phase: False for phase in phases}
         
@@ -1167,20 +1174,19 @@ class AutomationScannerV2:
         # Execute discovery tools to gather signals BEFORE checking completeness
         self.log("PHASE 1: Running discovery tools (DNS, Network, Web Detection, SSL/TLS)...", "INFO")
         
-        discovery_phases = ["DNS", "Subdomains", "Network", "WebDetection", "SSL"]
-        discovery_plan = [t for t in plan if any(
-            t[0] in phases[phase]["tools"] for phase in discovery_phases
-        )]
+        discovery_phases = {"DNS", "Subdomains", "Network", "WebDetection", "SSL"}
+        discovery_plan = [t for t in plan if phase_of_tool.get(t.name) in discovery_phases]
         
         # Execute discovery tools first
-        for i, (tool_name, cmd, meta) in enumerate(discovery_plan, 1):
+        for i, spec in enumerate(discovery_plan, 1):
+            tool_name = spec.name
             if not self.ledger.allows(tool_name):
                 continue
             self.log(f"[Discovery] Executing {tool_name}...", "INFO")
             try:
                 # Convert tuple to dict format expected by _run_tool
-                scoped_cmd = self._scope_command(tool_name, cmd)
-                plan_item = {"tool": tool_name, "command": scoped_cmd, **meta}
+                scoped_cmd = self._scope_command(tool_name, spec.cmd)
+                plan_item = {"tool": tool_name, "command": scoped_cmd, **spec.meta}
                 result = self._run_tool(plan_item, i, len(discovery_plan))
                 if result and result.get("status") == "SUCCESS":
                     self.log(f"  ✓ {tool_name} completed", "INFO")
@@ -1358,11 +1364,11 @@ class AutomationScannerV2:
         builder_payload_tools = {"dalfox", "sqlmap", "commix"}
         
         # Track tools already executed in discovery phase to avoid duplication
-        discovery_tool_names = {t[0] for t in discovery_plan}
+        discovery_tool_names = {t.name for t in discovery_plan}
         
-        for i, item in enumerate(plan, start=1):
-            # executor.get_execution_plan() returns tuples (tool, cmd, meta)
-            tool_name, cmd, meta = item
+        for i, spec in enumerate(plan, start=1):
+            # executor.get_execution_plan() returns ToolSpec entries
+            tool_name, cmd = spec.name, spec.cmd
             scoped_cmd = None
             
             # Skip tools that already ran in discovery phase
@@ -1370,11 +1376,7 @@ class AutomationScannerV2:
                 continue
             
             # Determine which phase this tool belongs to
-            current_phase = None
-            for phase, info in phases.items():
-                if tool_name in info["tools"]:
-                    current_phase = phase
-                    break
+            current_phase = phase_of_tool.get(tool_name)
             
             # NEW: Strict graph-based gating for payload tools
             payload_tools = {"xsstrike", "dalfox", "sqlmap", "commix"}
@@ -1394,7 +1396,7 @@ class AutomationScannerV2:
                         "outcome": ToolOutcome.BLOCKED.value,
                         "reason": reason,
                         "duration": 0,
-                        "category": meta.get("category", "Exploitation"),
+                        "category": spec.category,
                         "status": "BLOCKED",
                         "failure_reason": "blocked_by_gating",
                     })
@@ -1413,7 +1415,7 @@ class AutomationScannerV2:
                         "outcome": ToolOutcome.BLOCKED.value,
                         "reason": reason,
                         "duration": 0,
-                        "category": meta.get("category", "Exploitation"),
+                        "category": spec.category,
                         "status": "BLOCKED",
                         "failure_reason": "no_crawler_targets",
                     })
@@ -1424,7 +1426,7 @@ class AutomationScannerV2:
                     plan_item = {
                         "tool": tool_name,
                         "command": scoped_cmd,
-                        **meta,
+                        **spec.meta,
                         "endpoint": cmd_info.get("endpoint"),
                         "param": cmd_info.get("param"),
                         "method": cmd_info.get("method"),
@@ -1448,7 +1450,7 @@ class AutomationScannerV2:
             
             # Orchestrator decides strictly via decision layer; tools never self-skip
             scoped_cmd = scoped_cmd or self._scope_command(tool_name, cmd)
-            plan_item = {"tool": tool_name, "command": scoped_cmd, **meta}
+            plan_item = {"tool": tool_name, "command": scoped_cmd, **spec.meta}
             if gated_targets:
                 plan_item["gated_targets"] = gated_targets
             result = self._run_tool(plan_item, i, total)
@@ -1478,14 +1480,14 @@ class AutomationScannerV2:
 
         # JSON-safe plan (convert sets to sorted lists)
         plan_serialized = []
-        for (t, c, m) in plan:
+        for spec in plan:
             safe_meta = {}
-            for k, v in m.items():
-                if isinstance(v, set):
+            for k, v in spec.meta.items():
+                if isinstance(v, (set, frozenset)):
                     safe_meta[k] = sorted(v)
                 else:
                     safe_meta[k] = v
-            plan_serialized.append({"tool": t, "command": c, **safe_meta})
+            plan_serialized.append({"tool": spec.name, "command": spec.cmd, **safe_meta})
 
         # NEW: Apply intelligence layer for confidence scoring and correlation
         all_findings = list(self.findings.get_all())
@@ -1502,7 +1504,7 @@ class AutomationScannerV2:
                 "cwe": finding.cwe,
                 "owasp": finding.owasp,
                 "tool": finding.tool,
-                "evidence": finding.evidence[:500] if finding.evidence else "",
+                "evidence": finding.evidence or "",  # Capped at EVIDENCE_MAX on creation
             }
             # Apply OWASP mapping if not already set
             if not f_dict.get("owasp"):
@@ -1522,11 +1524,12 @@ class AutomationScannerV2:
         
         # Phase 4: Enhanced confidence scoring
         if self.enhanced_confidence:
-            for finding in correlated_findings:
-                if isinstance(finding, dict):
-                    confidence_score = self.enhanced_confidence.calculate_finding_confidence(finding)
-                    finding["confidence"] = confidence_score
-                    finding["confidence_label"] = self.enhanced_confidence.get_confidence_label(confidence_score)
+            dict_findings = [f for f in correlated_findings if isinstance(f, dict)]
+            scores = self.enhanced_confidence.calculate_many(dict_findings)
+            labels = self.enhanced_confidence.labels_for(scores)
+            for finding, confidence_score, label in zip(dict_findings, scores, labels):
+                finding["confidence"] = confidence_score
+                finding["confidence_label"] = label
         
         vulnerability_report = {}
         risk_report = {}
@@ -1572,25 +1575,7 @@ class AutomationScannerV2:
             # Handle both dict and CorrelatedFinding objects
             if isinstance(cf, dict):
                 # Reconstruct Finding objects from dicts
-                try:
-                    f_type = FindingType[cf.get('type', 'OTHER')] if isinstance(cf.get('type'), str) else FindingType.OTHER
-                except (KeyError, TypeError):
-                    f_type = FindingType.OTHER
-                try:
-                    f_sev = Severity[cf.get('severity', 'INFO')] if isinstance(cf.get('severity'), str) else Severity.INFO
-                except (KeyError, TypeError):
-                    f_sev = Severity.INFO
-                finding = Finding(
-                    type=f_type,
-                    severity=f_sev,
-                    location=cf.get('location', ''),
-                    description=cf.get('description', ''),
-                    cwe=cf.get('cwe'),
-                    owasp=cf.get('owasp'),
-                    tool=cf.get('tool', 'unknown'),
-                    evidence=cf.get('evidence', ''),
-                    remediation=cf.get('remediation', ''),
-                )
+                finding = Finding.from_dict(cf)
                 self.findings.add(finding)
             elif hasattr(cf, 'primary_finding'):
                 self.findings.add(cf.primary_finding)
@@ -1751,8 +1736,8 @@ class AutomationScannerV2:
 
         # Filter: suppress LOW/INFO in detailed body unless requested elsewhere
         findings = [
-            f for f in all_findings
-            if f.severity in {Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM}
+            f for severity in (Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM)
+            for f in self.findings.get_by_severity(severity)
         ]
 
         lines.append("\nDETAILED FINDINGS (CRITICAL/HIGH/MEDIUM)")
@@ -1770,24 +1755,18 @@ class AutomationScannerV2:
 
             for owasp_cat in sorted(by_owasp.keys()):
                 lines.append(f"\n[{owasp_cat}]")
-                cat_findings = by_owasp[owasp_cat]
-
-                crit = [f for f in cat_findings if f.severity == Severity.CRITICAL]
-                high = [f for f in cat_findings if f.severity == Severity.HIGH]
-                med = [f for f in cat_findings if f.severity == Severity.MEDIUM]
-
-                for severity, group in [(Severity.CRITICAL, crit), (Severity.HIGH, high), (Severity.MEDIUM, med)]:
-                    if group:
-                        lines.append(f"  {severity.value}:")
-                        for finding in group:
-                            lines.append(f"    - {finding.type.value}: {finding.description}")
-                            lines.append(f"      Location: {finding.location}")
-                            if finding.cwe:
-                                cwe_val = str(finding.cwe)
-                                if cwe_val.upper().startswith("CWE-"):
-                                    lines.append(f"      {cwe_val}")
-                                else:
-                                    lines.append(f"      CWE-{cwe_val}")
+                # findings is severity-ordered, so each category is too
+                for severity, group in groupby(by_owasp[owasp_cat], key=attrgetter("severity")):
+                    lines.append(f"  {severity.value}:")
+                    for finding in group:
+                        lines.append(f"    - {finding.type.value}: {finding.description}")
+                        lines.append(f"      Location: {finding.location}")
+                        if finding.cwe:
+                            cwe_val = str(finding.cwe)
+                            if cwe_val.upper().startswith("CWE-"):
+                                lines.append(f"      {cwe_val}")
+                            else:
+                                lines.append(f"      CWE-{cwe_val}")
 
         lines.append("\nSUPPRESSED FINDINGS OVERVIEW (LOW/INFO)")
         lines.append("-" * 80)
@@ -1796,10 +1775,10 @@ class AutomationScannerV2:
             f"INFO: {severity_counts.get(Severity.INFO, 0)}"
         )
 
-        suppressed = [
-            f for f in all_findings
-            if f.severity in {Severity.LOW, Severity.INFO}
-        ][:5]
+        suppressed = list(islice(chain(
+            self.findings.get_by_severity(Severity.LOW),
+            self.findings.get_by_severity(Severity.INFO),
+        ), 5))
         if suppressed:
             lines.append("Sample entries:")
             for finding in suppressed:
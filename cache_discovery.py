@@ -5,9 +5,14 @@ Feeds forward to gate later tools (commix, dalfox, sqlmap, nuclei).
 """
 
 from dataclasses import dataclass, field
-from typing import Set
+from typing import Iterable, Set
 from urllib.parse import urlparse, parse_qs
 
+# Parameter-name heuristics (matched case-insensitively)
+_REFLECTIVE_HINTS = frozenset({"q", "s", "search", "redirect", "return", "next", "url", "target"})
+_COMMAND_HINTS = frozenset({"cmd", "command", "exec", "execute", "shell", "ping", "host", "ip", "target", "url", "path"})
+_SSRF_HINTS = frozenset({"url", "uri", "target", "redirect", "return", "dest", "domain", "callback", "forward"})
+
 
 @dataclass
 class DiscoveryCache:
@@ -75,16 +80,27 @@ class DiscoveryCache:
         if param and param.strip():
             normalized = param.strip()
             self.params.add(normalized)
-            # Heuristic: some params are strong reflection indicators
-            reflective_hints = {"q", "s", "search", "redirect", "return", "next", "url", "target"}
-            if normalized.lower() in reflective_hints:
-                self.reflections.add(f"hint:{normalized}")
-            command_hints = {"cmd", "command", "exec", "execute", "shell", "ping", "host", "ip", "target", "url", "path"}
-            if normalized.lower() in command_hints:
-                self.command_params.add(normalized)
-            ssrf_hints = {"url", "uri", "target", "redirect", "return", "dest", "domain", "callback", "forward"}
-            if normalized.lower() in ssrf_hints:
-                self.ssrf_params.add(normalized)
+            self._classify_param(normalized)
+    
+    def add_params_bulk(self, params: Iterable[str]):
+        """Log many discovered parameters at once (same rules as add_param)"""
+        normalized = {param.strip() for param in params if param}
+        normalized.discard("")
+        new_params = normalized - self.params
+        self.params.update(new_params)
+        for param in new_params:
+            self._classify_param(param)
+    
+    def _classify_param(self, normalized: str):
+        """Record reflection/command/SSRF hints for a normalized param name"""
+        lowered = normalized.lower()
+        # Heuristic: some params are strong reflection indicators
+        if lowered in _REFLECTIVE_HINTS:
+            self.reflections.add(f"hint:{normalized}")
+        if lowered in _COMMAND_HINTS:
+            self.command_params.add(normalized)
+        if lowered in _SSRF_HINTS:
+            self.ssrf_params.add(normalized)
     
     def add_reflection(self, reflection: str):
         """Log reflected parameter (XSS candidate)"""
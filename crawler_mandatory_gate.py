@@ -241,13 +241,16 @@ class CrawlerMandatoryGate:
             logger.info("[CrawlerGate] Crawler succeeded, no ledger updates needed")
             return
 
+        from decision_ledger import Decision
+
         # Block payload tools
         blocked_tools = self.get_blocked_tools()
         for tool_name in blocked_tools:
             if tool_name in ledger.decisions:
-                # Update existing decision to DENY
-                ledger.decisions[tool_name].decision = "DENY"
-                ledger.decisions[tool_name].reason = (
+                # Update existing decision to DENY (via API so ledger caches invalidate)
+                ledger.record_tool_decision(
+                    tool_name,
+                    Decision.DENY,
                     f"BLOCKED: Crawler {self._crawler_status.value} - {self._failure_reason}"
                 )
                 logger.warning(f"[CrawlerGate] Blocked {tool_name} due to crawler failure")
@@ -11,7 +11,7 @@ Read-only during execution.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 from enum import Enum
 from datetime import datetime
 
@@ -53,6 +53,42 @@ class DecisionLedger:
         # Keep a datetime so isoformat() calls are safe during serialization
         self.created_at = datetime.now()
         self._is_built = False
+        # Bumped on every decision change; keys caches derived from the ledger
+        self._version = 0
+        self._fingerprint: Optional[FrozenSet[str]] = None
+        self._known_tools: Optional[FrozenSet[str]] = None
+    
+    def _touch(self) -> None:
+        """Invalidate derived views after a decision change"""
+        self._version += 1
+        self._fingerprint = None
+        self._known_tools = None
+    
+    @property
+    def version(self) -> int:
+        """Monotonic counter of decision changes"""
+        return self._version
+    
+    def fingerprint(self) -> FrozenSet[str]:
+        """Hashable view of the ledger: names of tools allowed to run"""
+        if self._fingerprint is None:
+            self._fingerprint = frozenset(
+                name for name, decision in self.decisions.items()
+                if decision.decision in (Decision.ALLOW, Decision.CONDITIONAL)
+            )
+        return self._fingerprint
+    
+    @property
+    def allowed_set(self) -> FrozenSet[str]:
+        """Cached frozenset of allowed tools, for set-based plan filtering"""
+        return self.fingerprint()
+    
+    @property
+    def known_tools(self) -> FrozenSet[str]:
+        """Names of all tools with a ledger entry"""
+        if self._known_tools is None:
+            self._known_tools = frozenset(self.decisions)
+        return self._known_tools
     
     def add_decision(
         self, 
@@ -75,6 +111,7 @@ class DecisionLedger:
             priority=priority,
             timeout=timeout,
         )
+        self._touch()
     
     def allows(self, tool_name: str) -> bool:
         """Check if tool is allowed to run"""
@@ -118,6 +155,11 @@ class DecisionLedger:
         
         return self.decisions[tool_name].priority
     
+    def get_priorities(self, tool_names: List[str]) -> Dict[str, int]:
+        """Get priorities for several tools in one call"""
+        decisions = self.decisions
+        return {name: decisions[name].priority if name in decisions else 0 for name in tool_names}
+    
     def get_allowed_tools(self) -> List[str]:
         """Get list of allowed tools in priority order"""
         allowed = [
@@ -187,6 +229,7 @@ class DecisionLedger:
             priority=priority,
             timeout=timeout,
         )
+        self._touch()
 
     # ===== CRAWL-BASED GATING (NEW) =====
     # Non-invasive: adds new methods without touching existing logic
@@ -41,6 +41,10 @@ class ParameterSource(Enum):
     API_DOCS = "api_docs"
     CRAWLED = "crawled"
 
+    # Members are singletons compared by identity; hash by identity in C
+    # instead of Enum's Python-level hash(self._name_)
+    __hash__ = object.__hash__
+
 
 class HTTPMethod(Enum):
     """HTTP methods"""
@@ -52,6 +56,13 @@ class HTTPMethod(Enum):
     HEAD = "HEAD"
     OPTIONS = "OPTIONS"
 
+    __hash__ = object.__hash__  # See ParameterSource
+
+
+# Plain-dict lookups: avoid enum metaclass __getitem__ on the add_crawl_result path
+_METHOD_MAP: Dict[str, HTTPMethod] = {m.name: m for m in HTTPMethod}
+_SOURCE_VALUES: Dict[ParameterSource, str] = {s: s.value for s in ParameterSource}
+
 
 @dataclass
 class Parameter:
@@ -88,7 +99,7 @@ class Parameter:
         """Serialize"""
         return {
             "name": self.name,
-            "sources": [s.value for s in self.sources],
+            "sources": [_SOURCE_VALUES[s] for s in self.sources],
             "endpoints": list(self.endpoints),
             "frequency": self.frequency,
             "reflectable": self.reflectable,
@@ -140,7 +151,7 @@ class Endpoint:
             "path": self.path,
             "methods": [m.value for m in self.methods],
             "parameters": {name: p.to_dict() for name, p in self.parameters.items()},
-            "sources": [s.value for s in self.sources],
+            "sources": [_SOURCE_VALUES[s] for s in self.sources],
             "status_code": self.status_code,
             "is_api": self.is_api,
             "is_form": self.is_form,
@@ -194,10 +205,7 @@ class EndpointGraph:
         ep = self.endpoints[path]
 
         # Add method
-        try:
-            ep.add_method(HTTPMethod[method.upper()])
-        except KeyError:
-            ep.add_method(HTTPMethod.GET)
+        ep.add_method(_METHOD_MAP.get(method.upper(), HTTPMethod.GET))
 
         # Mark source
         ep.add_source(ParameterSource.CRAWLED)
@@ -6,19 +6,62 @@ Data Structure:
   endpoints[url] = {
     "method": "GET",
     "parameters": {
-      "search": {"sources": ["url_param"], "reflectable": True},
-      "id": {"sources": ["form_field"], "reflectable": True}
+      "search": {"sources": {"url_param"}, "reflectable": True},
+      "id": {"sources": {"form_field"}, "reflectable": True}
     },
     "forms": [{"action": ..., "fields": [...]}]
   }
 """
 
 import logging
-from typing import Dict, List, Set, Optional
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Set, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
 logger = logging.getLogger(__name__)
 
+# Case-insensitive "/api/" probe without lowering a copy of every URL
+_API_RE = re.compile(r"/api/", re.IGNORECASE)
+
+# Params like: cmd, command, exec, shell, query, etc.
+_COMMIX_PARAMS = frozenset({'cmd', 'command', 'exec', 'shell', 'query', 'q', 'search', 'text'})
+
+
+@lru_cache(maxsize=8192)
+def _parse_url(url: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """Memoized (path, query, query param names) - URLs recur across crawl batches"""
+    parsed = urlparse(url)
+    param_names = tuple(parse_qs(parsed.query).keys()) if parsed.query else ()
+    return parsed.path, parsed.query, param_names
+
+
+class _DerivedCache:
+    """
+    Memoized values derived from graph state
+    
+    Each node remembers the graph version it was computed at; mutators bump
+    the version and a node is recomputed lazily on its next read.
+    """
+
+    __slots__ = ("version", "_values")
+
+    def __init__(self):
+        self.version = 0
+        self._values: Dict[Hashable, Tuple[int, Any]] = {}  # key -> (version, value)
+
+    def bump(self) -> None:
+        """Invalidate every node"""
+        self.version += 1
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Node value at the current version"""
+        entry = self._values.get(key)
+        if entry is None or entry[0] != self.version:
+            entry = self._values[key] = (self.version, compute())
+        return entry[1]
+
 
 class EndpointParamGraph:
     """
@@ -36,6 +79,30 @@ class EndpointParamGraph:
         self.param_sources: Dict[str, Set[str]] = {}  # param_name -> {endpoints}
         self.reflectable_params: Set[str] = set()
         self.injectable_params: Set[str] = set()
+        # Inverted indices maintained at insertion time (dicts: insertion-ordered sets)
+        self._reflectable_endpoints: Dict[str, None] = {}
+        self._param_to_endpoints: Dict[str, Dict[str, None]] = {}  # param_name -> {endpoints}
+        self._endpoint_pos: Dict[str, int] = {}  # url -> insertion position in endpoints
+        # Derived query values, recomputed only after a mutation
+        self._derived = _DerivedCache()
+
+    def _invalidate(self) -> None:
+        """Mark derived query results stale after a mutation"""
+        self._derived.bump()
+
+    def _cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return a derived value, recomputing once per graph version"""
+        return self._derived.get(key, compute)
+
+    def _index_parameter(self, url: str, param_name: str, reflectable: bool) -> None:
+        """Record endpoint/param membership in the inverted indices"""
+        self._param_to_endpoints.setdefault(param_name, {})[url] = None
+        if reflectable:
+            self._reflectable_endpoints[url] = None
+
+    def _in_endpoint_order(self, urls: Iterable[str]) -> List[str]:
+        """Indexed URLs in the order their endpoints were added (stable output)"""
+        return sorted(urls, key=self._endpoint_pos.__getitem__)
 
     def build_from_crawl(self, crawl_result: Dict) -> None:
         """
@@ -54,6 +121,7 @@ class EndpointParamGraph:
 
         # Extract reflectable params
         self.reflectable_params = set(crawl_result.get("reflections", []))
+        self._invalidate()
 
         # Build endpoint nodes
         for endpoint in crawl_result.get("endpoints", []):
@@ -79,45 +147,48 @@ class EndpointParamGraph:
     def _add_endpoint(self, url: str) -> None:
         """Add or update endpoint node"""
         if url not in self.endpoints:
-            parsed = urlparse(url)
+            self._invalidate()
+            self._endpoint_pos[url] = len(self.endpoints)
+            path, query, param_names = _parse_url(url)
+            parameters: Dict[str, Dict] = {}
             self.endpoints[url] = {
                 "url": url,
-                "path": parsed.path,
-                "query": parsed.query,
+                "path": path,
+                "query": query,
                 "method": "GET",
-                "parameters": {},
+                "parameters": parameters,
                 "forms": [],
-                "is_api": "/api/" in url.lower()
+                "is_api": _API_RE.search(url) is not None
             }
             
-            # Extract URL parameters
-            if parsed.query:
-                params = parse_qs(parsed.query)
-                for param in params.keys():
-                    if param not in self.endpoints[url]["parameters"]:
-                        self.endpoints[url]["parameters"][param] = {
-                            "sources": [],
-                            "reflectable": param in self.reflectable_params
-                        }
-                    self.endpoints[url]["parameters"][param]["sources"].append("url")
+            # Extract URL parameters (parse_qs keys are unique)
+            reflectable_params = self.reflectable_params
+            for param in param_names:
+                reflectable = param in reflectable_params
+                parameters[param] = {"sources": {"url"}, "reflectable": reflectable}
+                self._index_parameter(url, param, reflectable)
 
     def _add_parameter(self, param_name: str, source: str, endpoint: str = None) -> None:
         """Track parameter discovery"""
         if param_name not in self.param_sources:
             self.param_sources[param_name] = set()
+            self._invalidate()
 
         if endpoint:
+            self._invalidate()
             self.param_sources[param_name].add(endpoint)
-            if endpoint in self.endpoints:
-                if param_name not in self.endpoints[endpoint]["parameters"]:
-                    self.endpoints[endpoint]["parameters"][param_name] = {
-                        "sources": [],
+            ep_data = self.endpoints.get(endpoint)
+            if ep_data is not None:
+                param_data = ep_data["parameters"].get(param_name)
+                if param_data is None:
+                    param_data = ep_data["parameters"][param_name] = {
+                        "sources": set(),
                         "reflectable": param_name in self.reflectable_params
                     }
-                if source not in self.endpoints[endpoint]["parameters"][param_name]["sources"]:
-                    self.endpoints[endpoint]["parameters"][param_name]["sources"].append(source)
+                param_data["sources"].add(source)
+                self._index_parameter(endpoint, param_name, param_data["reflectable"])
 
-    def get_endpoints_with_params(self, param_filter: Set[str] = None) -> List[str]:
+    def get_endpoints_with_params(self, param_filter: Optional[Set[str]] = None) -> List[str]:
         """
         Get endpoints that have parameters
         
@@ -128,31 +199,26 @@ class EndpointParamGraph:
             List of endpoint URLs
         """
         if not param_filter:
-            return [url for url in self.endpoints.keys() if self.endpoints[url]["parameters"]]
+            return list(self._cached("params", lambda: tuple(self._scan_params())))
 
-        matching = []
-        for url, ep_data in self.endpoints.items():
-            params = set(ep_data.get("parameters", {}).keys())
-            if params & param_filter:  # Intersection
-                matching.append(url)
-
-        return matching
+        index = self._param_to_endpoints
+        return self._in_endpoint_order(set().union(*(index.get(p, ()) for p in param_filter)))
 
     def get_endpoints_with_reflections(self) -> List[str]:
         """Get endpoints with reflectable parameters"""
-        matching = []
-        for url, ep_data in self.endpoints.items():
-            params = ep_data.get("parameters", {})
-            for param_name, param_data in params.items():
-                if param_data.get("reflectable"):
-                    matching.append(url)
-                    break
-
-        return matching
+        return list(self._cached(
+            "reflections", lambda: tuple(self._in_endpoint_order(self._reflectable_endpoints))
+        ))
 
     def get_endpoints_with_forms(self) -> List[str]:
         """Get endpoints with forms"""
-        return [url for url in self.endpoints.keys() if self.endpoints[url].get("forms")]
+        return list(self._cached("forms", lambda: tuple(self._scan_forms())))
+
+    def _scan_params(self) -> List[str]:
+        return [url for url, ep_data in self.endpoints.items() if ep_data["parameters"]]
+
+    def _scan_forms(self) -> List[str]:
+        return [url for url, ep_data in self.endpoints.items() if ep_data["forms"]]
 
     def get_endpoints_for_sqlmap(self) -> List[str]:
         """Get endpoints suitable for sqlmap (have injectable params)"""
@@ -160,15 +226,13 @@ class EndpointParamGraph:
 
     def get_endpoints_for_xsstrike(self) -> List[str]:
         """Get endpoints suitable for xsstrike (reflectable params or forms)"""
-        reflective = set(self.get_endpoints_with_reflections())
-        forms = set(self.get_endpoints_with_forms())
-        return list(reflective | forms)
+        return list(self._cached("xsstrike", lambda: tuple(self._in_endpoint_order(
+            self._reflectable_endpoints.keys() | set(self.get_endpoints_with_forms())
+        ))))
 
     def get_endpoints_for_commix(self) -> List[str]:
         """Get endpoints suitable for commix (command injection params)"""
-        # Params like: cmd, command, exec, shell, query, etc.
-        cmd_params = {'cmd', 'command', 'exec', 'shell', 'query', 'q', 'search', 'text'}
-        return self.get_endpoints_with_params(cmd_params)
+        return list(self._cached("commix", lambda: tuple(self.get_endpoints_with_params(_COMMIX_PARAMS))))
 
     def get_endpoints_for_tool(self, tool_name: str) -> List[str]:
         """
@@ -181,15 +245,31 @@ class EndpointParamGraph:
             List of endpoint URLs to test
         """
         tool_lower = tool_name.lower()
+        query = self._TOOL_DISPATCH.get(tool_lower) or self._resolve_tool_query(tool_lower)
+        return query(self) if query else []
 
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _resolve_tool_query(cls, tool_lower: str) -> Optional[Callable]:
+        """Fuzzy name match for tools not in the dispatch table (bounded memo)"""
         if "xss" in tool_lower or tool_lower == "dalfox":
-            return self.get_endpoints_for_xsstrike()
+            return cls.get_endpoints_for_xsstrike
         elif "sql" in tool_lower:
-            return self.get_endpoints_for_sqlmap()
+            return cls.get_endpoints_for_sqlmap
         elif "commix" in tool_lower:
-            return self.get_endpoints_for_commix()
-        else:
-            return []
+            return cls.get_endpoints_for_commix
+        return None
+
+    # Lowercase tool name -> query (read-only, shared by all graphs); other
+    # names go through _resolve_tool_query
+    _TOOL_DISPATCH: Mapping[str, Callable] = MappingProxyType({
+        "xsstrike": get_endpoints_for_xsstrike,
+        "dalfox": get_endpoints_for_xsstrike,
+        "xss": get_endpoints_for_xsstrike,
+        "sqlmap": get_endpoints_for_sqlmap,
+        "sqli": get_endpoints_for_sqlmap,
+        "commix": get_endpoints_for_commix,
+    })
 
     def should_run_tool(self, tool_name: str) -> bool:
         """
@@ -201,35 +281,57 @@ class EndpointParamGraph:
         Returns:
             bool: True if endpoints exist for this tool
         """
-        endpoints = self.get_endpoints_for_tool(tool_name)
-        return len(endpoints) > 0
+        tool_lower = tool_name.lower()
+        return self._cached(("should_run", tool_lower),
+                            lambda: len(self.get_endpoints_for_tool(tool_lower)) > 0)
 
     def get_summary(self) -> Dict:
-        """Get graph summary"""
-        endpoints_with_params = [url for url in self.endpoints.keys()
-                                 if self.endpoints[url].get("parameters")]
-        endpoints_with_reflection = self.get_endpoints_with_reflections()
-        endpoints_with_forms = self.get_endpoints_with_forms()
+        """Get graph summary (single pass, memoized until next mutation)"""
+        summary = dict(self._cached("summary", self._build_summary))
+        summary["tools_available"] = dict(summary["tools_available"])
+        return summary
+
+    def _build_summary(self) -> Dict:
+        """Fused traversal: every count and tool flag from one endpoint scan"""
+        endpoints_with_params = 0
+        endpoints_with_forms = 0
+        for ep_data in self.endpoints.values():
+            if ep_data["parameters"]:
+                endpoints_with_params += 1
+            if ep_data["forms"]:
+                endpoints_with_forms += 1
+
+        index = self._param_to_endpoints
+        xss_ready = bool(self._reflectable_endpoints) or endpoints_with_forms > 0
 
         return {
             "total_endpoints": len(self.endpoints),
-            "endpoints_with_parameters": len(endpoints_with_params),
-            "endpoints_with_reflections": len(endpoints_with_reflection),
-            "endpoints_with_forms": len(endpoints_with_forms),
+            "endpoints_with_parameters": endpoints_with_params,
+            "endpoints_with_reflections": len(self._reflectable_endpoints),
+            "endpoints_with_forms": endpoints_with_forms,
             "unique_parameters": len(self.param_sources),
             "reflectable_parameters": len(self.reflectable_params),
             "tools_available": {
-                "xsstrike": self.should_run_tool("xsstrike"),
-                "dalfox": self.should_run_tool("dalfox"),
-                "sqlmap": self.should_run_tool("sqlmap"),
-                "commix": self.should_run_tool("commix"),
+                "xsstrike": xss_ready,
+                "dalfox": xss_ready,
+                "sqlmap": endpoints_with_params > 0,
+                "commix": any(p in index for p in _COMMIX_PARAMS),
             }
         }
 
     def to_dict(self) -> Dict:
         """Export graph structure"""
         return {
-            "endpoints": self.endpoints,
+            "endpoints": {
+                url: {
+                    **ep,
+                    "parameters": {
+                        name: {**p, "sources": list(p["sources"])}
+                        for name, p in ep["parameters"].items()
+                    }
+                }
+                for url, ep in self.endpoints.items()
+            },
             "param_sources": {k: list(v) for k, v in self.param_sources.items()},
             "reflectable_params": list(self.reflectable_params),
             "summary": self.get_summary()
@@ -11,15 +11,28 @@ Features:
   6. Graceful degradation
 """
 
+import asyncio
 import logging
+import operator
 import signal
+import threading
 import json
 import pickle
-from typing import Dict, List, Optional, Any, Callable
+from typing import (
+    Dict, List, Optional, Any, AsyncIterator, BinaryIO, Callable, Iterable, Iterator, Set, Tuple
+)
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import time
+from array import array
+
+try:
+    import orjson  # Optional: faster checkpoint encoding
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +80,24 @@ class ScanCheckpoint:
     completed_endpoints: List[str] = field(default_factory=list)
     pending_endpoints: List[str] = field(default_factory=list)
     accumulated_results: List[Dict] = field(default_factory=list)
+    # Bytes of {scan_id}.results.ndjson committed by this checkpoint
+    results_offset: int = 0
+    # O(1) membership index over completed_endpoints (not serialized)
+    _completed_index: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _indexed_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def mark_endpoint_completed(self, endpoint: str) -> None:
+        """Record endpoint as done (no duplicates in completed_endpoints)"""
+        if not self.is_endpoint_completed(endpoint):
+            self.completed_endpoints.append(endpoint)
+
+    def is_endpoint_completed(self, endpoint: str) -> bool:
+        """O(1) resume skip check"""
+        # Catch up with entries appended directly to the list
+        if self._indexed_count != len(self.completed_endpoints):
+            self._completed_index.update(self.completed_endpoints[self._indexed_count:])
+            self._indexed_count = len(self.completed_endpoints)
+        return endpoint in self._completed_index
     
     def to_dict(self) -> Dict:
         return {
@@ -76,7 +107,8 @@ class ScanCheckpoint:
             "tool_checkpoints": [cp.to_dict() for cp in self.tool_checkpoints],
             "completed_endpoints": self.completed_endpoints,
             "pending_endpoints": self.pending_endpoints,
-            "accumulated_results": self.accumulated_results
+            "accumulated_results": self.accumulated_results,
+            "results_offset": self.results_offset
         }
 
 
@@ -84,28 +116,88 @@ class TimeoutHandler:
     """
     Enforce timeouts, no hanging
     
+    By default the timeout is advisory: code must call check(). With
+    interrupt=True, start() also arms a SIGALRM interval timer so the
+    running call is interrupted with TimeoutException even if it never
+    calls check(). Signal delivery only works on the main thread; on other
+    threads (or platforms without setitimer) it falls back to polling.
+    An ITIMER_REAL timer already armed (an enclosing handler, or any other
+    user) is kept: if it is due first its handler still runs on time, and
+    cancel() restores it with whatever time it has left.
+    
     Usage:
-        handler = TimeoutHandler(timeout_seconds=120)
+        handler = TimeoutHandler(timeout_seconds=120, interrupt=True)
         
         try:
             handler.start()
             result = risky_function()
-            handler.cancel()
         except TimeoutException:
             logger.error("Function timed out")
+        finally:
+            handler.cancel()
     """
 
-    def __init__(self, timeout_seconds: float):
+    def __init__(self, timeout_seconds: float, interrupt: bool = False):
         self.timeout_seconds = timeout_seconds
+        self.interrupt = interrupt
         self.start_time: Optional[float] = None
+        self._previous_handler: Any = None
+        self._armed = False
+        # Interrupt mode: our deadline, and the itimer we displaced (monotonic clock)
+        self._deadline = 0.0
+        self._previous_deadline: Optional[float] = None
+        self._previous_interval = 0.0
 
     def start(self) -> None:
         """Start timeout clock"""
         self.start_time = time.time()
+        if self.interrupt and self.timeout_seconds > 0 and self._can_signal():
+            now = time.monotonic()
+            self._deadline = now + self.timeout_seconds
+            self._previous_handler = signal.signal(signal.SIGALRM, self._on_alarm)
+            previous_delay, self._previous_interval = signal.getitimer(signal.ITIMER_REAL)
+            self._previous_deadline = now + previous_delay if previous_delay else None
+            # A displaced timer due sooner keeps its slot; _on_alarm hands it over
+            delay = min(self.timeout_seconds, previous_delay) if previous_delay else self.timeout_seconds
+            signal.setitimer(signal.ITIMER_REAL, delay)
+            self._armed = True
 
     def cancel(self) -> None:
         """Cancel timeout"""
         self.start_time = None
+        if self._armed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler or signal.SIG_DFL)
+            if self._previous_deadline is not None:
+                # Give the displaced timer back what it has left (fires at once if overdue)
+                remaining = max(self._previous_deadline - time.monotonic(), 1e-6)
+                signal.setitimer(signal.ITIMER_REAL, remaining, self._previous_interval)
+            self._previous_handler = None
+            self._previous_deadline = None
+            self._armed = False
+
+    @staticmethod
+    def _can_signal() -> bool:
+        """SIGALRM timers need platform support and the main thread"""
+        return (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
+
+    def _on_alarm(self, signum, frame) -> None:
+        """SIGALRM handler: abort the interrupted call"""
+        now = time.monotonic()
+        if self._previous_deadline is not None and now < self._deadline - 0.01:
+            # The displaced timer came due first: re-arm ours, then run its handler
+            self._previous_deadline = now + self._previous_interval if self._previous_interval else None
+            signal.setitimer(signal.ITIMER_REAL, self._deadline - now)
+            if callable(self._previous_handler):
+                self._previous_handler(signum, frame)
+            return
+
+        msg = f"Timeout exceeded ({self.timeout_seconds}s)"
+        logger.error(f"[TimeoutHandler] {msg}")
+        raise TimeoutException(msg)
 
     def check(self, context: str = "") -> None:
         """Check if timeout exceeded"""
@@ -134,10 +226,42 @@ class TimeoutException(Exception):
     pass
 
 
+# execute_tool_safe: marks "tool has not returned yet" (None is a valid result)
+_NO_RESULT = object()
+
+
+def _pool_processes(executor: ProcessPoolExecutor) -> List[Any]:
+    """
+    Worker processes of a ProcessPoolExecutor.
+    
+    The executor exposes no public handle on its workers, so this reads the
+    CPython-private _processes map. If that attribute is missing (other
+    interpreter or version), nothing is killed: shutdown(cancel_futures=True)
+    still drops queued work, but a running worker lingers until its task ends.
+    """
+    processes = getattr(executor, "_processes", None)
+    if processes is None:
+        logger.warning("[CrashIsolator] Cannot reach pool workers; timed-out task keeps running")
+        return []
+    return list(processes.values())
+
+
 class ToolCrashIsolator:
     """
     Isolate tool crashes, continue scanning
     
+    With max_workers=0 (default) tools run in-process and only Python
+    exceptions are contained; the timeout is advisory unless
+    interrupt_timeouts=True arms a SIGALRM timer around each call (main
+    thread only, see TimeoutHandler). With max_workers > 0 tools run in an owned
+    ProcessPoolExecutor: segfaults, OOM kills and runaway native code stay
+    in the worker, and on timeout the pool's workers are killed and the
+    pool is rebuilt. Sibling calls that lose their worker that way (or to
+    another call's crash) are rerun alone in a private worker, so only the
+    call that actually fails is reported. In process mode tool_function and
+    args must be picklable - pass a module-level function plus args, not a
+    lambda/closure.
+    
     Usage:
         isolator = ToolCrashIsolator()
         
@@ -147,10 +271,26 @@ class ToolCrashIsolator:
             timeout_seconds=120,
             fallback_value=[]
         )
+        
+        isolator = ToolCrashIsolator(max_workers=4)
+        results = isolator.execute_tool_safe(
+            tool_name="sqlmap",
+            tool_function=run_sqlmap,
+            args=(endpoint, params),
+            timeout_seconds=120
+        )
+        isolator.shutdown()
     """
 
-    def __init__(self):
-        self.crash_log: Dict[str, List[str]] = {}
+    def __init__(self, max_workers: int = 0, interrupt_timeouts: bool = False):
+        # tool -> [(epoch seconds, message)]; formatted only in get_crash_report
+        self.crash_log: Dict[str, List[Tuple[float, str]]] = {}
+        self.max_workers = max_workers
+        self.interrupt_timeouts = interrupt_timeouts
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Guards creating, submitting to and replacing the pool: execute_batch
+        # reaches it from several threads at once
+        self._executor_lock = threading.Lock()
 
     def execute_tool_safe(
         self,
@@ -158,7 +298,8 @@ class ToolCrashIsolator:
         tool_function: Callable,
         timeout_seconds: float = 120,
         fallback_value: Any = None,
-        context: str = ""
+        context: str = "",
+        args: Tuple = ()
     ) -> Any:
         """
         Execute tool with crash isolation
@@ -166,13 +307,19 @@ class ToolCrashIsolator:
         Returns:
             Tool result, or fallback_value if crash/timeout
         """
-        timeout_handler = TimeoutHandler(timeout_seconds)
+        if self.max_workers > 0:
+            return self._execute_in_process_pool(
+                tool_name, tool_function, timeout_seconds, fallback_value, context, args
+            )
+
+        timeout_handler = TimeoutHandler(timeout_seconds, interrupt=self.interrupt_timeouts)
+        result = _NO_RESULT
 
         try:
             timeout_handler.start()
             logger.info(f"[CrashIsolator] Starting {tool_name} {context}")
 
-            result = tool_function()
+            result = tool_function(*args)
 
             timeout_handler.cancel()
             logger.info(f"[CrashIsolator] {tool_name} completed successfully")
@@ -180,6 +327,9 @@ class ToolCrashIsolator:
             return result
 
         except TimeoutException as e:
+            if result is not _NO_RESULT:
+                # Alarm landed after the tool returned, before cancel(): keep the result
+                return result
             error_msg = f"Timeout: {str(e)}"
             logger.warning(f"[CrashIsolator] {tool_name} {error_msg}")
             self._log_crash(tool_name, error_msg)
@@ -191,13 +341,207 @@ class ToolCrashIsolator:
             self._log_crash(tool_name, error_msg)
             return fallback_value or []
 
+        finally:
+            timeout_handler.cancel()
+
+    def _execute_in_process_pool(
+        self,
+        tool_name: str,
+        tool_function: Callable,
+        timeout_seconds: float,
+        fallback_value: Any,
+        context: str,
+        args: Tuple
+    ) -> Any:
+        """Run tool in a worker process; hard-kill the pool on timeout"""
+        if not self._picklable(tool_name, tool_function, args):
+            return fallback_value or []
+
+        logger.info(f"[CrashIsolator] Starting {tool_name} {context} (process)")
+        executor, future = self._submit(tool_function, args)
+        private = False
+
+        try:
+            try:
+                result = future.result(timeout=timeout_seconds)
+            except BrokenProcessPool:
+                self._log_rerun(tool_name, executor)
+                executor, future = self._submit_private(tool_function, args)
+                private = True
+                result = future.result(timeout=timeout_seconds)
+            logger.info(f"[CrashIsolator] {tool_name} completed successfully")
+            return result
+
+        except FuturesTimeoutError:
+            error_msg = f"Timeout: Timeout exceeded ({timeout_seconds}s), worker killed"
+            logger.warning(f"[CrashIsolator] {tool_name} {error_msg}")
+            self._log_crash(tool_name, error_msg)
+            self._kill_executor(executor)
+            return fallback_value or []
+
+        except BrokenProcessPool as e:
+            error_msg = f"Crash: worker process died ({str(e)})"
+            logger.error(f"[CrashIsolator] {tool_name} {error_msg}")
+            self._log_crash(tool_name, error_msg)
+            self._kill_executor(executor)
+            return fallback_value or []
+
+        except Exception as e:
+            error_msg = f"Crash: {str(e)}"
+            logger.error(f"[CrashIsolator] {tool_name} {error_msg}")
+            self._log_crash(tool_name, error_msg)
+            return fallback_value or []
+
+        finally:
+            if private:
+                executor.shutdown(wait=False)
+
+    async def execute_tool_async(
+        self,
+        tool_name: str,
+        tool_function: Callable,
+        timeout_seconds: float = 120,
+        fallback_value: Any = None,
+        context: str = "",
+        args: Tuple = ()
+    ) -> Any:
+        """
+        Awaitable execute_tool_safe for use on an event loop
+        
+        Always runs in the process pool (requires max_workers > 0), so a
+        timeout kills the worker rather than abandoning a thread.
+        
+        Returns:
+            Tool result, or fallback_value if crash/timeout
+        """
+        completed, result = await self._run_async(tool_name, tool_function, timeout_seconds, context, args)
+        return result if completed else fallback_value or []
+
+    async def _run_async(
+        self,
+        tool_name: str,
+        tool_function: Callable,
+        timeout_seconds: float,
+        context: str,
+        args: Tuple
+    ) -> Tuple[bool, Any]:
+        """execute_tool_async core: (True, result), or (False, None) if the call timed out/crashed"""
+        if self.max_workers <= 0:
+            raise ValueError("execute_tool_async requires a process pool (max_workers > 0)")
+        if not self._picklable(tool_name, tool_function, args):
+            return False, None
+
+        logger.info(f"[CrashIsolator] Starting {tool_name} {context} (process)")
+        executor, future = self._submit(tool_function, args)
+        private = False
+
+        try:
+            try:
+                result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout_seconds)
+            except BrokenProcessPool:
+                self._log_rerun(tool_name, executor)
+                executor, future = self._submit_private(tool_function, args)
+                private = True
+                result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout_seconds)
+            logger.info(f"[CrashIsolator] {tool_name} completed successfully")
+            return True, result
+
+        except asyncio.TimeoutError:
+            error_msg = f"Timeout: Timeout exceeded ({timeout_seconds}s), worker killed"
+            logger.warning(f"[CrashIsolator] {tool_name} {error_msg}")
+            self._log_crash(tool_name, error_msg)
+            self._kill_executor(executor)
+            return False, None
+
+        except BrokenProcessPool as e:
+            error_msg = f"Crash: worker process died ({str(e)})"
+            logger.error(f"[CrashIsolator] {tool_name} {error_msg}")
+            self._log_crash(tool_name, error_msg)
+            self._kill_executor(executor)
+            return False, None
+
+        except Exception as e:
+            error_msg = f"Crash: {str(e)}"
+            logger.error(f"[CrashIsolator] {tool_name} {error_msg}")
+            self._log_crash(tool_name, error_msg)
+            return False, None
+
+        finally:
+            if private:
+                executor.shutdown(wait=False)
+
+    def _picklable(self, tool_name: str, tool_function: Callable, args: Tuple) -> bool:
+        """Check the call can be shipped to a worker; logs a crash if not"""
+        try:
+            pickle.dumps((tool_function, args))
+            return True
+        except Exception as e:
+            error_msg = f"Crash: tool function not picklable for process isolation ({e})"
+            logger.error(f"[CrashIsolator] {tool_name} {error_msg}")
+            self._log_crash(tool_name, error_msg)
+            return False
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Lazily create the worker pool (caller holds _executor_lock)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _submit(self, tool_function: Callable, args: Tuple) -> Tuple[ProcessPoolExecutor, Future]:
+        """Submit to the current pool; returns the pool too, so a timeout kills only that one"""
+        with self._executor_lock:
+            executor = self._get_executor()
+            try:
+                return executor, executor.submit(tool_function, *args)
+            except BrokenProcessPool:
+                # A worker died since the last call and nobody retired the pool yet
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = self._get_executor()
+                return executor, executor.submit(tool_function, *args)
+
+    @staticmethod
+    def _submit_private(tool_function: Callable, args: Tuple) -> Tuple[ProcessPoolExecutor, Future]:
+        """Run one call in its own single-worker pool, shared with nobody"""
+        executor = ProcessPoolExecutor(max_workers=1)
+        return executor, executor.submit(tool_function, *args)
+
+    def _log_rerun(self, tool_name: str, executor: ProcessPoolExecutor) -> None:
+        """A call lost its worker to another call's timeout or crash: retire the pool"""
+        logger.warning(f"[CrashIsolator] {tool_name} lost its worker to another call, rerunning alone")
+        self._kill_executor(executor)
+
+    def _kill_executor(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Kill the workers of executor; if it is the shared pool, a fresh one
+        is created on next submit. Killing an already-retired pool is harmless.
+        """
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+
+        # ProcessPoolExecutor has no per-task cancel for running work. Queued
+        # calls are not cancelled: they fail with BrokenProcessPool and rerun alone
+        for process in _pool_processes(executor):
+            process.kill()
+        executor.shutdown(wait=False)
+
+    def shutdown(self, kill: bool = False) -> None:
+        """Release worker processes (kill=True: terminate running work instead of waiting)"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        if kill:
+            for process in _pool_processes(executor):
+                process.kill()
+        executor.shutdown(wait=not kill, cancel_futures=True)
+
     def _log_crash(self, tool_name: str, error_msg: str) -> None:
         """Log crash for analysis"""
         if tool_name not in self.crash_log:
             self.crash_log[tool_name] = []
-        self.crash_log[tool_name].append(
-            f"{datetime.now().isoformat()}: {error_msg}"
-        )
+        self.crash_log[tool_name].append((time.time(), error_msg))
 
     def get_crash_report(self) -> Dict:
         """Get crash summary"""
@@ -206,7 +550,13 @@ class ToolCrashIsolator:
             "crashes_by_tool": {
                 tool: len(crashes) for tool, crashes in self.crash_log.items()
             },
-            "details": self.crash_log
+            "details": {
+                tool: [
+                    f"{datetime.fromtimestamp(ts).isoformat()}: {msg}"
+                    for ts, msg in crashes
+                ]
+                for tool, crashes in self.crash_log.items()
+            }
         }
 
 
@@ -244,42 +594,59 @@ class PartialFailureHandler:
         self.skip_failed_tools = skip_failed_tools
         self.max_failures_per_endpoint = max_failures_per_endpoint
 
-        self.endpoint_stats: Dict[str, Dict] = {}
+        # Struct-of-arrays stats: endpoint URL -> row id into parallel counters
+        self._url_to_id: Dict[str, int] = {}
+        self._successes = array('I')
+        self._failures = array('I')
+        self._skipped = array('I')
+        self._tools_count = array('I')
+
+    @property
+    def endpoint_stats(self) -> Dict[str, Dict]:
+        """Per-endpoint stats as dicts (built on demand for reporting)"""
+        return {
+            endpoint: {
+                "successes": self._successes[i],
+                "failures": self._failures[i],
+                "skipped": self._skipped[i],
+                "tools_count": self._tools_count[i]
+            }
+            for endpoint, i in self._url_to_id.items()
+        }
 
     def add_endpoint_attempt(self, endpoint: str, tools_count: int = 1) -> None:
         """Record endpoint for tracking"""
-        if endpoint not in self.endpoint_stats:
-            self.endpoint_stats[endpoint] = {
-                "successes": 0,
-                "failures": 0,
-                "skipped": 0,
-                "tools_count": tools_count
-            }
+        self._endpoint_id(endpoint, tools_count)
+
+    def _endpoint_id(self, endpoint: str, tools_count: int = 1) -> int:
+        """Row id for endpoint, allocating a zeroed row on first sight"""
+        endpoint_id = self._url_to_id.get(endpoint)
+        if endpoint_id is None:
+            endpoint_id = self._url_to_id[endpoint] = len(self._successes)
+            self._successes.append(0)
+            self._failures.append(0)
+            self._skipped.append(0)
+            self._tools_count.append(tools_count)
+        return endpoint_id
 
     def record_success(self, endpoint: str, tool: str) -> None:
         """Record successful tool execution"""
-        if endpoint not in self.endpoint_stats:
-            self.add_endpoint_attempt(endpoint)
-
-        self.endpoint_stats[endpoint]["successes"] += 1
+        self._successes[self._endpoint_id(endpoint)] += 1
         logger.debug(f"[PartialFailure] Success on {endpoint}/{tool}")
 
     def record_failure(self, endpoint: str, tool: str) -> None:
         """Record tool failure"""
-        if endpoint not in self.endpoint_stats:
-            self.add_endpoint_attempt(endpoint)
-
-        self.endpoint_stats[endpoint]["failures"] += 1
+        self._failures[self._endpoint_id(endpoint)] += 1
         logger.warning(f"[PartialFailure] Failure on {endpoint}/{tool}")
 
     def should_skip_endpoint(self, endpoint: str) -> bool:
         """Decide whether to skip endpoint"""
-        if endpoint not in self.endpoint_stats:
+        endpoint_id = self._url_to_id.get(endpoint)
+        if endpoint_id is None:
             return False
 
-        stats = self.endpoint_stats[endpoint]
-        tools_count = stats.get("tools_count", 1)
-        failures = stats["failures"]
+        tools_count = self._tools_count[endpoint_id]
+        failures = self._failures[endpoint_id]
 
         # Skip if too many failures
         if failures >= self.max_failures_per_endpoint:
@@ -299,11 +666,9 @@ class PartialFailureHandler:
 
     def get_health_report(self) -> Dict:
         """Get overall scanning health"""
-        total_endpoints = len(self.endpoint_stats)
-        successful_endpoints = sum(
-            1 for stats in self.endpoint_stats.values()
-            if stats["successes"] > stats["failures"]
-        )
+        total_endpoints = len(self._url_to_id)
+        # Element-wise compare + reduce stays in C (bools sum as ints)
+        successful_endpoints = sum(map(operator.gt, self._successes, self._failures))
 
         return {
             "total_endpoints": total_endpoints,
@@ -321,6 +686,23 @@ class CheckpointManager:
     """
     Save and resume scans
     
+    Two on-disk forms per scan:
+      {scan_id}.json  - full snapshot (save_checkpoint / compaction)
+      {scan_id}.pkl   - binary snapshot (save_checkpoint_fast), pickle protocol 5;
+                        only used when checkpoint_dir is private (owner-only 0700)
+      {scan_id}.jsonl - append-only delta log (append_events), one event per line:
+                        {"t": "log", "id": ...} (header; the snapshot records the
+                            log id and byte size it already holds)
+                        {"t": "start", "scan_id": ..., "scan_start_time": ...}
+                        {"t": "endpoint_done", "url": ...}
+                        {"t": "result", "data": {...}}
+                        {"t": "pending", "urls": [...]}
+                        {"t": "progress", "progress": {tool: count}}
+                        {"t": "results_offset", "offset": n}
+      {scan_id}.results.ndjson - streamed results (ResilienceEngine.record_result);
+                        only the first results_offset bytes are committed
+    load_checkpoint reads the snapshot (if any) and replays the log on top.
+    
     Usage:
         manager = CheckpointManager(checkpoint_dir="/tmp/checkpoints")
         
@@ -331,6 +713,7 @@ class CheckpointManager:
             completed_endpoints=["/api/users", "/api/posts"]
         )
         manager.save_checkpoint("scan_123", checkpoint)
+        manager.append_events("scan_123", [{"t": "endpoint_done", "url": "/api/comments"}])
         
         # Resume scan
         checkpoint = manager.load_checkpoint("scan_123")
@@ -339,33 +722,198 @@ class CheckpointManager:
             results = checkpoint.accumulated_results
     """
 
-    def __init__(self, checkpoint_dir: str = "/tmp/scanner_checkpoints"):
+    def __init__(self, checkpoint_dir: str = "/tmp/scanner_checkpoints", pretty: bool = False):
         self.checkpoint_dir = checkpoint_dir
+        self.pretty = pretty  # Indent JSON for debugging (slower, larger)
+        self._results_streams: Dict[str, BinaryIO] = {}  # Open by open_results, closed on cleanup
         import os
-        os.makedirs(checkpoint_dir, exist_ok=True)
+        os.makedirs(checkpoint_dir, mode=0o700, exist_ok=True)
 
-    def save_checkpoint(self, scan_id: str, checkpoint: ScanCheckpoint) -> None:
-        """Save checkpoint to disk"""
+    def _snapshot_path(self, scan_id: str) -> str:
+        import os
+        return os.path.join(self.checkpoint_dir, f"{scan_id}.json")
+
+    def _log_path(self, scan_id: str) -> str:
+        import os
+        return os.path.join(self.checkpoint_dir, f"{scan_id}.jsonl")
+
+    def _results_path(self, scan_id: str) -> str:
         import os
-        filepath = os.path.join(self.checkpoint_dir, f"{scan_id}.json")
+        return os.path.join(self.checkpoint_dir, f"{scan_id}.results.ndjson")
 
-        with open(filepath, 'w') as f:
-            json.dump(checkpoint.to_dict(), f, indent=2)
+    def _pickle_path(self, scan_id: str) -> str:
+        import os
+        return os.path.join(self.checkpoint_dir, f"{scan_id}.pkl")
+
+    def save_checkpoint(self, scan_id: str, checkpoint: ScanCheckpoint) -> None:
+        """Save full snapshot to disk (compacts away any delta log)"""
+        import os
+        filepath = self._snapshot_path(scan_id)
+
+        data = checkpoint.to_dict()
+        log_path = self._log_path(scan_id)
+        log_id = self._log_id(log_path)
+        if log_id is not None:
+            # Everything in the log so far is in this snapshot: if we crash
+            # before removing the log, replay resumes after these bytes
+            data["log_id"] = log_id
+            data["log_offset"] = os.path.getsize(log_path)
+
+        # Encode first and swap in atomically: a failed save keeps the old snapshot
+        payload = self._encode(data, self.pretty)
+        tmp_path = filepath + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
+
+        if os.path.exists(log_path):
+            os.remove(log_path)
 
         logger.info(f"[Checkpoint] Saved checkpoint for {scan_id}")
 
-    def load_checkpoint(self, scan_id: str) -> Optional[ScanCheckpoint]:
-        """Load checkpoint from disk"""
+    def _is_private(self, path: str, is_dir: bool = False) -> bool:
+        """
+        True if path is owned by this user and nobody else can write it
+        (directories: no group/other access at all). Unpickling a file
+        someone else could plant would run their code.
+        """
         import os
-        filepath = os.path.join(self.checkpoint_dir, f"{scan_id}.json")
+        import stat
+        getuid = getattr(os, "getuid", None)
+        if getuid is None:
+            return False  # Ownership cannot be verified on this platform
+
+        st = os.lstat(path)
+        if st.st_uid != getuid():
+            return False
+        if is_dir:
+            return stat.S_ISDIR(st.st_mode) and not st.st_mode & 0o077
+        return stat.S_ISREG(st.st_mode) and not st.st_mode & 0o022
+
+    def save_checkpoint_fast(self, scan_id: str, checkpoint: ScanCheckpoint) -> None:
+        """
+        Save binary snapshot (pickle protocol 5, no to_dict round trip)
+        
+        Raises:
+            PermissionError: checkpoint_dir is not private; use save_checkpoint
+        """
+        import os
+        if not self._is_private(self.checkpoint_dir, is_dir=True):
+            raise PermissionError(
+                f"Binary checkpoints need a private checkpoint_dir (owner-only 0700): {self.checkpoint_dir}"
+            )
+
+        payload = pickle.dumps(checkpoint, protocol=5)
+        filepath = self._pickle_path(scan_id)
+        tmp_path = filepath + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
+
+        logger.info(f"[Checkpoint] Saved binary checkpoint for {scan_id}")
+
+    def load_checkpoint_fast(self, scan_id: str) -> Optional[ScanCheckpoint]:
+        """Load binary snapshot; refused unless checkpoint_dir and the file are private"""
+        import os
+        filepath = self._pickle_path(scan_id)
+
+        if not os.path.exists(filepath):
+            logger.debug(f"[Checkpoint] No binary checkpoint found for {scan_id}")
+            return None
+
+        if not (self._is_private(self.checkpoint_dir, is_dir=True) and self._is_private(filepath)):
+            logger.error(f"[Checkpoint] Refusing binary checkpoint for {scan_id}: "
+                         f"{self.checkpoint_dir} is not private to this user")
+            return None
+
+        try:
+            with open(filepath, 'rb') as f:
+                checkpoint = pickle.load(f)
+
+            logger.info(f"[Checkpoint] Loaded binary checkpoint for {scan_id}")
+            return checkpoint
+
+        except Exception as e:
+            logger.error(f"[Checkpoint] Failed to load binary checkpoint: {str(e)}")
+            return None
+
+    def append_events(self, scan_id: str, events: List[Dict]) -> None:
+        """Append delta events to the scan's log (cost is O(delta), not O(scan))"""
+        if not events:
+            return
+
+        import os
+        with open(self._log_path(scan_id), 'ab') as f:
+            if f.tell() == 0:
+                # New log: tag it so a snapshot can record how much of it it holds
+                events = [{"t": "log", "id": os.urandom(8).hex()}, *events]
+            f.write(b"".join(self._encode(event) + b"\n" for event in events))
+
+        logger.debug(f"[Checkpoint] Appended {len(events)} events for {scan_id}")
+
+    def open_results(self, scan_id: str, committed: int = 0) -> BinaryIO:
+        """
+        Open the scan's results stream for appending after its committed
+        prefix (ScanCheckpoint.results_offset)
+        
+        Bytes past it are dropped: results written after the last checkpoint
+        (their work is redone on resume) or a torn final line.
+        """
+        stream = open(self._results_path(scan_id), 'ab')
+        stream.truncate(min(committed, stream.tell()))
+        self._results_streams[scan_id] = stream
+        return stream
 
+    def write_result(self, stream: BinaryIO, result: Dict) -> None:
+        """Append one result as an NDJSON line"""
+        stream.write(self._encode(result) + b"\n")
+
+    def iter_results(self, scan_id: str, upto: Optional[int] = None) -> Iterator[Dict]:
+        """Lazily read streamed results, optionally only the committed prefix"""
+        import os
+        filepath = self._results_path(scan_id)
         if not os.path.exists(filepath):
+            return
+
+        position = 0
+        with open(filepath, 'rb') as f:
+            for line in f:
+                position += len(line)
+                if upto is not None and position > upto:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    result = self._decode(line)
+                except ValueError:
+                    # Torn final write from an interrupted scan
+                    logger.warning("[Checkpoint] Ignoring truncated result entry")
+                    break
+                yield result
+
+    def load_checkpoint(self, scan_id: str) -> Optional[ScanCheckpoint]:
+        """Load checkpoint from disk (snapshot + delta log replay)"""
+        import os
+        filepath = self._snapshot_path(scan_id)
+        log_path = self._log_path(scan_id)
+
+        if not os.path.exists(filepath) and not os.path.exists(log_path):
             logger.debug(f"[Checkpoint] No checkpoint found for {scan_id}")
             return None
 
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data: Optional[Dict] = None
+            if os.path.exists(filepath):
+                with open(filepath, 'rb') as f:
+                    data = self._decode(f.read())
+
+            if os.path.exists(log_path):
+                data = self._replay_log(log_path, data)
+
+            if data is None:
+                logger.error(f"[Checkpoint] Checkpoint log for {scan_id} has no start event")
+                return None
 
             checkpoint = ScanCheckpoint(
                 scan_id=data["scan_id"],
@@ -373,7 +921,8 @@ class CheckpointManager:
                 progress=data.get("progress", {}),
                 completed_endpoints=data.get("completed_endpoints", []),
                 pending_endpoints=data.get("pending_endpoints", []),
-                accumulated_results=data.get("accumulated_results", [])
+                accumulated_results=data.get("accumulated_results", []),
+                results_offset=data.get("results_offset", 0)
             )
 
             logger.info(f"[Checkpoint] Loaded checkpoint for {scan_id}")
@@ -383,13 +932,95 @@ class CheckpointManager:
             logger.error(f"[Checkpoint] Failed to load checkpoint: {str(e)}")
             return None
 
+    def _log_id(self, log_path: str) -> Optional[str]:
+        """Id from the log's header event, None if there is no (tagged) log"""
+        try:
+            with open(log_path, 'rb') as f:
+                event = self._decode(f.readline())
+        except (OSError, ValueError):
+            return None
+        return event.get("id") if event.get("t") == "log" else None
+
+    def _replay_log(self, log_path: str, data: Optional[Dict]) -> Optional[Dict]:
+        """Apply delta events on top of a snapshot dict"""
+        skip_to = 0
+        position = 0
+        with open(log_path, 'rb') as f:
+            for line in f:
+                line_start = position
+                position += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    event = self._decode(line)
+                except ValueError:
+                    # Torn final write from an interrupted scan
+                    logger.warning("[Checkpoint] Ignoring truncated checkpoint log entry")
+                    break
+
+                kind = event.get("t")
+                if kind == "log":
+                    # Log left behind by a crash during compaction: the
+                    # snapshot already holds its first log_offset bytes
+                    if data is not None and data.get("log_id") == event["id"]:
+                        skip_to = data.get("log_offset", 0)
+                    continue
+                if line_start < skip_to:
+                    continue
+                if kind == "start":
+                    if data is None:
+                        data = {
+                            "scan_id": event["scan_id"],
+                            "scan_start_time": event["scan_start_time"],
+                        }
+                    continue
+                if data is None:
+                    continue
+
+                if kind == "endpoint_done":
+                    data.setdefault("completed_endpoints", []).append(event["url"])
+                elif kind == "result":
+                    data.setdefault("accumulated_results", []).append(event["data"])
+                elif kind == "pending":
+                    data["pending_endpoints"] = event["urls"]
+                elif kind == "progress":
+                    data.setdefault("progress", {}).update(event["progress"])
+                elif kind == "results_offset":
+                    data["results_offset"] = event["offset"]
+
+        return data
+
+    def _encode(self, data: Dict, pretty: bool = False) -> bytes:
+        """Serialize checkpoint (orjson if installed, else stdlib json)"""
+        if orjson is not None:
+            # Stringify int keys (e.g. port maps) the way json.dumps does
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            return orjson.dumps(data, option=option)
+        indent = 2 if pretty else None
+        separators = None if pretty else (",", ":")
+        return json.dumps(data, indent=indent, separators=separators).encode("utf-8")
+
+    def _decode(self, raw: bytes) -> Dict:
+        """Deserialize checkpoint written by _encode"""
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
     def cleanup_checkpoint(self, scan_id: str) -> None:
         """Delete checkpoint (scan complete)"""
         import os
-        filepath = os.path.join(self.checkpoint_dir, f"{scan_id}.json")
-
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        stream = self._results_streams.pop(scan_id, None)
+        if stream is not None:
+            stream.close()  # Before unlinking: no writes into a deleted file
+
+        removed = False
+        for filepath in (self._snapshot_path(scan_id), self._log_path(scan_id),
+                         self._pickle_path(scan_id), self._results_path(scan_id)):
+            if os.path.exists(filepath):
+                os.remove(filepath)
+                removed = True
+
+        if removed:
             logger.info(f"[Checkpoint] Cleaned up checkpoint for {scan_id}")
 
 
@@ -419,7 +1050,12 @@ class ResilienceEngine:
                 
                 engine.checkpoint()
         finally:
+            engine.compact_checkpoint()
             report = engine.get_resilience_report()
+        
+        # Or schedule all endpoints concurrently, consuming as they finish
+        async for endpoint, results in engine.execute_batch("sqlmap", endpoints, run_sqlmap):
+            engine.checkpoint()
     """
 
     def __init__(
@@ -427,11 +1063,15 @@ class ResilienceEngine:
         scan_id: str = "scan_default",
         timeout_seconds: float = 3600,
         fail_threshold: float = 0.5,
-        checkpoint_enabled: bool = True
+        checkpoint_enabled: bool = True,
+        process_workers: int = 0,
+        interrupt_timeouts: bool = False
     ):
         self.scan_id = scan_id
         self.timeout_handler = TimeoutHandler(timeout_seconds)
-        self.crash_isolator = ToolCrashIsolator()
+        self.crash_isolator = ToolCrashIsolator(
+            max_workers=process_workers, interrupt_timeouts=interrupt_timeouts
+        )
         self.partial_failure_handler = PartialFailureHandler(
             fail_threshold=fail_threshold
         )
@@ -441,6 +1081,14 @@ class ResilienceEngine:
             scan_id=scan_id,
             scan_start_time=datetime.now().isoformat()
         )
+        # How much of scan_checkpoint is already in the delta log
+        self._logged_start = False
+        self._logged_completed = 0
+        self._logged_results = 0
+        self._logged_pending: List[str] = []
+        self._logged_progress: Dict[str, int] = {}
+        self._logged_results_offset = 0
+        self._results_stream: Optional[BinaryIO] = None
 
     def execute_tool_safe(
         self,
@@ -448,7 +1096,8 @@ class ResilienceEngine:
         endpoint: str,
         tool_function: Callable,
         timeout_override: Optional[float] = None,
-        context: str = ""
+        context: str = "",
+        args: Tuple = ()
     ) -> Any:
         """Execute tool with full resilience"""
         # Check global timeout
@@ -465,7 +1114,8 @@ class ResilienceEngine:
             tool_function=tool_function,
             timeout_seconds=tool_timeout,
             fallback_value=[],
-            context=f"on {endpoint}"
+            context=f"on {endpoint}",
+            args=args
         )
 
         # Track execution
@@ -476,6 +1126,63 @@ class ResilienceEngine:
 
         return result
 
+    async def execute_batch(
+        self,
+        tool_name: str,
+        endpoints: Iterable[str],
+        tool_fn: Callable[[str], Any],
+        concurrency: int = 8,
+        timeout_override: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Run tool_fn(endpoint) for all endpoints concurrently
+        
+        Yields (endpoint, result) in completion order so callers can
+        checkpoint incrementally; a call that timed out or crashed yields
+        []. Calls run in worker processes so a timeout kills the tool
+        instead of leaving it running; tool_fn must therefore be picklable
+        (a module-level function). Without process_workers, a pool of
+        `concurrency` workers is created for the batch and released when it
+        ends. Only calls that themselves time out or crash count as
+        failures: siblings whose worker dies with them are rerun, and an
+        empty result is a clean run with no findings.
+        """
+        self.timeout_handler.check("batch execution")
+        tool_timeout = timeout_override or min(
+            120, self.timeout_handler.get_remaining()
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        isolator = self.crash_isolator
+        batch_isolator = None
+        if isolator.max_workers <= 0:
+            batch_isolator = ToolCrashIsolator(max_workers=concurrency)
+            batch_isolator.crash_log = isolator.crash_log  # One crash report per engine
+            isolator = batch_isolator
+
+        async def run_one(endpoint: str) -> Tuple[str, Any]:
+            async with semaphore:
+                completed, result = await isolator._run_async(
+                    tool_name, tool_fn, tool_timeout, f"on {endpoint}", (endpoint,)
+                )
+
+            # Tracking happens on the event loop thread, not in workers
+            if completed:
+                self.partial_failure_handler.record_success(endpoint, tool_name)
+                return endpoint, result
+            self.partial_failure_handler.record_failure(endpoint, tool_name)
+            return endpoint, []
+
+        tasks = [asyncio.ensure_future(run_one(endpoint)) for endpoint in endpoints]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            if batch_isolator is not None:
+                batch_isolator.shutdown(kill=True)
+
     def record_success(self, endpoint: str, tool: str) -> None:
         """Record tool success"""
         self.partial_failure_handler.record_success(endpoint, tool)
@@ -488,12 +1195,102 @@ class ResilienceEngine:
         """Check if should skip endpoint"""
         return self.partial_failure_handler.should_skip_endpoint(endpoint)
 
+    def mark_endpoint_completed(self, endpoint: str) -> None:
+        """Record endpoint as fully scanned (persisted on next checkpoint)"""
+        self.scan_checkpoint.mark_endpoint_completed(endpoint)
+
+    def is_endpoint_completed(self, endpoint: str) -> bool:
+        """Check if endpoint was already scanned (resume skip)"""
+        return self.scan_checkpoint.is_endpoint_completed(endpoint)
+
+    def record_result(self, result: Dict) -> None:
+        """Stream a result to disk instead of holding it in memory"""
+        if not self.checkpoint_manager:
+            self.scan_checkpoint.accumulated_results.append(result)
+            return
+        if self._results_stream is None or self._results_stream.closed:
+            self._results_stream = self.checkpoint_manager.open_results(
+                self.scan_id, self.scan_checkpoint.results_offset
+            )
+        self.checkpoint_manager.write_result(self._results_stream, result)
+
+    def iter_results(self) -> Iterator[Dict]:
+        """All results: in-memory ones, then the committed part of the streamed file"""
+        yield from self.scan_checkpoint.accumulated_results
+        if self.checkpoint_manager:
+            self._commit_results()
+            yield from self.checkpoint_manager.iter_results(
+                self.scan_id, upto=self.scan_checkpoint.results_offset
+            )
+
+    def _commit_results(self) -> None:
+        """Flush streamed results and record the committed offset"""
+        if self._results_stream is not None and not self._results_stream.closed:
+            self._results_stream.flush()
+            self.scan_checkpoint.results_offset = self._results_stream.tell()
+
     def checkpoint(self) -> None:
-        """Save current progress"""
+        """Save progress made since the last checkpoint (append-only delta)"""
+        if self.checkpoint_manager:
+            self._commit_results()
+            self.checkpoint_manager.append_events(
+                self.scan_id, self._checkpoint_delta()
+            )
+
+    def compact_checkpoint(self) -> None:
+        """Write a full snapshot and drop the delta log (graceful shutdown)"""
         if self.checkpoint_manager:
+            self._commit_results()
             self.checkpoint_manager.save_checkpoint(
                 self.scan_id, self.scan_checkpoint
             )
+            self._checkpoint_delta()  # Mark everything as persisted
+
+    def _checkpoint_delta(self) -> List[Dict]:
+        """Events describing scan_checkpoint changes since the last call"""
+        cp = self.scan_checkpoint
+        events: List[Dict] = []
+
+        if not self._logged_start:
+            events.append({
+                "t": "start",
+                "scan_id": cp.scan_id,
+                "scan_start_time": cp.scan_start_time
+            })
+            self._logged_start = True
+
+        for url in cp.completed_endpoints[self._logged_completed:]:
+            events.append({"t": "endpoint_done", "url": url})
+        self._logged_completed = len(cp.completed_endpoints)
+
+        for result in cp.accumulated_results[self._logged_results:]:
+            events.append({"t": "result", "data": result})
+        self._logged_results = len(cp.accumulated_results)
+
+        if cp.pending_endpoints != self._logged_pending:
+            events.append({"t": "pending", "urls": list(cp.pending_endpoints)})
+            self._logged_pending = list(cp.pending_endpoints)
+
+        if cp.results_offset != self._logged_results_offset:
+            events.append({"t": "results_offset", "offset": cp.results_offset})
+            self._logged_results_offset = cp.results_offset
+
+        changed = {
+            tool: count for tool, count in cp.progress.items()
+            if self._logged_progress.get(tool) != count
+        }
+        if changed:
+            events.append({"t": "progress", "progress": changed})
+            self._logged_progress.update(changed)
+
+        return events
+
+    def shutdown(self) -> None:
+        """Release tool worker processes and the results stream"""
+        self.crash_isolator.shutdown()
+        if self._results_stream is not None:
+            self._results_stream.close()  # No-op if cleanup_checkpoint closed it
+            self._results_stream = None
 
     def get_resilience_report(self) -> Dict:
         """Complete resilience report"""
@@ -537,6 +1334,9 @@ try:
         engine.checkpoint()
 
 finally:
+    # Collapse the delta log into a single snapshot
+    engine.compact_checkpoint()
+
     # Get report even if scan failed
     report = engine.get_resilience_report()
     print(json.dumps(report, indent=2))
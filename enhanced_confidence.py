@@ -4,13 +4,117 @@ Purpose: Multi-factor confidence scoring with corroboration
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class ToolId(IntEnum):
+    """Dense ids for rated tools (index into _TOOL_CONF_ARR)"""
+    NUCLEI = 0
+    NMAP_VULN = 1
+    DALFOX = 2
+    SQLMAP = 3
+    COMMIX = 4
+    XSSTRIKE = 5
+    TESTSSL = 6
+    SSLSCAN = 7
+    WHATWEB = 8
+    DEFAULT = 9
+
+
+# Tool confidence ratings (0.0-1.0), indexed by ToolId
+_TOOL_CONF_ARR = (0.9, 0.85, 0.85, 0.9, 0.8, 0.75, 0.9, 0.85, 0.7, 0.6)
+
+_NAME_TO_ID: Dict[str, ToolId] = {tool.name.lower(): tool for tool in ToolId}
+
+
+# Finding types that need crawler verification to avoid a context penalty
+_PAYLOAD_TYPES = frozenset({"xss", "sql_injection", "command_injection"})
+
+
+# Confidence labels indexed by how many of the 40/60/80 thresholds a score meets
+_LABELS = ("Very Low", "Low", "Medium", "High")
+
+
+def _tool_name_to_rating(tool_name: str) -> float:
+    """Translate a tool name to its rating (unrated tools get the default)"""
+    return _TOOL_CONF_ARR[_NAME_TO_ID.get(tool_name, ToolId.DEFAULT)]
+
+
+def _score_core(
+    tool_rating: float,
+    evidence_len: int,
+    crawler_verified: bool,
+    endpoint_ok: bool,
+    payload_attempts: int,
+    successful_payloads: int,
+    num_corroborating: int,
+    is_payload_type: bool,
+) -> Tuple[float, float, float, float, float]:
+    """
+    Numeric core of calculate_confidence on pre-resolved scalars
+    
+    Returns:
+        (tool_confidence, payload_confidence, corroboration_bonus,
+         context_penalty, final_score)
+    """
+    # 1. Tool Confidence (0-40 points)
+    tool_confidence = tool_rating * 40
+    
+    # 2. Payload Confidence (0-40 points)
+    payload_score = 0.0
+    
+    # Evidence strength: 5 weak / 10 moderate (>20) / 15 strong (>100), branch-free
+    payload_score += 5 * (evidence_len > 0) + 5 * (evidence_len > 20) + 5 * (evidence_len > 100)
+    
+    # Crawler verification
+    if crawler_verified:
+        payload_score += 10
+    elif endpoint_ok:
+        payload_score += 5
+    
+    # Payload success rate
+    if payload_attempts > 0:
+        success_rate = successful_payloads / payload_attempts
+        payload_score += success_rate * 15
+    
+    payload_confidence = min(payload_score, 40)
+    
+    # 3. Corroboration Bonus (0-30 points)
+    corroboration_bonus = 0.0
+    if num_corroborating:
+        # Multiple tools = higher confidence: 10 per agreeing tool, capped at 3
+        num_tools = num_corroborating + 1  # +1 for primary tool
+        corroboration_bonus = 10 + 10 * (num_tools >= 2) + 10 * (num_tools >= 3)
+    
+    # 4. Context Penalties
+    penalty = 0.0
+    
+    # No crawler verification for payload finding
+    if is_payload_type and not crawler_verified:
+        penalty += 10
+    
+    # Weak evidence
+    if 0 < evidence_len < 20:
+        penalty += 5
+    
+    context_penalty = -penalty
+    
+    # Final score (0-100)
+    final_score = max(0, min(100, 
+        tool_confidence + 
+        payload_confidence + 
+        corroboration_bonus + 
+        context_penalty
+    ))
+    
+    return tool_confidence, payload_confidence, corroboration_bonus, context_penalty, final_score
+
+
+@dataclass(slots=True)
 class ConfidenceFactors:
     """Breakdown of confidence score components"""
     tool_confidence: float = 0.0  # Tool's inherent reliability
@@ -59,22 +163,13 @@ class EnhancedConfidenceEngine:
     - 0-39: Very low confidence
     """
     
-    # Tool confidence ratings (0.0-1.0)
-    TOOL_CONFIDENCE = {
-        "nuclei": 0.9,
-        "nmap_vuln": 0.85,
-        "dalfox": 0.85,
-        "sqlmap": 0.9,
-        "commix": 0.8,
-        "xsstrike": 0.75,
-        "testssl": 0.9,
-        "sslscan": 0.85,
-        "whatweb": 0.7,
-        "default": 0.6
-    }
+    # Tool confidence ratings (0.0-1.0), name view of _TOOL_CONF_ARR
+    TOOL_CONFIDENCE = {name: _TOOL_CONF_ARR[tool] for name, tool in _NAME_TO_ID.items()}
     
     def __init__(self, endpoint_graph=None):
         self.graph = endpoint_graph
+        # endpoint -> "responded 200" (graph is finalized before scoring starts)
+        self._endpoint_status: Dict[str, bool] = {}
     
     def calculate_confidence(
         self,
@@ -105,83 +200,53 @@ class EnhancedConfidenceEngine:
         Returns:
             ConfidenceFactors with breakdown
         """
-        factors = ConfidenceFactors()
-        
-        # 1. Tool Confidence (0-40 points)
-        tool_rating = self.TOOL_CONFIDENCE.get(tool_name, self.TOOL_CONFIDENCE["default"])
-        factors.tool_confidence = tool_rating * 40
-        
-        # 2. Payload Confidence (0-40 points)
-        payload_score = 0.0
-        
-        # Evidence strength
-        if evidence:
-            if len(evidence) > 100:
-                payload_score += 15  # Strong evidence
-            elif len(evidence) > 20:
-                payload_score += 10  # Moderate evidence
-            else:
-                payload_score += 5  # Weak evidence
-        
-        # Crawler verification
-        if crawler_verified:
-            payload_score += 10
-        elif self.graph and endpoint:
-            ep = self.graph.get_endpoint(endpoint)
-            if ep and ep.status_code == 200:
-                payload_score += 5
-        
-        # Payload success rate
-        if payload_attempts > 0:
-            success_rate = successful_payloads / payload_attempts
-            payload_score += success_rate * 15
+        tool_rating = _tool_name_to_rating(tool_name)
+        evidence_len = len(evidence) if evidence else 0
         
-        factors.payload_confidence = min(payload_score, 40)
-        
-        # 3. Corroboration Bonus (0-30 points)
-        if corroborating_tools:
-            # Multiple tools = higher confidence
-            num_tools = len(corroborating_tools) + 1  # +1 for primary tool
-            if num_tools >= 3:
-                factors.corroboration_bonus = 30
-            elif num_tools == 2:
-                factors.corroboration_bonus = 20
-            else:
-                factors.corroboration_bonus = 10
-        
-        # 4. Context Penalties
-        penalty = 0.0
-        
-        # No crawler verification for payload finding
-        if finding_type in ["xss", "sql_injection", "command_injection"] and not crawler_verified:
-            penalty += 10
-        
-        # Weak evidence
-        if evidence and len(evidence) < 20:
-            penalty += 5
-        
-        factors.context_penalty = -penalty
-        
-        # Final score (0-100)
-        factors.final_score = max(0, min(100, 
-            factors.tool_confidence + 
-            factors.payload_confidence + 
-            factors.corroboration_bonus + 
-            factors.context_penalty
+        return ConfidenceFactors(*_score_core(
+            tool_rating,
+            evidence_len,
+            crawler_verified,
+            self._endpoint_ok(endpoint, crawler_verified),
+            payload_attempts,
+            successful_payloads,
+            len(corroborating_tools) if corroborating_tools else 0,
+            finding_type in _PAYLOAD_TYPES,
         ))
-        
-        return factors
+    
+    def _endpoint_ok(self, endpoint: Optional[str], crawler_verified: bool) -> bool:
+        """Endpoint status only matters when the crawler did not verify it"""
+        if crawler_verified or not (self.graph and endpoint):
+            return False
+        status = self._endpoint_status.get(endpoint)
+        if status is None:
+            ep = self.graph.get_endpoint(endpoint)
+            status = self._endpoint_status[endpoint] = bool(ep and ep.status_code == 200)
+        return status
+    
+    def _finding_row(self, finding: Dict) -> Tuple:
+        """Resolve a finding dict into _score_core arguments"""
+        evidence = finding.get("evidence", "")
+        corroborating_tools = finding.get("corroborating_tools", [])
+        crawler_verified = finding.get("crawler_verified", False)
+        return (
+            _tool_name_to_rating(finding.get("tool", "unknown")),
+            len(evidence) if evidence else 0,
+            crawler_verified,
+            self._endpoint_ok(finding.get("location", ""), crawler_verified),
+            0,
+            0,
+            len(corroborating_tools) if corroborating_tools else 0,
+            finding.get("type", "") in _PAYLOAD_TYPES,
+        )
     
     def get_confidence_label(self, score: float) -> str:
         """Get confidence label for score"""
-        if score >= 80:
-            return "High"
-        elif score >= 60:
-            return "Medium"
-        elif score >= 40:
-            return "Low"
-        else:
-            return "Very Low"
+        return _LABELS[(score >= 40) + (score >= 60) + (score >= 80)]
+    
+    def labels_for(self, scores: List[float]) -> List[str]:
+        """Get confidence labels for a batch of scores"""
+        return [_LABELS[(score >= 40) + (score >= 60) + (score >= 80)] for score in scores]
     
     def calculate_finding_confidence(self, finding: Dict) -> float:
         """
@@ -193,13 +258,24 @@ class EnhancedConfidenceEngine:
         Returns:
             Confidence score (0-100)
         """
-        factors = self.calculate_confidence(
-            finding_type=finding.get("type", ""),
-            tool_name=finding.get("tool", "unknown"),
-            evidence=finding.get("evidence", ""),
-            endpoint=finding.get("location", ""),
-            corroborating_tools=finding.get("corroborating_tools", []),
-            crawler_verified=finding.get("crawler_verified", False)
-        )
+        return self._calculate_final_only(finding)
+    
+    def _calculate_final_only(self, finding: Dict) -> float:
+        """Final score only: skips the ConfidenceFactors breakdown"""
+        return _score_core(*self._finding_row(finding))[4]
+    
+    def calculate_many(self, findings: List[Dict]) -> List[float]:
+        """
+        Calculate confidence for a batch of finding dicts
         
-        return factors.final_score
+        Args:
+            findings: Finding dictionaries (same shape as calculate_finding_confidence)
+            
+        Returns:
+            Confidence scores (0-100), in input order
+        """
+        # Serial by design: each row costs about as much to pickle to a worker
+        # process as to score, so fanning out across cores is a net loss.
+        score = _score_core
+        row = self._finding_row
+        return [score(*row(finding))[4] for finding in findings]
@@ -7,11 +7,347 @@ Not even utilities that might "just skip a few tools".
 This prevents the leakage we saw before.
 """
 
-from typing import List, Tuple, Dict
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 from target_profile import TargetProfile, TargetType
 from decision_ledger import DecisionLedger
 
 
+class _PlanTarget(NamedTuple):
+    """Hashable projection of the TargetProfile fields a plan depends on"""
+    target_type: TargetType
+    host: str
+    url: str
+    port: int
+    is_web_target: bool
+    is_https: bool
+
+
+class ToolSpec(NamedTuple):
+    """
+    One planned tool: name, command and execution metadata as fields.
+    
+    In the phase tables `cmd` is a template; plans carry the formatted
+    command. Capability sets are frozensets shared across plans.
+    """
+    name: str
+    cmd: str
+    timeout: int
+    category: str
+    blocking: bool
+    requires: FrozenSet[str]
+    optional: FrozenSet[str]
+    produces: FrozenSet[str]
+    worst_case: int
+    
+    @property
+    def meta(self) -> Dict:
+        """Metadata as a fresh dict (the shape plan items are built from)"""
+        return {
+            "timeout": self.timeout,
+            "category": self.category,
+            "blocking": self.blocking,
+            "requires": self.requires,
+            "optional": self.optional,
+            "produces": self.produces,
+            "worst_case": self.worst_case,
+        }
+
+
+# Phase tables: ToolSpec rows whose cmd is a template, formatted with
+# host/url/port only for tools the ledger allows.
+
+# Phase predicate: decides from the target alone whether a phase applies
+PhaseGate = Callable[[_PlanTarget], bool]
+
+# Immutable plan: callers iterate it, so the memoized tuple is shared as-is
+ExecutionPlan = Tuple[ToolSpec, ...]
+
+
+@lru_cache(maxsize=256)
+def _build_plan(
+    target: _PlanTarget,
+    allowed: FrozenSet[str],
+    known: FrozenSet[str],
+) -> ExecutionPlan:
+    """
+    Build and memoize a plan for one (target, ledger fingerprint) pair.
+    
+    Walks the target type's own phase table in order; a phase contributes
+    its ledger-approved tools when its gate holds for the target.
+    """
+    plan = []
+    for gate, tools in _PLAN_TABLE[target.target_type]:
+        if gate(target):
+            plan.extend(_select(tools, target, allowed, known))
+    return tuple(plan)
+
+
+def _cached_plan(executor) -> ExecutionPlan:
+    """
+    Return the memoized plan for an executor's profile and ledger.
+    
+    The profile is fixed per executor, so the resolved plan is bound to
+    the executor and reused until the ledger version changes; only then
+    is the shared cache consulted again.
+    """
+    ledger = executor.ledger
+    bound = executor._bound_plan
+    if bound is not None and bound[0] == ledger.version:
+        return bound[1]
+    
+    profile = executor.profile
+    target = _PlanTarget(
+        profile.target_type, profile.host, profile.url, profile.port,
+        profile.is_web_target, profile.is_https,
+    )
+    plan = _build_plan(target, ledger.allowed_set, ledger.known_tools)
+    executor._bound_plan = (ledger.version, plan)
+    return plan
+
+
+def _select(
+    tools: Tuple[ToolSpec, ...],
+    target: _PlanTarget,
+    allowed: FrozenSet[str],
+    known: FrozenSet[str],
+) -> List[ToolSpec]:
+    """
+    Filter one phase table against the ledger with a single set intersection.
+    
+    Same contract as DecisionLedger.allows: a tool missing from the ledger
+    is an architecture violation.
+    """
+    names = {spec.name for spec in tools}
+    unknown = names - known
+    if unknown:
+        tool_name = next(spec.name for spec in tools if spec.name in unknown)
+        raise KeyError(f"Tool {tool_name} not in decision ledger (architecture violation)")
+    
+    names &= allowed
+    return [
+        spec._replace(cmd=spec.cmd.format(host=target.host, url=target.url, port=target.port))
+        for spec in tools
+        if spec.name in names
+    ]
+
+
+# Shared capability sets for requires/optional/produces (built once)
+_CAP_NONE = frozenset()
+_CAP_REACHABLE = frozenset({"reachable"})
+_CAP_PORTS_KNOWN = frozenset({"ports_known"})
+_CAP_WEB_TARGET = frozenset({"web_target"})
+_CAP_HTTPS = frozenset({"https"})
+_CAP_ENDPOINTS_KNOWN = frozenset({"endpoints_known"})
+_CAP_ENDPOINTS_AND_PARAMS = frozenset({"endpoints_known", "params_known"})
+_CAP_LIVE_ENDPOINTS = frozenset({"endpoints_known", "live_endpoints"})
+_CAP_NUCLEI_CONTEXT = frozenset({"ports_known", "endpoints_known", "live_endpoints"})
+_CAP_REFLECTIONS = frozenset({"reflections"})
+_CAP_TECH_STACK = frozenset({"tech_stack_detected"})
+_CAP_WORDPRESS_DETECTED = frozenset({"wordpress_detected"})
+_CAP_WORDPRESS_FINDINGS = frozenset({"wordpress_findings"})
+_CAP_TLS_FINDINGS = frozenset({"tls_findings"})
+_CAP_WEB_FINDINGS = frozenset({"web_findings"})
+_CAP_SSL_FINDINGS = frozenset({"ssl_findings"})
+_CAP_XSS_FINDINGS = frozenset({"xss_findings"})
+
+
+# ==================== ROOT DOMAIN TOOLS ====================
+
+# AUTHORITATIVE PATH: One tool does comprehensive DNS recon
+# dnsrecon covers A, AAAA, NS, MX, TXT records + zone transfers
+# Removes duplication from dig_a, dig_ns, dig_mx, dig_aaaa
+_ROOT_DNS_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("dnsrecon", "dnsrecon -d {host}", timeout=9999, category="DNS", blocking=True, requires=_CAP_NONE, optional=_CAP_NONE, produces=frozenset({"dns_records"}), worst_case=9999),
+)
+
+_ROOT_SUBDOMAIN_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("assetfinder", "/root/go/bin/assetfinder {host} 2>/dev/null || ~/go/bin/assetfinder {host}", timeout=9999, category="Subdomains", blocking=True, requires=_CAP_NONE, optional=_CAP_NONE, produces=frozenset({"subdomains"}), worst_case=9999),
+)
+
+_ROOT_NETWORK_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("ping", "ping -c 1 {host}", timeout=9999, category="Network", blocking=True, requires=_CAP_NONE, optional=_CAP_NONE, produces=_CAP_REACHABLE, worst_case=9999),
+    ToolSpec("nmap_quick", "nmap -F {host}", timeout=9999, category="Network", blocking=True, requires=_CAP_REACHABLE, optional=_CAP_NONE, produces=_CAP_PORTS_KNOWN, worst_case=9999),
+    ToolSpec("nmap_vuln", "nmap -sV --script vuln --script-timeout 120s --host-timeout 300s {host}", timeout=9999, category="Network", blocking=True, requires=_CAP_PORTS_KNOWN, optional=_CAP_NONE, produces=frozenset({"vuln_signal"}), worst_case=9999),
+)
+
+_ROOT_WEB_DETECTION: Tuple[ToolSpec, ...] = (
+    ToolSpec("whatweb", "whatweb -v {url}", timeout=9999, category="Web", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NONE, produces=_CAP_TECH_STACK, worst_case=9999),
+    ToolSpec("whatweb_http_fallback", "whatweb -v http://{host}", timeout=9999, category="Web", blocking=False, requires=_CAP_WEB_TARGET, optional=_CAP_NONE, produces=_CAP_TECH_STACK, worst_case=9999),
+    ToolSpec("nikto", "nikto -h {url} -C always", timeout=9999, category="Web", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NONE, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+)
+
+_ROOT_WORDPRESS_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("wpscan", "wpscan --url {url} --enumerate vp,vt,u --random-user-agent --disable-tls-checks", timeout=9999, category="WordPress", blocking=True, requires=_CAP_WORDPRESS_DETECTED, optional=_CAP_NONE, produces=_CAP_WORDPRESS_FINDINGS, worst_case=9999),
+)
+
+_ROOT_TLS_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("sslscan", "sslscan {host}", timeout=9999, category="SSL", blocking=True, requires=_CAP_HTTPS, optional=_CAP_NONE, produces=_CAP_TLS_FINDINGS, worst_case=9999),
+    ToolSpec("testssl", "/home/iamfahadshaikh/testssl.sh-3.2.2/testssl.sh --quiet -U {url} 2>/dev/null || ~/testssl.sh-3.2.2/testssl.sh --quiet -U {url}", timeout=9999, category="SSL", blocking=True, requires=_CAP_HTTPS, optional=_CAP_NONE, produces=_CAP_TLS_FINDINGS, worst_case=9999),
+    ToolSpec("openssl_connect", "openssl s_client -connect {host}:443 -servername {host}", timeout=9999, category="SSL", blocking=False, requires=_CAP_HTTPS, optional=_CAP_NONE, produces=frozenset({"tls_details"}), worst_case=9999),
+    ToolSpec("openssl_showcerts", "openssl s_client -connect {host}:443 -servername {host} -showcerts </dev/null", timeout=9999, category="SSL", blocking=False, requires=_CAP_HTTPS, optional=_CAP_NONE, produces=frozenset({"cert_chain"}), worst_case=9999),
+    ToolSpec("openssl_status", "openssl s_client -connect {host}:443 -servername {host} -status </dev/null", timeout=9999, category="SSL", blocking=False, requires=_CAP_HTTPS, optional=_CAP_NONE, produces=frozenset({"ocsp_status"}), worst_case=9999),
+    ToolSpec("openssl_state", "openssl s_client -connect {host}:443 -servername {host} -state -quiet </dev/null", timeout=9999, category="SSL", blocking=False, requires=_CAP_HTTPS, optional=_CAP_NONE, produces=frozenset({"tls_handshake"}), worst_case=9999),
+)
+
+_ROOT_WEB_ENUM: Tuple[ToolSpec, ...] = (
+    ToolSpec("gobuster", "gobuster dir -u {url} -w /usr/share/wordlists/dirbuster/directory-list-2.3-medium.txt --status-codes-blacklist 403", 
+     timeout=9999, category="Web", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_ENDPOINTS_KNOWN, produces=_CAP_LIVE_ENDPOINTS, worst_case=9999),
+)
+
+_ROOT_VULN_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("dalfox", "dalfox url {url} --silence", 
+     timeout=9999, category="XSS", blocking=True, requires=_CAP_ENDPOINTS_KNOWN, optional=_CAP_REFLECTIONS, produces=_CAP_XSS_FINDINGS, worst_case=9999),
+    ToolSpec("xsstrike", "xsstrike -u {url} --crawl", 
+     timeout=9999, category="XSS", blocking=True, requires=_CAP_ENDPOINTS_KNOWN, optional=_CAP_REFLECTIONS, produces=_CAP_XSS_FINDINGS, worst_case=9999),
+    ToolSpec("sqlmap", "sqlmap -u {url} --batch --crawl=2", 
+     timeout=9999, category="SQLi", blocking=True, requires=_CAP_ENDPOINTS_AND_PARAMS, optional=_CAP_NONE, produces=frozenset({"sqli_findings"}), worst_case=9999),
+    ToolSpec("xsser", "xsser -u {url}", 
+     timeout=9999, category="XSS", blocking=True, requires=_CAP_ENDPOINTS_KNOWN, optional=_CAP_REFLECTIONS, produces=_CAP_XSS_FINDINGS, worst_case=9999),
+    ToolSpec("commix", "commix -u {url}", 
+     timeout=9999, category="Injection", blocking=True, requires=_CAP_ENDPOINTS_AND_PARAMS, optional=frozenset({"command_params"}), produces=frozenset({"rce_findings"}), worst_case=9999),
+)
+
+_ROOT_NUCLEI_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("nuclei_crit", "nuclei -u {url} -severity critical -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_high", "nuclei -u {url} -severity high -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_all", "nuclei -target {host} -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_cves", "nuclei -target {host} -t http/cves/ -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_ssl", "nuclei -target {host} -t ssl -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_SSL_FINDINGS, worst_case=9999),
+)
+
+
+# ==================== SUBDOMAIN TOOLS ====================
+
+_SUB_NETWORK_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("ping", "ping -c 1 {host}", timeout=9999, category="Network", blocking=True, requires=_CAP_NONE, optional=_CAP_NONE, produces=_CAP_REACHABLE, worst_case=9999),
+    ToolSpec("nmap_quick", "nmap -F {host}", timeout=9999, category="Network", blocking=True, requires=_CAP_REACHABLE, optional=_CAP_NONE, produces=_CAP_PORTS_KNOWN, worst_case=9999),
+)
+
+_SUB_WEB_DETECTION: Tuple[ToolSpec, ...] = (
+    ToolSpec("whatweb", "whatweb -v {url}", timeout=9999, category="Web", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NONE, produces=_CAP_TECH_STACK, worst_case=9999),
+    ToolSpec("whatweb_http_fallback", "whatweb -v http://{host}", timeout=9999, category="Web", blocking=False, requires=_CAP_WEB_TARGET, optional=_CAP_NONE, produces=_CAP_TECH_STACK, worst_case=9999),
+    ToolSpec("nikto", "nikto -h {url} -C always", timeout=9999, category="Web", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NONE, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+)
+
+_SUB_WORDPRESS_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("wpscan", "wpscan --url {url} --enumerate vp,vt,u --random-user-agent --disable-tls-checks", timeout=9999, category="WordPress", blocking=True, requires=_CAP_WORDPRESS_DETECTED, optional=_CAP_NONE, produces=_CAP_WORDPRESS_FINDINGS, worst_case=9999),
+)
+
+_SUB_TLS_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("sslscan", "sslscan {host}", timeout=9999, category="SSL", blocking=True, requires=_CAP_HTTPS, optional=_CAP_NONE, produces=_CAP_TLS_FINDINGS, worst_case=9999),
+)
+
+_SUB_WEB_ENUM: Tuple[ToolSpec, ...] = (
+    ToolSpec("gobuster", "gobuster dir -u {url} -w /usr/share/wordlists/dirbuster/directory-list-2.3-medium.txt --status-codes-blacklist 403", 
+     timeout=9999, category="Web", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_ENDPOINTS_KNOWN, produces=_CAP_LIVE_ENDPOINTS, worst_case=9999),
+)
+
+_SUB_VULN_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("nuclei_crit", "nuclei -u {url} -severity critical -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_high", "nuclei -u {url} -severity high -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_all", "nuclei -target {host} -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_cves", "nuclei -target {host} -t http/cves/ -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_ssl", "nuclei -target {host} -t ssl -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_SSL_FINDINGS, worst_case=9999),
+)
+
+
+# ==================== IP TOOLS ====================
+
+_IP_NETWORK_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("ping", "ping -c 1 {host}", timeout=9999, category="Network", blocking=True, requires=_CAP_NONE, optional=_CAP_NONE, produces=_CAP_REACHABLE, worst_case=9999),
+    ToolSpec("nmap_quick", "nmap -F {host}", timeout=9999, category="Network", blocking=True, requires=_CAP_REACHABLE, optional=_CAP_NONE, produces=_CAP_PORTS_KNOWN, worst_case=9999),
+)
+
+_IP_WEB_DETECTION: Tuple[ToolSpec, ...] = (
+    ToolSpec("whatweb", "whatweb -v {url}", timeout=9999, category="Web", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NONE, produces=_CAP_TECH_STACK, worst_case=9999),
+    ToolSpec("whatweb_http_fallback", "whatweb -v http://{host}", timeout=9999, category="Web", blocking=False, requires=_CAP_WEB_TARGET, optional=_CAP_NONE, produces=_CAP_TECH_STACK, worst_case=9999),
+)
+
+_IP_WORDPRESS_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("wpscan", "wpscan --url {url} --enumerate vp,vt,u --random-user-agent --disable-tls-checks", timeout=9999, category="WordPress", blocking=True, requires=_CAP_WORDPRESS_DETECTED, optional=_CAP_NONE, produces=_CAP_WORDPRESS_FINDINGS, worst_case=9999),
+)
+
+_IP_TLS_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("sslscan", "sslscan {host}:{port}", 
+     timeout=9999, category="SSL", blocking=True, requires=_CAP_HTTPS, optional=_CAP_NONE, produces=_CAP_TLS_FINDINGS, worst_case=9999),
+)
+
+_IP_WEB_ENUM: Tuple[ToolSpec, ...] = (
+    ToolSpec("gobuster", "gobuster dir -u {url} -w /usr/share/wordlists/dirbuster/directory-list-2.3-medium.txt --status-codes-blacklist 403", 
+     timeout=9999, category="Web", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_ENDPOINTS_KNOWN, produces=_CAP_LIVE_ENDPOINTS, worst_case=9999),
+)
+
+_IP_VULN_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("nuclei_crit", "nuclei -u {url} -severity critical -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_high", "nuclei -u {url} -severity high -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_all", "nuclei -target {host} -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_cves", "nuclei -target {host} -t http/cves/ -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_WEB_FINDINGS, worst_case=9999),
+    ToolSpec("nuclei_ssl", "nuclei -target {host} -t ssl -silent -update-templates", 
+     timeout=9999, category="Nuclei", blocking=True, requires=_CAP_WEB_TARGET, optional=_CAP_NUCLEI_CONTEXT, produces=_CAP_SSL_FINDINGS, worst_case=9999),
+)
+
+
+# ==================== PLAN TABLES ====================
+# One row per phase: (gate, tools). Each target type keeps its own table,
+# so root domain, subdomain and IP flows still never share a tool list.
+
+def _always(target: _PlanTarget) -> bool:
+    """Gate for phases that apply to every target of the type"""
+    return True
+
+
+_is_web_target: PhaseGate = attrgetter("is_web_target")
+_is_https: PhaseGate = attrgetter("is_https")
+
+_PLAN_TABLE: Dict[TargetType, Tuple[Tuple[PhaseGate, Tuple[ToolSpec, ...]], ...]] = {
+    TargetType.ROOT_DOMAIN: (
+        (_always, _ROOT_DNS_TOOLS),           # PHASE 1: DNS RECONNAISSANCE
+        (_always, _ROOT_SUBDOMAIN_TOOLS),     # PHASE 2: SUBDOMAIN ENUMERATION
+        (_always, _ROOT_NETWORK_TOOLS),       # PHASE 3: NETWORK SCANNING
+        (_always, _ROOT_WEB_DETECTION),       # PHASE 4: WEB DETECTION
+        (_always, _ROOT_WORDPRESS_TOOLS),     # WORDPRESS SCANNING (IF DETECTED)
+        (_always, _ROOT_TLS_TOOLS),           # PHASE 5: SSL/TLS
+        (_always, _ROOT_WEB_ENUM),            # PHASE 6: WEB ENUMERATION
+        (_always, _ROOT_VULN_TOOLS),          # PHASE 7: VULNERABILITY SCANNING
+        (_always, _ROOT_NUCLEI_TOOLS),        # PHASE 8: NUCLEI SCANNING (FORCED ON ALL)
+    ),
+    # NO DNS PHASE: subdomains inherit all DNS records from root domain
+    TargetType.SUBDOMAIN: (
+        (_always, _SUB_NETWORK_TOOLS),        # PHASE 2: NETWORK SCANNING (MINIMAL)
+        (_is_web_target, _SUB_WEB_DETECTION), # PHASE 3: WEB DETECTION
+        (_is_web_target, _SUB_WORDPRESS_TOOLS),  # WORDPRESS SCANNING (IF DETECTED)
+        (_is_https, _SUB_TLS_TOOLS),          # PHASE 4: SSL/TLS (IF HTTPS)
+        (_is_web_target, _SUB_WEB_ENUM),      # PHASE 5: WEB ENUMERATION (IF WEB TARGET)
+        (_always, _SUB_VULN_TOOLS),           # VULNERABILITY SCANNING (SUBDOMAIN ONLY)
+    ),
+    # NO DNS - IP is already resolved
+    TargetType.IP: (
+        (_always, _IP_NETWORK_TOOLS),         # PHASE 1: NETWORK SCANNING
+        (_is_web_target, _IP_WEB_DETECTION),  # PHASE 2: WEB DETECTION (IF WEB)
+        (_is_web_target, _IP_WORDPRESS_TOOLS),   # WORDPRESS SCANNING (IF DETECTED)
+        (_is_https, _IP_TLS_TOOLS),           # PHASE 3: SSL/TLS (IF HTTPS)
+        (_is_web_target, _IP_WEB_ENUM),       # PHASE 4: WEB ENUMERATION
+        (_always, _IP_VULN_TOOLS),            # VULNERABILITY SCANNING (IP ONLY)
+    ),
+}
+
+
 class RootDomainExecutor:
     """
     Execution path for ROOT DOMAIN targets.
@@ -30,129 +366,17 @@ class RootDomainExecutor:
         
         self.profile = profile
         self.ledger = ledger
+        self._bound_plan: Optional[Tuple[int, ExecutionPlan]] = None  # (ledger version, plan)
     
-    def get_execution_plan(self) -> List[Tuple[str, str, Dict]]:
+    def get_execution_plan(self) -> ExecutionPlan:
         """
         Get the execution plan for root domain.
         
-        Returns list of (tool_name, command, metadata)
+        Returns tuple of ToolSpec (name, command, metadata fields)
         Only includes tools approved by ledger.
+        Memoized per (target, ledger fingerprint); metadata is read-only.
         """
-        plan = []
-        
-        # ============ PHASE 1: DNS RECONNAISSANCE ============
-        # AUTHORITATIVE PATH: One tool does comprehensive DNS recon
-        # dnsrecon covers A, AAAA, NS, MX, TXT records + zone transfers
-        # Removes duplication from dig_a, dig_ns, dig_mx, dig_aaaa
-        dns_tools = [
-            ("dnsrecon", f"dnsrecon -d {self.profile.host}", {"timeout": 9999, "category": "DNS", "blocking": True, "requires": set(), "optional": set(), "produces": {"dns_records"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in dns_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 2: SUBDOMAIN ENUMERATION ============
-        subdomain_tools = [
-            ("assetfinder", f"/root/go/bin/assetfinder {self.profile.host} 2>/dev/null || ~/go/bin/assetfinder {self.profile.host}", {"timeout": 9999, "category": "Subdomains", "blocking": True, "requires": set(), "optional": set(), "produces": {"subdomains"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in subdomain_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 3: NETWORK SCANNING ============
-        network_tools = [
-            ("ping", f"ping -c 1 {self.profile.host}", {"timeout": 9999, "category": "Network", "blocking": True, "requires": set(), "optional": set(), "produces": {"reachable"}, "worst_case": 9999}),
-            ("nmap_quick", f"nmap -F {self.profile.host}", {"timeout": 9999, "category": "Network", "blocking": True, "requires": {"reachable"}, "optional": set(), "produces": {"ports_known"}, "worst_case": 9999}),
-            ("nmap_vuln", f"nmap -sV --script vuln --script-timeout 120s --host-timeout 300s {self.profile.host}", {"timeout": 9999, "category": "Network", "blocking": True, "requires": {"ports_known"}, "optional": set(), "produces": {"vuln_signal"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in network_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 4: WEB DETECTION ============
-        web_detection = [
-            ("whatweb", f"whatweb -v {self.profile.url}", {"timeout": 9999, "category": "Web", "blocking": True, "requires": {"web_target"}, "optional": set(), "produces": {"tech_stack_detected"}, "worst_case": 9999}),
-            ("whatweb_http_fallback", f"whatweb -v http://{self.profile.host}", {"timeout": 9999, "category": "Web", "blocking": False, "requires": {"web_target"}, "optional": set(), "produces": {"tech_stack_detected"}, "worst_case": 9999}),
-            ("nikto", f"nikto -h {self.profile.url} -C always", {"timeout": 9999, "category": "Web", "blocking": True, "requires": {"web_target"}, "optional": set(), "produces": {"web_findings"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in web_detection:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        # ============ WORDPRESS SCANNING (IF DETECTED) ============
-        wordpress_tools = [
-            ("wpscan", f"wpscan --url {self.profile.url} --enumerate vp,vt,u --random-user-agent --disable-tls-checks", {"timeout": 9999, "category": "WordPress", "blocking": True, "requires": {"wordpress_detected"}, "optional": set(), "produces": {"wordpress_findings"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in wordpress_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 5: SSL/TLS ============
-        tls_tools = [
-            ("sslscan", f"sslscan {self.profile.host}", {"timeout": 9999, "category": "SSL", "blocking": True, "requires": {"https"}, "optional": set(), "produces": {"tls_findings"}, "worst_case": 9999}),
-            ("testssl", f"/home/iamfahadshaikh/testssl.sh-3.2.2/testssl.sh --quiet -U {self.profile.url} 2>/dev/null || ~/testssl.sh-3.2.2/testssl.sh --quiet -U {self.profile.url}", {"timeout": 9999, "category": "SSL", "blocking": True, "requires": {"https"}, "optional": set(), "produces": {"tls_findings"}, "worst_case": 9999}),
-            ("openssl_connect", f"openssl s_client -connect {self.profile.host}:443 -servername {self.profile.host}", {"timeout": 9999, "category": "SSL", "blocking": False, "requires": {"https"}, "optional": set(), "produces": {"tls_details"}, "worst_case": 9999}),
-            ("openssl_showcerts", f"openssl s_client -connect {self.profile.host}:443 -servername {self.profile.host} -showcerts </dev/null", {"timeout": 9999, "category": "SSL", "blocking": False, "requires": {"https"}, "optional": set(), "produces": {"cert_chain"}, "worst_case": 9999}),
-            ("openssl_status", f"openssl s_client -connect {self.profile.host}:443 -servername {self.profile.host} -status </dev/null", {"timeout": 9999, "category": "SSL", "blocking": False, "requires": {"https"}, "optional": set(), "produces": {"ocsp_status"}, "worst_case": 9999}),
-            ("openssl_state", f"openssl s_client -connect {self.profile.host}:443 -servername {self.profile.host} -state -quiet </dev/null", {"timeout": 9999, "category": "SSL", "blocking": False, "requires": {"https"}, "optional": set(), "produces": {"tls_handshake"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in tls_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 6: WEB ENUMERATION ============
-        web_enum = [
-            ("gobuster", f"gobuster dir -u {self.profile.url} -w /usr/share/wordlists/dirbuster/directory-list-2.3-medium.txt --status-codes-blacklist 403", 
-             {"timeout": 9999, "category": "Web", "blocking": True, "requires": {"web_target"}, "optional": {"endpoints_known"}, "produces": {"endpoints_known", "live_endpoints"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in web_enum:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 7: VULNERABILITY SCANNING ============
-        vuln_tools = [
-            ("dalfox", f"dalfox url {self.profile.url} --silence", 
-             {"timeout": 9999, "category": "XSS", "blocking": True, "requires": {"endpoints_known"}, "optional": {"reflections"}, "produces": {"xss_findings"}, "worst_case": 9999}),
-            ("xsstrike", f"xsstrike -u {self.profile.url} --crawl", 
-             {"timeout": 9999, "category": "XSS", "blocking": True, "requires": {"endpoints_known"}, "optional": {"reflections"}, "produces": {"xss_findings"}, "worst_case": 9999}),
-            ("sqlmap", f"sqlmap -u {self.profile.url} --batch --crawl=2", 
-             {"timeout": 9999, "category": "SQLi", "blocking": True, "requires": {"endpoints_known", "params_known"}, "optional": set(), "produces": {"sqli_findings"}, "worst_case": 9999}),
-            ("xsser", f"xsser -u {self.profile.url}", 
-             {"timeout": 9999, "category": "XSS", "blocking": True, "requires": {"endpoints_known"}, "optional": {"reflections"}, "produces": {"xss_findings"}, "worst_case": 9999}),
-            ("commix", f"commix -u {self.profile.url}", 
-             {"timeout": 9999, "category": "Injection", "blocking": True, "requires": {"endpoints_known", "params_known"}, "optional": {"command_params"}, "produces": {"rce_findings"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in vuln_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 8: NUCLEI SCANNING (FORCED ON ALL) ============
-        nuclei_tools = [
-            ("nuclei_crit", f"nuclei -u {self.profile.url} -severity critical -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_high", f"nuclei -u {self.profile.url} -severity high -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_all", f"nuclei -target {self.profile.host} -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_cves", f"nuclei -target {self.profile.host} -t http/cves/ -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_ssl", f"nuclei -target {self.profile.host} -t ssl -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"ssl_findings"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in nuclei_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        return plan
+        return _cached_plan(self)
 
 
 class SubdomainExecutor:
@@ -175,90 +399,17 @@ class SubdomainExecutor:
         
         self.profile = profile
         self.ledger = ledger
+        self._bound_plan: Optional[Tuple[int, ExecutionPlan]] = None  # (ledger version, plan)
     
-    def get_execution_plan(self) -> List[Tuple[str, str, Dict]]:
+    def get_execution_plan(self) -> ExecutionPlan:
         """
         Get the execution plan for subdomain.
         
-        Returns list of (tool_name, command, metadata)
+        Returns tuple of ToolSpec (name, command, metadata fields)
         Only includes tools approved by ledger.
+        Memoized per (target, ledger fingerprint); metadata is read-only.
         """
-        plan = []
-        
-        # NO PHASE 1: DNS already handled by dnsrecon at root domain level
-        # Subdomains inherit all DNS records from root domain (no duplication)
-        
-        # ============ PHASE 2: NETWORK SCANNING (MINIMAL) ============
-        network_tools = [
-            ("ping", f"ping -c 1 {self.profile.host}", {"timeout": 9999, "category": "Network", "blocking": True, "requires": set(), "optional": set(), "produces": {"reachable"}, "worst_case": 9999}),
-            ("nmap_quick", f"nmap -F {self.profile.host}", {"timeout": 9999, "category": "Network", "blocking": True, "requires": {"reachable"}, "optional": set(), "produces": {"ports_known"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in network_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 3: WEB DETECTION ============
-        if self.profile.is_web_target:
-            web_detection = [
-                ("whatweb", f"whatweb -v {self.profile.url}", {"timeout": 9999, "category": "Web", "blocking": True, "requires": {"web_target"}, "optional": set(), "produces": {"tech_stack_detected"}, "worst_case": 9999}),
-                ("whatweb_http_fallback", f"whatweb -v http://{self.profile.host}", {"timeout": 9999, "category": "Web", "blocking": False, "requires": {"web_target"}, "optional": set(), "produces": {"tech_stack_detected"}, "worst_case": 9999}),
-                ("nikto", f"nikto -h {self.profile.url} -C always", {"timeout": 9999, "category": "Web", "blocking": True, "requires": {"web_target"}, "optional": set(), "produces": {"web_findings"}, "worst_case": 9999}),
-            ]
-            
-            for tool_name, cmd, meta in web_detection:
-                if self.ledger.allows(tool_name):
-                    plan.append((tool_name, cmd, meta))
-            
-            # ============ WORDPRESS SCANNING (IF DETECTED) ============
-            wordpress_tools = [
-                ("wpscan", f"wpscan --url {self.profile.url} --enumerate vp,vt,u --random-user-agent --disable-tls-checks", {"timeout": 9999, "category": "WordPress", "blocking": True, "requires": {"wordpress_detected"}, "optional": set(), "produces": {"wordpress_findings"}, "worst_case": 9999}),
-            ]
-            
-            for tool_name, cmd, meta in wordpress_tools:
-                if self.ledger.allows(tool_name):
-                    plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 4: SSL/TLS (IF HTTPS) ============
-        if self.profile.is_https:
-            tls_tools = [
-                ("sslscan", f"sslscan {self.profile.host}", {"timeout": 9999, "category": "SSL", "blocking": True, "requires": {"https"}, "optional": set(), "produces": {"tls_findings"}, "worst_case": 9999}),
-            ]
-            
-            for tool_name, cmd, meta in tls_tools:
-                if self.ledger.allows(tool_name):
-                    plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 5: WEB ENUMERATION (IF WEB TARGET) ============
-        if self.profile.is_web_target:
-            web_enum = [
-                ("gobuster", f"gobuster dir -u {self.profile.url} -w /usr/share/wordlists/dirbuster/directory-list-2.3-medium.txt --status-codes-blacklist 403", 
-                 {"timeout": 9999, "category": "Web", "blocking": True, "requires": {"web_target"}, "optional": {"endpoints_known"}, "produces": {"endpoints_known", "live_endpoints"}, "worst_case": 9999}),
-            ]
-            
-            for tool_name, cmd, meta in web_enum:
-                if self.ledger.allows(tool_name):
-                    plan.append((tool_name, cmd, meta))
-        
-        # ============ VULNERABILITY SCANNING (SUBDOMAIN ONLY) ============
-        vuln_tools = [
-            ("nuclei_crit", f"nuclei -u {self.profile.url} -severity critical -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_high", f"nuclei -u {self.profile.url} -severity high -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_all", f"nuclei -target {self.profile.host} -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_cves", f"nuclei -target {self.profile.host} -t http/cves/ -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_ssl", f"nuclei -target {self.profile.host} -t ssl -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"ssl_findings"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in vuln_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        return plan
+        return _cached_plan(self)
 
 
 class IPExecutor:
@@ -278,89 +429,17 @@ class IPExecutor:
         
         self.profile = profile
         self.ledger = ledger
+        self._bound_plan: Optional[Tuple[int, ExecutionPlan]] = None  # (ledger version, plan)
     
-    def get_execution_plan(self) -> List[Tuple[str, str, Dict]]:
+    def get_execution_plan(self) -> ExecutionPlan:
         """
         Get the execution plan for IP.
         
-        Returns list of (tool_name, command, metadata)
+        Returns tuple of ToolSpec (name, command, metadata fields)
         Only includes tools approved by ledger.
+        Memoized per (target, ledger fingerprint); metadata is read-only.
         """
-        plan = []
-        
-        # NO DNS - IP is already resolved
-        
-        # ============ PHASE 1: NETWORK SCANNING ============
-        network_tools = [
-            ("ping", f"ping -c 1 {self.profile.host}", {"timeout": 9999, "category": "Network", "blocking": True, "requires": set(), "optional": set(), "produces": {"reachable"}, "worst_case": 9999}),
-            ("nmap_quick", f"nmap -F {self.profile.host}", {"timeout": 9999, "category": "Network", "blocking": True, "requires": {"reachable"}, "optional": set(), "produces": {"ports_known"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in network_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 2: WEB DETECTION (IF WEB) ============
-        if self.profile.is_web_target:
-            web_detection = [
-                ("whatweb", f"whatweb -v {self.profile.url}", {"timeout": 9999, "category": "Web", "blocking": True, "requires": {"web_target"}, "optional": set(), "produces": {"tech_stack_detected"}, "worst_case": 9999}),
-                ("whatweb_http_fallback", f"whatweb -v http://{self.profile.host}", {"timeout": 9999, "category": "Web", "blocking": False, "requires": {"web_target"}, "optional": set(), "produces": {"tech_stack_detected"}, "worst_case": 9999}),
-            ]
-            
-            for tool_name, cmd, meta in web_detection:
-                if self.ledger.allows(tool_name):
-                    plan.append((tool_name, cmd, meta))
-            
-            # ============ WORDPRESS SCANNING (IF DETECTED) ============
-            wordpress_tools = [
-                ("wpscan", f"wpscan --url {self.profile.url} --enumerate vp,vt,u --random-user-agent --disable-tls-checks", {"timeout": 9999, "category": "WordPress", "blocking": True, "requires": {"wordpress_detected"}, "optional": set(), "produces": {"wordpress_findings"}, "worst_case": 9999}),
-            ]
-            
-            for tool_name, cmd, meta in wordpress_tools:
-                if self.ledger.allows(tool_name):
-                    plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 3: SSL/TLS (IF HTTPS) ============
-        if self.profile.is_https:
-            tls_tools = [
-                ("sslscan", f"sslscan {self.profile.host}:{self.profile.port}", 
-                 {"timeout": 9999, "category": "SSL", "blocking": True, "requires": {"https"}, "optional": set(), "produces": {"tls_findings"}, "worst_case": 9999}),
-            ]
-            
-            for tool_name, cmd, meta in tls_tools:
-                if self.ledger.allows(tool_name):
-                    plan.append((tool_name, cmd, meta))
-        
-        # ============ PHASE 4: WEB ENUMERATION ============
-        if self.profile.is_web_target:
-            web_enum = [
-                ("gobuster", f"gobuster dir -u {self.profile.url} -w /usr/share/wordlists/dirbuster/directory-list-2.3-medium.txt --status-codes-blacklist 403", 
-                 {"timeout": 9999, "category": "Web", "blocking": True, "requires": {"web_target"}, "optional": {"endpoints_known"}, "produces": {"endpoints_known", "live_endpoints"}, "worst_case": 9999}),
-            ]
-            
-            for tool_name, cmd, meta in web_enum:
-                if self.ledger.allows(tool_name):
-                    plan.append((tool_name, cmd, meta))
-        
-        # ============ VULNERABILITY SCANNING (IP ONLY) ============
-        vuln_tools = [
-            ("nuclei_crit", f"nuclei -u {self.profile.url} -severity critical -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_high", f"nuclei -u {self.profile.url} -severity high -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_all", f"nuclei -target {self.profile.host} -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_cves", f"nuclei -target {self.profile.host} -t http/cves/ -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"web_findings"}, "worst_case": 9999}),
-            ("nuclei_ssl", f"nuclei -target {self.profile.host} -t ssl -silent -update-templates", 
-             {"timeout": 9999, "category": "Nuclei", "blocking": True, "requires": {"web_target"}, "optional": {"ports_known", "endpoints_known", "live_endpoints"}, "produces": {"ssl_findings"}, "worst_case": 9999}),
-        ]
-        
-        for tool_name, cmd, meta in vuln_tools:
-            if self.ledger.allows(tool_name):
-                plan.append((tool_name, cmd, meta))
-        
-        return plan
+        return _cached_plan(self)
 
 
 def get_executor(profile: TargetProfile, ledger: DecisionLedger):
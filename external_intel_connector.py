@@ -3,14 +3,60 @@ External Intelligence Connector - Phase 1 Fix
 Integration for crt.sh, Shodan, Censys (read-only, external_intel tagged)
 """
 
+import asyncio
+import hashlib
 import logging
+import os
+import re
+import sqlite3
+import threading
+import time
 import requests
 import json
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from dataclasses import asdict, dataclass
+
+try:
+    import ijson  # Optional: stream large crt.sh responses
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: faster response decoding
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# One non-wildcard name per line of crt.sh name_value, surrounding whitespace trimmed
+_CRTSH_NAME_RE = re.compile(r"^[^\S\n]*([^*\s](?:[^\n]*\S)?)[^\S\n]*$", re.MULTILINE)
+
+
+def _loads(raw: bytes):
+    """Decode a JSON response body (orjson if installed, else stdlib json)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _crtsh_subdomains(certs: Iterable[Dict], batch: int = 1000) -> Set[str]:
+    """Collect subdomains from crt.sh entries, scanning name_value in batches"""
+    subdomains: Set[str] = set()
+    certs = iter(certs)
+    while True:
+        chunk = list(islice(certs, batch))
+        if not chunk:
+            return subdomains
+        joined = "\n".join(cert.get("name_value", "") for cert in chunk)
+        subdomains.update(_CRTSH_NAME_RE.findall(joined))
+
 
 @dataclass
 class ExternalIntelResult:
@@ -22,30 +68,208 @@ class ExternalIntelResult:
     error: Optional[str] = None
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket with lazy refill.
+    
+    Holds at most one second's worth of requests, so bursts stay within
+    the provider's per-second limit.
+    """
+    
+    def __init__(self, rpm: float):
+        self.rate = rpm / 60.0  # tokens per second
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.last_update = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, n: float = 1) -> None:
+        """Block until n tokens are available, then take them"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_update) * self.rate)
+            self.last_update = now
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        # Deficit is already booked, so concurrent callers queue up behind us
+        if wait:
+            time.sleep(wait)
+
+
+class IntelCachePolicy(str, Enum):
+    """How the on-disk intel cache is used"""
+    ENABLED = "enabled"    # Read hits, write fresh results
+    READONLY = "readonly"  # Read hits, never write
+    REPLAY = "replay"      # Read hits, a miss is an error (reproducible re-runs)
+    DISABLED = "disabled"  # Always query the live API
+
+
+class IntelCache:
+    """
+    Persistent cache of successful external intel results (sqlite).
+    
+    Keys are SHA256(source|subject), so API credentials never reach disk.
+    Policy comes from VAPT_INTEL_CACHE_POLICY, path from VAPT_INTEL_CACHE.
+    Opt-in: with neither a policy nor a path configured the cache is
+    disabled and nothing is written to disk. A path alone enables it; a
+    policy alone uses DEFAULT_PATH.
+    """
+    
+    # Freshness per source (seconds)
+    TTL_SECONDS = {
+        "crtsh": 24 * 3600,
+        "shodan": 7 * 24 * 3600,
+        "censys": 7 * 24 * 3600,
+    }
+    DEFAULT_TTL = 24 * 3600
+    DEFAULT_PATH = Path.home() / ".cache" / "vapt" / "intel_cache.sqlite"
+    
+    def __init__(self, path: Optional[str] = None, policy: Optional[str] = None):
+        path = path or os.environ.get("VAPT_INTEL_CACHE")
+        policy = policy or os.environ.get("VAPT_INTEL_CACHE_POLICY") or ("enabled" if path else "disabled")
+        try:
+            self.policy = IntelCachePolicy(policy.lower())
+        except ValueError:
+            logger.warning(f"[IntelCache] Disabled, unknown policy {policy!r}")
+            self.policy = IntelCachePolicy.DISABLED
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.policy is IntelCachePolicy.DISABLED:
+            return
+        
+        try:
+            db_path = Path(path or self.DEFAULT_PATH)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS intel (key TEXT PRIMARY KEY, ts REAL, result TEXT)"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"[IntelCache] Disabled, cannot open cache: {e}")
+            self._conn = None
+            self.policy = IntelCachePolicy.DISABLED
+    
+    @staticmethod
+    def make_key(source: str, subject: str) -> str:
+        return hashlib.sha256(f"{source}|{subject}".encode()).hexdigest()
+    
+    def fetch(self, source: str, subject: str,
+              query: Callable[[], ExternalIntelResult]) -> ExternalIntelResult:
+        """Return a fresh cached result for (source, subject), else run query"""
+        if self.policy is IntelCachePolicy.DISABLED:
+            return query()
+        
+        key = self.make_key(source, subject)
+        hit = self._get(key, self.TTL_SECONDS.get(source, self.DEFAULT_TTL))
+        if hit is not None:
+            logger.info(f"[IntelCache] Hit for {source}:{subject}")
+            return hit
+        
+        if self.policy is IntelCachePolicy.REPLAY:
+            return ExternalIntelResult(
+                source=source,
+                data_type="cache",
+                results=[],
+                success=False,
+                error="replay_cache_miss"
+            )
+        
+        result = query()
+        if result.success and self.policy is IntelCachePolicy.ENABLED:
+            self._put(key, result)
+        return result
+    
+    def fetch_many(self, source: str, subjects: List[str],
+                   query: Callable[[List[str]], Dict[str, ExternalIntelResult]]) -> Dict[str, ExternalIntelResult]:
+        """fetch for many subjects; query receives only the cache misses, in one call"""
+        if self.policy is IntelCachePolicy.DISABLED:
+            return query(subjects)
+        
+        ttl = self.TTL_SECONDS.get(source, self.DEFAULT_TTL)
+        results: Dict[str, ExternalIntelResult] = {}
+        misses = []
+        for subject in subjects:
+            hit = self._get(self.make_key(source, subject), ttl)
+            if hit is not None:
+                results[subject] = hit
+            else:
+                misses.append(subject)
+        if results:
+            logger.info(f"[IntelCache] {len(results)}/{len(subjects)} hits for {source}")
+        
+        if misses:
+            if self.policy is IntelCachePolicy.REPLAY:
+                fresh = {
+                    subject: ExternalIntelResult(
+                        source=source,
+                        data_type="cache",
+                        results=[],
+                        success=False,
+                        error="replay_cache_miss"
+                    )
+                    for subject in misses
+                }
+            else:
+                fresh = query(misses)
+                if self.policy is IntelCachePolicy.ENABLED:
+                    for subject, result in fresh.items():
+                        if result.success:
+                            self._put(self.make_key(source, subject), result)
+            results.update(fresh)
+        
+        return {subject: results[subject] for subject in subjects}
+    
+    def _get(self, key: str, ttl: float) -> Optional[ExternalIntelResult]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT ts, result FROM intel WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"[IntelCache] Read failed: {e}")
+            return None
+        if row is None or time.time() - row[0] > ttl:
+            return None
+        try:
+            return ExternalIntelResult(**json.loads(row[1]))
+        except (ValueError, TypeError) as e:
+            # Corrupt row, or one written by an older schema: a miss
+            logger.warning(f"[IntelCache] Ignoring unreadable entry: {e}")
+            return None
+    
+    def _put(self, key: str, result: ExternalIntelResult) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO intel (key, ts, result) VALUES (?, ?, ?)",
+                    (key, time.time(), json.dumps(asdict(result)))
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"[IntelCache] Write failed: {e}")
+
+
 class CrtShConnector:
     """crt.sh certificate transparency connector"""
     
     BASE_URL = "https://crt.sh"
     
     @staticmethod
-    def query_domain(domain: str, timeout: int = 10) -> ExternalIntelResult:
+    def query_domain(domain: str, timeout: int = 10,
+                     session: Optional[requests.Session] = None) -> ExternalIntelResult:
         """Query crt.sh for certificate transparency logs"""
         try:
             url = f"{CrtShConnector.BASE_URL}/?q={domain}&output=json"
             
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract subdomains
-            subdomains = set()
-            for cert in data:
-                name_value = cert.get("name_value", "")
-                for subdomain in name_value.split('\n'):
-                    subdomain = subdomain.strip()
-                    if subdomain and not subdomain.startswith('*'):
-                        subdomains.add(subdomain)
+            # Popular domains return tens of MB; stream entries when ijson is present
+            with (session or requests).get(url, timeout=timeout, stream=ijson is not None) as response:
+                response.raise_for_status()
+                if ijson is not None:
+                    response.raw.decode_content = True
+                    subdomains = _crtsh_subdomains(ijson.items(response.raw, "item"))
+                else:
+                    subdomains = _crtsh_subdomains(_loads(response.content))
             
             results = [{"subdomain": sub} for sub in sorted(subdomains)]
             
@@ -83,10 +307,39 @@ class ShodanConnector:
     
     BASE_URL = "https://api.shodan.io"
     
+    # Free tier allows ~1 request/second
+    RATE_LIMIT_RPM = 60
+    
+    # IPs per comma-separated host lookup
+    BULK_SIZE = 100
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
+        self._bucket = TokenBucket(rpm=self.RATE_LIMIT_RPM)
     
-    def query_host(self, ip: str, timeout: int = 10) -> ExternalIntelResult:
+    @staticmethod
+    def _host_row(data: Dict) -> Dict:
+        """Host fields kept from a Shodan host record"""
+        return {
+            "ip": data.get("ip_str"),
+            "ports": data.get("ports", []),
+            "hostnames": data.get("hostnames", []),
+            "os": data.get("os"),
+            "tags": data.get("tags", [])
+        }
+    
+    @staticmethod
+    def _failed(error: str) -> ExternalIntelResult:
+        return ExternalIntelResult(
+            source="shodan",
+            data_type="host_info",
+            results=[],
+            success=False,
+            error=error
+        )
+    
+    def query_host(self, ip: str, timeout: int = 10,
+                   session: Optional[requests.Session] = None) -> ExternalIntelResult:
         """Query Shodan for host information"""
         if not self.api_key:
             return ExternalIntelResult(
@@ -100,18 +353,13 @@ class ShodanConnector:
         try:
             url = f"{self.BASE_URL}/shodan/host/{ip}?key={self.api_key}"
             
-            response = requests.get(url, timeout=timeout)
+            self._bucket.acquire()
+            response = (session or requests).get(url, timeout=timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _loads(response.content)
             
-            results = [{
-                "ip": data.get("ip_str"),
-                "ports": data.get("ports", []),
-                "hostnames": data.get("hostnames", []),
-                "os": data.get("os"),
-                "tags": data.get("tags", [])
-            }]
+            results = [self._host_row(data)]
             
             logger.info(f"[Shodan] Found data for {ip}")
             
@@ -147,6 +395,61 @@ class ShodanConnector:
                 success=False,
                 error=str(e)
             )
+    
+    def query_hosts(self, ips: List[str], timeout: int = 30,
+                    session: Optional[requests.Session] = None) -> Dict[str, ExternalIntelResult]:
+        """
+        Query Shodan for many hosts, BULK_SIZE IPs per request
+        
+        Shodan's host endpoint takes a comma-separated IP list, so N hosts
+        cost ceil(N / BULK_SIZE) requests and rate-limit tokens instead of N.
+        """
+        if not self.api_key:
+            return {ip: self._failed("api_key_required") for ip in ips}
+        
+        results: Dict[str, ExternalIntelResult] = {}
+        for start in range(0, len(ips), self.BULK_SIZE):
+            chunk = ips[start:start + self.BULK_SIZE]
+            try:
+                url = f"{self.BASE_URL}/shodan/host/{','.join(chunk)}?key={self.api_key}"
+                
+                self._bucket.acquire()
+                response = (session or requests).get(url, timeout=timeout)
+                response.raise_for_status()
+                
+                data = _loads(response.content)
+                # A single IP comes back as one record, several as a list
+                hosts = {host.get("ip_str"): host for host in (data if isinstance(data, list) else [data])}
+                
+                for ip in chunk:
+                    host = hosts.get(ip)
+                    if host is None:
+                        results[ip] = self._failed("ip_not_found")
+                        continue
+                    results[ip] = ExternalIntelResult(
+                        source="shodan",
+                        data_type="host_info",
+                        results=[self._host_row(host)],
+                        success=True
+                    )
+                
+                logger.info(f"[Shodan] Found data for {len(hosts)}/{len(chunk)} hosts")
+                
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 401:
+                    error = "invalid_api_key"
+                elif e.response.status_code == 404:
+                    error = "ip_not_found"
+                else:
+                    error = f"http_{e.response.status_code}"
+                
+                logger.warning(f"[Shodan] Error: {error}")
+                results.update({ip: self._failed(error) for ip in chunk})
+            except Exception as e:
+                logger.error(f"[Shodan] Error: {e}")
+                results.update({ip: self._failed(str(e)) for ip in chunk})
+        
+        return results
 
 
 class CensysConnector:
@@ -154,11 +457,39 @@ class CensysConnector:
     
     BASE_URL = "https://search.censys.io/api/v2"
     
+    # Censys search API allows ~0.4 requests/second
+    RATE_LIMIT_RPM = 24
+    
+    # IPs per search request (the search API's per_page maximum)
+    BULK_SIZE = 100
+    
     def __init__(self, api_id: Optional[str] = None, api_secret: Optional[str] = None):
         self.api_id = api_id
         self.api_secret = api_secret
+        self._bucket = TokenBucket(rpm=self.RATE_LIMIT_RPM)
+    
+    @staticmethod
+    def _host_row(result: Dict) -> Dict:
+        """Host fields kept from a Censys host record or search hit"""
+        return {
+            "ip": result.get("ip"),
+            "services": result.get("services", []),
+            "protocols": result.get("protocols", []),
+            "autonomous_system": result.get("autonomous_system", {})
+        }
+    
+    @staticmethod
+    def _failed(error: str) -> ExternalIntelResult:
+        return ExternalIntelResult(
+            source="censys",
+            data_type="host_info",
+            results=[],
+            success=False,
+            error=error
+        )
     
-    def query_host(self, ip: str, timeout: int = 10) -> ExternalIntelResult:
+    def query_host(self, ip: str, timeout: int = 10,
+                   session: Optional[requests.Session] = None) -> ExternalIntelResult:
         """Query Censys for host information"""
         if not self.api_id or not self.api_secret:
             return ExternalIntelResult(
@@ -172,22 +503,18 @@ class CensysConnector:
         try:
             url = f"{self.BASE_URL}/hosts/{ip}"
             
-            response = requests.get(
+            self._bucket.acquire()
+            response = (session or requests).get(
                 url,
                 auth=(self.api_id, self.api_secret),
                 timeout=timeout
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = _loads(response.content)
             result = data.get("result", {})
             
-            results = [{
-                "ip": result.get("ip"),
-                "services": result.get("services", []),
-                "protocols": result.get("protocols", []),
-                "autonomous_system": result.get("autonomous_system", {})
-            }]
+            results = [self._host_row(result)]
             
             logger.info(f"[Censys] Found data for {ip}")
             
@@ -223,6 +550,63 @@ class CensysConnector:
                 success=False,
                 error=str(e)
             )
+    
+    def query_hosts(self, ips: List[str], timeout: int = 30,
+                    session: Optional[requests.Session] = None) -> Dict[str, ExternalIntelResult]:
+        """
+        Query Censys for many hosts, BULK_SIZE IPs per search request
+        
+        Uses one "ip: a or ip: b ..." host search per chunk instead of a
+        host view per IP.
+        """
+        if not self.api_id or not self.api_secret:
+            return {ip: self._failed("api_credentials_required") for ip in ips}
+        
+        results: Dict[str, ExternalIntelResult] = {}
+        for start in range(0, len(ips), self.BULK_SIZE):
+            chunk = ips[start:start + self.BULK_SIZE]
+            try:
+                url = f"{self.BASE_URL}/hosts/search"
+                
+                self._bucket.acquire()
+                response = (session or requests).get(
+                    url,
+                    params={"q": " or ".join(f"ip: {ip}" for ip in chunk), "per_page": self.BULK_SIZE},
+                    auth=(self.api_id, self.api_secret),
+                    timeout=timeout
+                )
+                response.raise_for_status()
+                
+                data = _loads(response.content)
+                hits = {hit.get("ip"): hit for hit in data.get("result", {}).get("hits", [])}
+                
+                for ip in chunk:
+                    hit = hits.get(ip)
+                    if hit is None:
+                        results[ip] = self._failed("ip_not_found")
+                        continue
+                    results[ip] = ExternalIntelResult(
+                        source="censys",
+                        data_type="host_info",
+                        results=[self._host_row(hit)],
+                        success=True
+                    )
+                
+                logger.info(f"[Censys] Found data for {len(hits)}/{len(chunk)} hosts")
+                
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 401:
+                    error = "invalid_credentials"
+                else:
+                    error = f"http_{e.response.status_code}"
+                
+                logger.warning(f"[Censys] Error: {error}")
+                results.update({ip: self._failed(error) for ip in chunk})
+            except Exception as e:
+                logger.error(f"[Censys] Error: {e}")
+                results.update({ip: self._failed(str(e)) for ip in chunk})
+        
+        return results
 
 
 class ExternalIntelAggregator:
@@ -230,30 +614,103 @@ class ExternalIntelAggregator:
     
     def __init__(self, shodan_key: Optional[str] = None, 
                  censys_id: Optional[str] = None, 
-                 censys_secret: Optional[str] = None):
+                 censys_secret: Optional[str] = None,
+                 cache: Optional[IntelCache] = None):
         self.crtsh = CrtShConnector()
         self.shodan = ShodanConnector(api_key=shodan_key) if shodan_key else None
         self.censys = CensysConnector(api_id=censys_id, api_secret=censys_secret) if censys_id and censys_secret else None
+        self.session = self._create_session()
+        self.cache = cache or IntelCache()
     
-    def gather_intel(self, domain: str, ip: Optional[str] = None) -> Dict[str, ExternalIntelResult]:
-        """Gather intelligence from all available sources"""
-        results = {}
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Pooled session shared by all connectors (reuses TLS connections)"""
+        session = requests.Session()
+        # raise_on_status=False: exhausted retries surface as HTTPError via raise_for_status
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': 'VAPT-Intel/1.0'})
+        return session
+    
+    def _queries(self, domain: str, ip: Optional[str]) -> Dict[str, Callable[[], ExternalIntelResult]]:
+        """Bound query per available source, in report order"""
+        fetch = self.cache.fetch
         
         # crt.sh (always available, no API key)
-        crtsh_result = self.crtsh.query_domain(domain)
-        results["crtsh"] = crtsh_result
+        queries = {"crtsh": partial(
+            fetch, "crtsh", domain, partial(self.crtsh.query_domain, domain, session=self.session)
+        )}
         
         # Shodan (if API key provided)
         if self.shodan and ip:
-            shodan_result = self.shodan.query_host(ip)
-            results["shodan"] = shodan_result
+            queries["shodan"] = partial(
+                fetch, "shodan", ip, partial(self.shodan.query_host, ip, session=self.session)
+            )
         
         # Censys (if credentials provided)
         if self.censys and ip:
-            censys_result = self.censys.query_host(ip)
-            results["censys"] = censys_result
+            queries["censys"] = partial(
+                fetch, "censys", ip, partial(self.censys.query_host, ip, session=self.session)
+            )
         
-        return results
+        return queries
+    
+    def gather_intel(self, domain: str, ip: Optional[str] = None) -> Dict[str, ExternalIntelResult]:
+        """
+        Gather intelligence from all available sources
+        
+        Sources are queried concurrently, so latency is the slowest source
+        rather than the sum. Connectors never raise; failures come back as
+        unsuccessful results.
+        """
+        queries = self._queries(domain, ip)
+        with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+            futures = {source: pool.submit(query) for source, query in queries.items()}
+            return {source: future.result() for source, future in futures.items()}
+    
+    async def gather_intel_async(self, domain: str, ip: Optional[str] = None) -> Dict[str, ExternalIntelResult]:
+        """gather_intel for callers already running an event loop"""
+        queries = self._queries(domain, ip)
+        results = await asyncio.gather(*(asyncio.to_thread(query) for query in queries.values()))
+        return dict(zip(queries, results))
+    
+    def gather_intel_bulk(self, domain: str, ips: List[str]) -> Dict[str, ExternalIntelResult]:
+        """
+        gather_intel for many IPs at once
+        
+        Shodan and Censys are queried through their multi-host lookups
+        (cache misses only), and each source's per-IP results are merged
+        into one result, so the output feeds to_cache_signals unchanged.
+        """
+        ips = list(dict.fromkeys(ip for ip in ips if ip))
+        fetch = self.cache.fetch
+        
+        queries = {"crtsh": partial(
+            fetch, "crtsh", domain, partial(self.crtsh.query_domain, domain, session=self.session)
+        )}
+        if self.shodan and ips:
+            queries["shodan"] = partial(self._bulk_hosts, "shodan", self.shodan, ips)
+        if self.censys and ips:
+            queries["censys"] = partial(self._bulk_hosts, "censys", self.censys, ips)
+        
+        with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+            futures = {source: pool.submit(query) for source, query in queries.items()}
+            return {source: future.result() for source, future in futures.items()}
+    
+    def _bulk_hosts(self, source: str, connector, ips: List[str]) -> ExternalIntelResult:
+        """Cached multi-host lookup, merged into a single result"""
+        per_ip = self.cache.fetch_many(
+            source, ips, partial(connector.query_hosts, session=self.session)
+        )
+        found = [result for result in per_ip.values() if result.success]
+        return ExternalIntelResult(
+            source=source,
+            data_type="host_info",
+            results=[row for result in found for row in result.results],
+            success=bool(found),
+            error=None if found else next((r.error for r in per_ip.values()), None)
+        )
     
     def to_cache_signals(self, intel_results: Dict[str, ExternalIntelResult], cache) -> None:
         """Convert external intel to cache signals (read-only, tagged)"""
@@ -267,25 +724,22 @@ class ExternalIntelAggregator:
             
             # crt.sh subdomains
             if source == "crtsh":
-                for item in result.results:
-                    subdomain = item.get("subdomain")
-                    if subdomain:
-                        cache.subdomains.add(subdomain)
-                        cache.add_param(f"subdomain_{subdomain}")
+                subdomains = {item["subdomain"] for item in result.results if item.get("subdomain")}
+                cache.subdomains.update(subdomains)
+                cache.add_params_bulk([f"subdomain_{subdomain}" for subdomain in subdomains])
             
             # Shodan/Censys ports and services
             elif source in ["shodan", "censys"]:
-                for item in result.results:
-                    # Ports
-                    ports = item.get("ports", [])
-                    for port in ports:
-                        cache.discovered_ports.add(port)
-                    
-                    # Services
-                    services = item.get("services", [])
-                    for service in services:
-                        service_name = service.get("service_name") if isinstance(service, dict) else service
-                        if service_name:
-                            cache.add_param(f"external_service_{service_name}")
+                # Ports
+                cache.discovered_ports.update(
+                    port for item in result.results for port in item.get("ports", [])
+                )
+                
+                # Services
+                service_names = (
+                    service.get("service_name") if isinstance(service, dict) else service
+                    for item in result.results for service in item.get("services", [])
+                )
+                cache.add_params_bulk([f"external_service_{name}" for name in service_names if name])
         
         logger.info(f"[ExternalIntel] Added signals from {len([r for r in intel_results.values() if r.success])} sources")
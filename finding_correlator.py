@@ -18,15 +18,36 @@ Correlation Model:
     └── Status: CONFIRMED (multiple tools agree)
 """
 
+import json
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import Dict, List, Set, Optional, Tuple
 from enum import Enum
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson  # Optional: faster report serialization
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# (epoch second, ISO string) for the last timestamp handed out
+_iso_second: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, formatted at most once per second"""
+    global _iso_second
+    second = int(time.time())
+    cached = _iso_second
+    if cached[0] != second:
+        cached = _iso_second = (second, datetime.fromtimestamp(second).isoformat())
+    return cached[1]
+
 
 class CorrelationStatus(Enum):
     """How correlated finding is"""
@@ -36,7 +57,7 @@ class CorrelationStatus(Enum):
     FALSE_POSITIVE = "false_positive"     # Contradictory evidence
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolReport:
     """Single tool's report of a finding"""
     tool_name: str
@@ -45,7 +66,7 @@ class ToolReport:
     vulnerability_type: str = ""
     severity: str = "MEDIUM"
     evidence: str = ""
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=_now_iso)
     success_indicator: Optional[str] = None  # confirmed_reflected, error_based, etc.
 
     def to_dict(self) -> Dict:
@@ -60,7 +81,7 @@ class ToolReport:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrelatedFinding:
     """De-duplicated, correlated finding from multiple tools"""
     finding_id: str
@@ -75,6 +96,8 @@ class CorrelatedFinding:
     status: CorrelationStatus = CorrelationStatus.SINGLE_TOOL
     tool_count: int = 1
     tools: Set[str] = field(default_factory=set)
+    _has_confirmed: bool = field(default=False, init=False, repr=False)
+    _severity_conflict: bool = field(default=False, init=False, repr=False)
     
     # Assessment
     is_false_positive: bool = False
@@ -87,31 +110,34 @@ class CorrelatedFinding:
     risk: str = "MEDIUM"
     
     # Metadata
-    first_seen: str = field(default_factory=lambda: datetime.now().isoformat())
-    last_seen: str = field(default_factory=lambda: datetime.now().isoformat())
+    first_seen: str = field(default_factory=_now_iso)
+    last_seen: str = field(default_factory=_now_iso)
     
 
     def add_report(self, report: ToolReport):
         """Add tool report to finding"""
+        if self.tool_reports and report.severity != self.tool_reports[0].severity:
+            self._severity_conflict = True
         self.tool_reports.append(report)
-        self.tools.add(report.tool_name)
-        self.tool_count = len(self.tools)
-        self.last_seen = datetime.now().isoformat()
+        if report.tool_name not in self.tools:
+            self.tools.add(report.tool_name)
+            self.tool_count = len(self.tools)
+        self.last_seen = _now_iso()
+        
+        # Only the new report can change whether any report confirmed success
+        success = report.success_indicator
+        if success is True or (isinstance(success, str) and "confirmed" in success.lower()):
+            self._has_confirmed = True
         
         # Update status based on corroboration
         if self.tool_count == 1:
             self.status = CorrelationStatus.SINGLE_TOOL
-        elif self.tool_count >= 2:
+        elif self._has_confirmed:
+            # Multiple tools and a confirmed success
+            self.status = CorrelationStatus.CONFIRMED
+        else:
             # Multiple tools = corroborated
             self.status = CorrelationStatus.CORROBORATED
-            
-            # If any has confirmed success, mark as CONFIRMED
-            if any(
-                r.success_indicator is True or
-                (isinstance(r.success_indicator, str) and "confirmed" in r.success_indicator.lower())
-                for r in self.tool_reports
-            ):
-                self.status = CorrelationStatus.CONFIRMED
 
     def to_dict(self) -> Dict:
         return {
@@ -172,18 +198,35 @@ class FindingCorrelator:
             print(f"  Confidence: {f.confidence} (corroboration: {f.status.value})")
     """
 
+    # Tool names and vuln types repeat across reports; lower-case each once
+    _lower_cache: Dict[str, str] = {}
+
     def __init__(self):
         # Deduplication key: (endpoint, parameter, vuln_type) -> CorrelatedFinding
         self.findings: Dict[Tuple[str, Optional[str], str], CorrelatedFinding] = {}
         
+        # By finding ID (for enrichment lookups)
+        self._by_id: Dict[str, CorrelatedFinding] = {}
+        
         # By OWASP category
         self.by_owasp: Dict[str, List[CorrelatedFinding]] = defaultdict(list)
         
-        # By tool
-        self.by_tool: Dict[str, List[CorrelatedFinding]] = defaultdict(list)
+        # By tool: finding_id -> CorrelatedFinding, one entry per finding
+        self.by_tool: Dict[str, Dict[str, CorrelatedFinding]] = defaultdict(dict)
+        
+        # By status: finding_id -> CorrelatedFinding, kept current by _restatus
+        self._by_status: Dict[CorrelationStatus, Dict[str, CorrelatedFinding]] = defaultdict(dict)
         
         # Tracking
         self._next_id = 0
+        
+        # Summary counters, kept current by _tally
+        self._counters: Dict[str, int] = {
+            "single_tool": 0,
+            "corroborated": 0,
+            "confirmed": 0,
+            "false_positive": 0,
+        }
 
     def add_report(self, tool: str, endpoint: str, parameter: Optional[str],
                   vuln_type: str, severity: str = "MEDIUM", 
@@ -206,23 +249,28 @@ class FindingCorrelator:
         # Normalize
         endpoint = self._normalize_endpoint(endpoint)
         parameter = parameter.strip() if parameter else None
-        vuln_type = vuln_type.lower()
-        tool = tool.lower()
+        vuln_type = self._lower(vuln_type)
+        tool = self._lower(tool)
 
-        # Deduplication key
+        # Deduplication key; endpoint and vuln_type are the memoized string
+        # objects, so repeat lookups hit the identity fast path on compare
         key = (endpoint, parameter, vuln_type)
 
         # Get or create finding
-        if key not in self.findings:
-            self.findings[key] = CorrelatedFinding(
+        finding = self.findings.get(key)
+        previous_status = finding.status if finding is not None else None
+        if finding is None:
+            finding = CorrelatedFinding(
                 finding_id=f"finding_{self._next_id}",
                 vuln_type=vuln_type,
                 endpoint=endpoint,
                 parameter=parameter
             )
+            self.findings[key] = finding
+            self._by_id[finding.finding_id] = finding
             self._next_id += 1
-
-        finding = self.findings[key]
+        else:
+            self._tally(finding, -1)
 
         # Add report
         report = ToolReport(
@@ -235,9 +283,12 @@ class FindingCorrelator:
             success_indicator=success_indicator
         )
         finding.add_report(report)
+        self._tally(finding, 1)
+        if finding.status != previous_status:
+            self._restatus(finding, previous_status)
 
         # Track by tool
-        self.by_tool[tool].append(finding)
+        self.by_tool[tool][finding.finding_id] = finding
 
         logger.info(f"[Correlator] Added report: {tool} found {vuln_type} on {endpoint}"
                    f" (tools now: {finding.tool_count})")
@@ -246,24 +297,42 @@ class FindingCorrelator:
 
     def link_owasp(self, finding_id: str, owasp_category: str, cwe: str = ""):
         """Link finding to OWASP category"""
-        for finding in self.findings.values():
-            if finding.finding_id == finding_id:
-                finding.owasp_category = owasp_category
-                finding.cwe = cwe
-                if owasp_category not in self.by_owasp:
-                    self.by_owasp[owasp_category] = []
-                self.by_owasp[owasp_category].append(finding)
-                return
+        finding = self._by_id.get(finding_id)
+        if finding is None:
+            return
+        finding.owasp_category = owasp_category
+        finding.cwe = cwe
+        self.by_owasp[owasp_category].append(finding)
 
     def mark_false_positive(self, finding_id: str, reason: str):
         """Mark finding as false positive"""
-        for finding in self.findings.values():
-            if finding.finding_id == finding_id:
-                finding.is_false_positive = True
-                finding.fp_reason = reason
-                finding.status = CorrelationStatus.FALSE_POSITIVE
-                logger.info(f"[Correlator] Marked {finding_id} as false positive: {reason}")
-                return
+        finding = self._by_id.get(finding_id)
+        if finding is None:
+            return
+        previous_status = finding.status
+        self._tally(finding, -1)
+        finding.is_false_positive = True
+        finding.fp_reason = reason
+        finding.status = CorrelationStatus.FALSE_POSITIVE
+        self._tally(finding, 1)
+        if previous_status != CorrelationStatus.FALSE_POSITIVE:
+            self._restatus(finding, previous_status)
+        logger.info(f"[Correlator] Marked {finding_id} as false positive: {reason}")
+
+    def _tally(self, finding: CorrelatedFinding, delta: int):
+        """Add (delta=1) or remove (delta=-1) a finding's summary contribution"""
+        counters = self._counters
+        counters["single_tool" if finding.tool_count == 1 else "corroborated"] += delta
+        if finding.status == CorrelationStatus.CONFIRMED:
+            counters["confirmed"] += delta
+        if finding.is_false_positive:
+            counters["false_positive"] += delta
+
+    def _restatus(self, finding: CorrelatedFinding, previous: Optional[CorrelationStatus]):
+        """Move finding from its previous status bucket to its current one"""
+        if previous is not None:
+            self._by_status[previous].pop(finding.finding_id, None)
+        self._by_status[finding.status][finding.finding_id] = finding
 
     def get_findings(self) -> List[CorrelatedFinding]:
         """Get all correlated findings"""
@@ -271,7 +340,7 @@ class FindingCorrelator:
 
     def get_findings_by_status(self, status: CorrelationStatus) -> List[CorrelatedFinding]:
         """Get findings by correlation status"""
-        return [f for f in self.findings.values() if f.status == status]
+        return list(self._by_status.get(status, {}).values())
 
     def get_corroborated_findings(self) -> List[CorrelatedFinding]:
         """Get findings with multiple tools (corroborated)"""
@@ -283,33 +352,25 @@ class FindingCorrelator:
 
     def get_findings_by_tool(self, tool: str) -> List[CorrelatedFinding]:
         """Get findings reported by specific tool"""
-        return self.by_tool.get(tool.lower(), [])
+        return list(self.by_tool.get(tool.lower(), {}).values())
 
     def get_summary(self) -> Dict:
         """Get correlation summary"""
-        all_findings = self.get_findings()
-        corroborated = self.get_corroborated_findings()
-        false_positives = [f for f in all_findings if f.is_false_positive]
-        confirmed = [f for f in all_findings if f.status == CorrelationStatus.CONFIRMED]
+        counters = self._counters
 
         return {
-            "total_findings": len(all_findings),
+            "total_findings": len(self.findings),
             "unique_vulnerabilities": len(self.findings),
-            "corroborated_findings": len(corroborated),
-            "confirmed_findings": len(confirmed),
-            "false_positives": len(false_positives),
+            "corroborated_findings": counters["corroborated"],
+            "confirmed_findings": counters["confirmed"],
+            "false_positives": counters["false_positive"],
             "by_owasp": {
                 cat: len(findings) for cat, findings in self.by_owasp.items()
             },
             "by_tool": {
                 tool: len(findings) for tool, findings in self.by_tool.items()
             },
-            "by_status": {
-                "single_tool": len([f for f in all_findings if f.tool_count == 1]),
-                "corroborated": len(corroborated),
-                "confirmed": len(confirmed),
-                "false_positive": len(false_positives)
-            }
+            "by_status": dict(counters)
         }
 
     def deduplicate(self) -> int:
@@ -322,16 +383,12 @@ class FindingCorrelator:
         issues_found = 0
 
         for finding in self.findings.values():
-            # Check for conflicting evidence
-            if len(finding.tool_reports) > 1:
-                # Multiple reports for same finding
+            # Check for conflicting evidence (tracked as reports are added)
+            if finding._severity_conflict:
+                # Different severity levels = potential conflicting reports
                 severities = [r.severity for r in finding.tool_reports]
-                
-                # Flag if conflicting
-                if len(set(severities)) > 1:
-                    # Different severity levels = potential conflicting reports
-                    logger.warning(f"[Correlator] Conflicting severity for {finding.finding_id}: {severities}")
-                    issues_found += 1
+                logger.warning(f"[Correlator] Conflicting severity for {finding.finding_id}: {severities}")
+                issues_found += 1
 
         logger.info(f"[Correlator] Deduplication found {issues_found} issues")
         return issues_found
@@ -347,7 +404,23 @@ class FindingCorrelator:
             }
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize all findings to JSON (orjson if installed, else stdlib json)"""
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data).encode("utf-8")
+
+    @classmethod
+    def _lower(cls, value: str) -> str:
+        """Lower-case value, memoized across correlators"""
+        lowered = cls._lower_cache.get(value)
+        if lowered is None:
+            lowered = cls._lower_cache[value] = value.lower()
+        return lowered
+
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_endpoint(endpoint: str) -> str:
         """Normalize endpoint path"""
         if not endpoint:
@@ -357,7 +430,7 @@ class FindingCorrelator:
             ep = "/" + ep
         # Remove query string for deduplication key
         if "?" in ep:
-            ep = ep.split("?")[0]
+            ep = ep.partition("?")[0]
         # Normalize trailing slash
         if len(ep) > 1 and ep.endswith("/"):
             ep = ep.rstrip("/")
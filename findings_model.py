@@ -2,9 +2,14 @@
 Normalized findings model: deduplicated, OWASP-mapped, actionable intelligence.
 """
 
-from dataclasses import dataclass, field
+import json
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Set, List, Optional
+from types import MappingProxyType
+from typing import Iterable, List, Optional, Tuple
 from datetime import datetime
 
 
@@ -14,6 +19,15 @@ class Severity(Enum):
     MEDIUM = "MEDIUM"
     LOW = "LOW"
     INFO = "INFO"
+    
+    # Members are singletons compared by identity; hash by identity in C
+    # instead of Enum's Python-level hash(self._name_)
+    __hash__ = object.__hash__
+
+
+# Most to least severe
+_SEV_ORDER = (Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO)
+_SEV_RANK = {sev: rank for rank, sev in enumerate(_SEV_ORDER)}
 
 
 class FindingType(Enum):
@@ -29,9 +43,26 @@ class FindingType(Enum):
     OUTDATED_SOFTWARE = "Outdated Software"
     WEAK_CRYPTO = "Weak Cryptography"
     OTHER = "Other"
+    
+    __hash__ = object.__hash__  # See Severity
+
+
+# Member -> value, a dict hit instead of the Enum .value descriptor per export
+_SEV_VALUE = {s: s.value for s in Severity}
+_FT_VALUE = {t: t.value for t in FindingType}
+
+# Exported string -> member, by value or by name, for rebuilding from dicts
+_SEV_LOOKUP = {**{s.name: s for s in Severity}, **{s.value: s for s in Severity}}
+_FT_LOOKUP = {**{t.name: t for t in FindingType}, **{t.value: t for t in FindingType}}
 
+# Finding fields drawn from a small vocabulary (tools, CWEs, templates, endpoints)
+_INTERNED_FIELDS = ("location", "cwe", "owasp", "tool", "remediation")
 
-@dataclass(frozen=True)
+# Longest evidence any consumer reads (correlation input); exports cut to 200
+EVIDENCE_MAX = 500
+
+
+@dataclass(frozen=True, slots=True)
 class Finding:
     """
     Immutable finding record.
@@ -47,17 +78,66 @@ class Finding:
     tool: str = "unknown"
     evidence: str = ""
     remediation: str = ""
-    discovered_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    discovered_at: Optional[str] = None  # ISO string; see discovered_iso()
+    _created: float = field(default_factory=time.time, repr=False, compare=False)
+    _key: Tuple[FindingType, str, Optional[str]] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Share one copy of each repeated string across findings
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+        # Raw tool output can be large; keep only what is ever read back
+        if type(self.evidence) is str and len(self.evidence) > EVIDENCE_MAX:
+            object.__setattr__(self, "evidence", self.evidence[:EVIDENCE_MAX])
+        # Dedup fields never change (frozen), so build the key and hash once
+        key = (self.type, self.location, self.cwe)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", hash(key))
+    
+    def discovered_iso(self) -> str:
+        """discovered_at, formatted from the creation time on first use"""
+        if self.discovered_at is None:
+            object.__setattr__(self, "discovered_at", datetime.fromtimestamp(self._created).isoformat())
+        return self.discovered_at
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Finding":
+        """Rebuild a finding from an exported dict; unknown type/severity fall back to OTHER/INFO"""
+        f_type = data.get("type")
+        f_sev = data.get("severity")
+        return cls(
+            type=_FT_LOOKUP.get(f_type, FindingType.OTHER) if isinstance(f_type, str) else FindingType.OTHER,
+            severity=_SEV_LOOKUP.get(f_sev, Severity.INFO) if isinstance(f_sev, str) else Severity.INFO,
+            location=data.get("location", ""),
+            description=data.get("description", ""),
+            cwe=data.get("cwe"),
+            owasp=data.get("owasp"),
+            tool=data.get("tool", "unknown"),
+            evidence=data.get("evidence", ""),
+            remediation=data.get("remediation", ""),
+            discovered_at=data.get("discovered_at"),
+        )
+    
+    def __reduce__(self):
+        # Rebuild through __init__: _hash is only valid in the process that computed it
+        return (self.__class__, tuple(getattr(self, f.name) for f in fields(self) if f.init))
     
     def __hash__(self):
         """Deduplication hash: type + location + CWE"""
-        return hash((self.type, self.location, self.cwe))
+        return self._hash
     
     def __eq__(self, other):
         """Deduplication equality: only type, location, CWE matter"""
+        if self is other:
+            return True
         if not isinstance(other, Finding):
             return False
-        return (self.type, self.location, self.cwe) == (other.type, other.location, other.cwe)
+        if self._hash != other._hash:
+            return False
+        return self._key == other._key
 
 
 class FindingsRegistry:
@@ -66,20 +146,45 @@ class FindingsRegistry:
     """
     
     def __init__(self):
-        self._findings: Set[Finding] = set()
+        # Dedup key (type, location, cwe) -> first finding seen with it
+        self._index: dict[Tuple[FindingType, str, Optional[str]], Finding] = {}
         self._by_severity: dict[Severity, List[Finding]] = {s: [] for s in Severity}
+        self._counts: dict[Severity, int] = {s: 0 for s in Severity}
     
     def add(self, finding: Finding) -> bool:
         """
         Add finding to registry. Returns True if new, False if duplicate.
         """
-        if finding in self._findings:
+        key = finding._key
+        if key in self._index:
             return False  # Duplicate
         
-        self._findings.add(finding)
+        self._index[key] = finding
         self._by_severity[finding.severity].append(finding)
+        self._counts[finding.severity] += 1
         return True
     
+    def bulk_add(self, findings: Iterable[Finding]) -> int:
+        """
+        Add a batch of findings (e.g. one tool run). Returns the number that
+        were new; severity buckets are extended once per batch.
+        """
+        index = self._index
+        by_sev = defaultdict(list)
+        for finding in findings:
+            key = finding._key
+            if key in index:
+                continue
+            index[key] = finding
+            by_sev[finding.severity].append(finding)
+        
+        added = 0
+        for sev, group in by_sev.items():
+            self._by_severity[sev].extend(group)
+            self._counts[sev] += len(group)
+            added += len(group)
+        return added
+    
     def deduplicate_nuclei(self, tool_findings: List[Finding]) -> List[Finding]:
         """Deduplicate nuclei findings within a tool run.
         
@@ -94,16 +199,14 @@ class FindingsRegistry:
             else:
                 # Keep higher severity
                 existing = by_location[key]
-                sev_order = [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO]
-                if sev_order.index(f.severity) < sev_order.index(existing.severity):
+                if _SEV_RANK[f.severity] < _SEV_RANK[existing.severity]:
                     by_location[key] = f
         
         return list(by_location.values())
     
     def get_all(self) -> List[Finding]:
         """Get all findings (sorted by severity)"""
-        order = [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO]
-        return [f for sev in order for f in self._by_severity[sev]]
+        return [f for sev in _SEV_ORDER for f in self._by_severity[sev]]
     
     def get_by_severity(self, severity: Severity) -> List[Finding]:
         """Get findings by severity"""
@@ -111,11 +214,11 @@ class FindingsRegistry:
     
     def count_by_severity(self) -> dict[Severity, int]:
         """Count findings by severity"""
-        return {sev: len(findings) for sev, findings in self._by_severity.items()}
+        return self._counts.copy()
     
     def has_critical(self) -> bool:
         """Check if any critical findings exist"""
-        return len(self._by_severity[Severity.CRITICAL]) > 0
+        return self._counts[Severity.CRITICAL] > 0
     
     def summary(self) -> str:
         """Human-readable summary"""
@@ -128,32 +231,49 @@ class FindingsRegistry:
             f"Info: {counts[Severity.INFO]}"
         )
     
+    @staticmethod
+    def _finding_dict(f: Finding) -> dict:
+        """Export one finding for JSON serialization"""
+        return {
+            "type": _FT_VALUE[f.type],
+            "severity": _SEV_VALUE[f.severity],
+            "location": f.location,
+            "description": f.description,
+            "cwe": f.cwe,
+            "owasp": f.owasp.value if isinstance(f.owasp, Enum) else f.owasp,
+            "tool": f.tool,
+            "evidence": f.evidence[:200],  # Truncate
+            "remediation": f.remediation,
+            "discovered_at": f.discovered_iso(),
+        }
+    
     def to_dict(self) -> dict:
         """Export to dict for JSON serialization"""
-        from enum import Enum
         return {
-            "total": len(self._findings),
-            "by_severity": {s.value: len(f) for s, f in self._by_severity.items()},
-            "findings": [
-                {
-                    "type": f.type.value,
-                    "severity": f.severity.value,
-                    "location": f.location,
-                    "description": f.description,
-                    "cwe": f.cwe,
-                    "owasp": f.owasp.value if isinstance(f.owasp, Enum) else f.owasp,
-                    "tool": f.tool,
-                    "evidence": f.evidence[:200],  # Truncate
-                    "remediation": f.remediation,
-                    "discovered_at": f.discovered_at,
-                }
-                for f in self.get_all()
-            ],
+            "total": len(self._index),
+            "by_severity": {_SEV_VALUE[s]: n for s, n in self._counts.items()},
+            "findings": [self._finding_dict(f) for f in self.get_all()],
         }
+    
+    def to_json_stream(self, fp) -> None:
+        """
+        Write json.dumps(self.to_dict()) to a text file object, one finding
+        at a time, so the full export is never held in memory.
+        """
+        fp.write(f'{{"total": {len(self._index)}, "by_severity": ')
+        fp.write(json.dumps({_SEV_VALUE[s]: n for s, n in self._counts.items()}))
+        fp.write(', "findings": [')
+        separator = ""
+        for sev in _SEV_ORDER:
+            for f in self._by_severity[sev]:
+                fp.write(separator)
+                fp.write(json.dumps(self._finding_dict(f)))
+                separator = ", "
+        fp.write("]}")
 
 
-# OWASP Top 10 2021 Mapping
-OWASP_2021_MAP = {
+# OWASP Top 10 2021 Mapping (read-only)
+OWASP_2021_MAP = MappingProxyType({
     FindingType.AUTH_BYPASS: "A07:2021 - Identification and Authentication Failures",
     FindingType.IDOR: "A01:2021 - Broken Access Control",
     FindingType.XSS: "A03:2021 - Injection",
@@ -165,7 +285,7 @@ OWASP_2021_MAP = {
     FindingType.WEAK_CRYPTO: "A02:2021 - Cryptographic Failures",
     FindingType.OUTDATED_SOFTWARE: "A06:2021 - Vulnerable and Outdated Components",
     FindingType.SSRF: "A10:2021 - Server-Side Request Forgery",
-}
+})
 
 
 def map_to_owasp(finding_type: FindingType) -> str:
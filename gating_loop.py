@@ -39,9 +39,11 @@ for url in sql_endpoints:
 """
 
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+import threading
+from typing import Dict, Iterator, List, Tuple, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 
@@ -55,38 +57,162 @@ class TargetingStrategy(Enum):
     API = "api"           # API-specific (OpenAPI endpoints)
 
 
-@dataclass
+# Member -> value, a dict hit instead of the Enum .value descriptor per export
+_STRATEGY_VALUES = {s: s.value for s in TargetingStrategy}
+
+
+class _ParamMap(dict):
+    """
+    url → parameter names, keeping a running total as it is mutated
+    
+    Names are stored as tuples so the total cannot go stale through an
+    in-place list edit; replace a URL's names (or use add_parameter).
+    """
+    __slots__ = ("count",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.count = 0
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, url: str, names) -> None:
+        names = tuple(names)
+        self.count += len(names) - len(self.get(url, ()))
+        super().__setitem__(url, names)
+
+    def __delitem__(self, url: str) -> None:
+        self.count -= len(self[url])
+        super().__delitem__(url)
+
+    def __reduce__(self):
+        # Rebuild through __init__ so count is recomputed (pickle, copy)
+        return _ParamMap, (dict(self),)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        for url, names in dict(*args, **kwargs).items():
+            self[url] = names
+
+    def setdefault(self, url: str, default=()):
+        if url not in self:
+            self[url] = default
+        return self[url]
+
+    def pop(self, url: str, *default):
+        if url not in self:
+            if default:
+                return default[0]
+            raise KeyError(url)
+        names = self[url]
+        del self[url]
+        return names
+
+    def popitem(self):
+        url, names = super().popitem()
+        self.count -= len(names)
+        return url, names
+
+    def clear(self) -> None:
+        super().clear()
+        self.count = 0
+
+
+@dataclass(slots=True)
 class ToolTargets:
     """Per-tool targeting information"""
     tool_name: str
     can_run: bool
     target_urls: List[str] = field(default_factory=list)
-    parameters: Dict[str, List[str]] = field(default_factory=dict)  # url → param list
+    parameters: Dict[str, Tuple[str, ...]] = field(default_factory=_ParamMap)  # url → param names
     forms: Dict[str, List[Dict]] = field(default_factory=dict)      # url → form data
     reflections: List[str] = field(default_factory=list)            # Reflected URLs
     strategy: TargetingStrategy = TargetingStrategy.TEMPLATE
     priority: int = 0
     reason: str = ""
 
+    def __post_init__(self):
+        if not isinstance(self.parameters, _ParamMap):
+            self.parameters = _ParamMap(self.parameters)
+
+    @property
+    def param_count(self) -> int:
+        """Total parameters across target URLs (kept up to date as parameters changes)"""
+        params = self.parameters
+        if isinstance(params, _ParamMap):
+            return params.count
+        return sum(map(len, params.values()))  # Plain dict assigned after init
+
+    def add_parameter(self, url: str, name: str) -> None:
+        """Record a parameter for url"""
+        params = self.parameters
+        params[url] = (*params.get(url, ()), name)
+
     def __repr__(self) -> str:
         return (f"ToolTargets({self.tool_name}, can_run={self.can_run}, "
-                f"targets={len(self.target_urls)}, params={sum(len(p) for p in self.parameters.values())})")
+                f"targets={len(self.target_urls)}, params={self.param_count})")
 
-    def to_dict(self) -> dict:
-        return {
+    def to_dict(self, *, inline_urls: bool = True, max_urls: Optional[int] = None) -> dict:
+        """
+        Export as dict
+        
+        Args:
+            inline_urls: False to emit only target/reflection counts, not the lists
+            max_urls: Cap on inlined targets/reflections; capped lists are
+                flagged with 'targets_truncated' / 'reflections_truncated'
+        """
+        urls, reflections = self.target_urls, self.reflections
+        export = {
             'tool': self.tool_name,
             'can_run': self.can_run,
-            'target_count': len(self.target_urls),
-            'targets': self.target_urls,
-            'param_count': sum(len(p) for p in self.parameters.values()),
+            'target_count': len(urls),
+            'targets': urls,
+            'param_count': self.param_count,
             'parameters': self.parameters,
             'forms': self.forms,
-            'reflection_count': len(self.reflections),
-            'reflections': self.reflections,
-            'strategy': self.strategy.value,
+            'reflection_count': len(reflections),
+            'reflections': reflections,
+            'strategy': _STRATEGY_VALUES[self.strategy],
             'priority': self.priority,
             'reason': self.reason
         }
+        if not inline_urls:
+            del export['targets'], export['reflections']
+        elif max_urls is not None:
+            if len(urls) > max_urls:
+                export['targets'] = urls[:max_urls]
+                export['targets_truncated'] = True
+            if len(reflections) > max_urls:
+                export['reflections'] = reflections[:max_urls]
+                export['reflections_truncated'] = True
+        return export
+
+
+# Payload tools: (tool, strategy, count signal, reflection list signal,
+# target label, enabled reason, disabled reason). Label and enabled reason
+# are %-templates over {'count', 'names'}.
+_TOOL_SPECS = (
+    ("xsstrike", TargetingStrategy.XSS, 'reflection_count', 'reflectable_params', "[%(count)s reflection endpoints]",
+     "Reflection endpoints: %(count)s identified", "No reflectable parameters (crawl)"),
+    ("dalfox", TargetingStrategy.XSS, 'reflection_count', 'reflectable_params', "[%(count)s reflection endpoints]",
+     "XSS testing on %(count)s reflection endpoints", "No reflection endpoints"),
+    ("sqlmap", TargetingStrategy.SQL, 'parameter_count', None, "[%(count)s parameter-carrying endpoints]",
+     "SQL injection on %(count)s parameters (%(names)s)", "No parameters discovered"),
+    ("commix", TargetingStrategy.COMMIX, 'parameter_count', None, "[%(count)s parameter-carrying endpoints]",
+     "Command injection on %(count)s parameters", "No parameters or tool disabled"),
+)
+
+_TOOL_NAMES = tuple(spec[0] for spec in _TOOL_SPECS)
+
+
+def _signal_fingerprint(spec: tuple, gating: dict) -> tuple:
+    """Crawl signals a _TOOL_SPECS entry's decision and targets derive from"""
+    signal_key, list_key = spec[2], spec[3]
+    if list_key:  # Reflection-driven (XSS); forms also enable it
+        return (gating.get(signal_key), gating.get('has_forms'), tuple(gating.get(list_key, ())))
+    return (gating.get(signal_key), tuple(gating.get('parameter_names', ())))
 
 
 class GatingLoopOrchestrator:
@@ -113,6 +239,18 @@ class GatingLoopOrchestrator:
         self.adapter = crawl_adapter
         self.graph = endpoint_graph
         self._targets_cache: Dict[str, ToolTargets] = {}
+        self._decision_cache: Dict[str, bool] = {}  # tool → crawl-gated decision
+        # Ledger decisions can change after build (record_tool_decision); caches
+        # derived from it are tied to the ledger version they were filled at
+        self._ledger_version = self._current_ledger_version()
+        self._targets_version = None
+        self._signal_prints: Dict[str, tuple] = {}  # tool → signals its targets were built from
+        self._build_lock = threading.Lock()
+        self._priorities: Optional[Dict[str, int]] = None
+        self._summary_cache: Optional[str] = None
+        self._summary_for: Optional[Dict[str, ToolTargets]] = None  # targets it was built from
+        self._name_order: List[str] = []                # tool names, alphabetical
+        self._priority_order: List[ToolTargets] = []    # runnable tools, highest priority first
         
         logger.info("[GatingLoop] Initialized with decision ledger and crawl adapter")
 
@@ -129,86 +267,89 @@ class GatingLoopOrchestrator:
                 print(f"{tool}: {len(targets.target_urls)} endpoints")
         """
         gating = self.adapter.gating_signals
+        param_names = gating.get('parameter_names', [])
+        priorities = self._tool_priorities()
         targets_map = {}
 
-        logger.info(f"[GatingLoop] Building targets for {gating.get('crawled_url_count', 0)} endpoints, "
-                   f"{gating['parameter_count']} parameters, {gating['reflection_count']} reflections")
-
-        # === XSSTRIKE ===
-        xss_targets = ToolTargets(
-            tool_name="xsstrike",
-            can_run=self.ledger.should_run_payload_tool_with_crawl("xsstrike", self.adapter),
-            strategy=TargetingStrategy.XSS
-        )
-        if xss_targets.can_run:
-            # Note: we don't have specific endpoint URLs from basic gating signals
-            # In production, you'd integrate with endpoint_param_graph.py for detailed URLs
-            xss_targets.target_urls = [f"[{gating['reflection_count']} reflection endpoints]"]
-            xss_targets.reflections = gating.get('reflectable_params', [])
-            xss_targets.priority = self.ledger.get_priority("xsstrike")
-            xss_targets.reason = f"Reflection endpoints: {gating['reflection_count']} identified"
-            logger.info(f"[GatingLoop] xsstrike ENABLED: {gating['reflection_count']} reflection targets")
-        else:
-            xss_targets.reason = "No reflectable parameters (crawl)"
-            logger.info(f"[GatingLoop] xsstrike DISABLED: {xss_targets.reason}")
-
-        targets_map["xsstrike"] = xss_targets
-
-        # === DALFOX ===
-        dalfox_targets = ToolTargets(
-            tool_name="dalfox",
-            can_run=self.ledger.should_run_payload_tool_with_crawl("dalfox", self.adapter),
-            strategy=TargetingStrategy.XSS
-        )
-        if dalfox_targets.can_run:
-            dalfox_targets.target_urls = [f"[{gating['reflection_count']} reflection endpoints]"]
-            dalfox_targets.reflections = gating.get('reflectable_params', [])
-            dalfox_targets.priority = self.ledger.get_priority("dalfox")
-            dalfox_targets.reason = f"XSS testing on {gating['reflection_count']} reflection endpoints"
-            logger.info(f"[GatingLoop] dalfox ENABLED: {gating['reflection_count']} targets")
-        else:
-            dalfox_targets.reason = "No reflection endpoints"
-            logger.info(f"[GatingLoop] dalfox DISABLED: {dalfox_targets.reason}")
-
-        targets_map["dalfox"] = dalfox_targets
-
-        # === SQLMAP ===
-        sql_targets = ToolTargets(
-            tool_name="sqlmap",
-            can_run=self.ledger.should_run_payload_tool_with_crawl("sqlmap", self.adapter),
-            strategy=TargetingStrategy.SQL
+        logger.info("[GatingLoop] Building targets for %s endpoints, %s parameters, %s reflections",
+                    gating.get('crawled_url_count', 0), gating['parameter_count'], gating['reflection_count'])
+
+        for spec in _TOOL_SPECS:
+            targets_map[spec[0]] = self._build_tool(spec, gating, param_names, priorities)
+            self._signal_prints[spec[0]] = _signal_fingerprint(spec, gating)
+
+        return self._publish(targets_map)
+
+    def _build_tool(self, spec: tuple, gating: dict, param_names: list,
+                    priorities: Dict[str, int]) -> ToolTargets:
+        """Targets for one _TOOL_SPECS entry from the current crawl signals"""
+        tool_name, strategy, signal_key, list_key, label, enabled, disabled = spec
+        if not self._decide(tool_name):
+            logger.info("[GatingLoop] %s DISABLED: %s", tool_name, disabled)
+            return ToolTargets(tool_name=tool_name, can_run=False, strategy=strategy, reason=disabled)
+
+        targets = ToolTargets(tool_name=tool_name, can_run=True, strategy=strategy)
+        # Note: we don't have specific endpoint URLs from basic gating signals
+        # In production, you'd integrate with endpoint_param_graph.py for detailed URLs
+        fill = {'count': gating[signal_key], 'names': param_names}
+        targets.target_urls = [label % fill]
+        if list_key:
+            targets.reflections = gating.get(list_key, [])
+        targets.priority = priorities[tool_name]
+        targets.reason = enabled % fill
+        logger.info("[GatingLoop] %s ENABLED: %s", tool_name, targets.reason)
+        return targets
+
+    def _current_ledger_version(self):
+        """Ledger change counter (None for ledgers that do not track one)"""
+        return getattr(self.ledger, 'version', None)
+
+    def _sync_ledger(self) -> None:
+        """Drop cached decisions and priorities if the ledger changed since"""
+        version = self._current_ledger_version()
+        if version != self._ledger_version:
+            self._ledger_version = version
+            self._decision_cache.clear()
+            self._priorities = None
+
+    def _tool_priorities(self) -> Dict[str, int]:
+        """Ledger priority per payload tool, cached until the ledger changes"""
+        self._sync_ledger()
+        if self._priorities is None:
+            bulk = getattr(self.ledger, 'get_priorities', None)
+            if bulk is not None:
+                self._priorities = bulk(_TOOL_NAMES)
+            else:
+                get_priority = self.ledger.get_priority
+                self._priorities = {name: get_priority(name) for name in _TOOL_NAMES}
+        return self._priorities
+
+    def _publish(self, targets_map: Dict[str, ToolTargets]) -> Dict[str, ToolTargets]:
+        """Install a new targets map along with its summary orderings"""
+        self._name_order = sorted(targets_map)
+        self._priority_order = sorted(
+            (t for t in targets_map.values() if t.can_run),
+            key=attrgetter('priority'), reverse=True
         )
-        if sql_targets.can_run:
-            sql_targets.target_urls = [f"[{gating['parameter_count']} parameter-carrying endpoints]"]
-            sql_targets.priority = self.ledger.get_priority("sqlmap")
-            sql_targets.reason = f"SQL injection on {gating['parameter_count']} parameters ({gating.get('parameter_names', [])})"
-            logger.info(f"[GatingLoop] sqlmap ENABLED: {gating['parameter_count']} param-carrying endpoints")
-        else:
-            sql_targets.reason = "No parameters discovered"
-            logger.info(f"[GatingLoop] sqlmap DISABLED: {sql_targets.reason}")
-
-        targets_map["sqlmap"] = sql_targets
-
-        # === COMMIX ===
-        commix_targets = ToolTargets(
-            tool_name="commix",
-            can_run=self.ledger.should_run_payload_tool_with_crawl("commix", self.adapter),
-            strategy=TargetingStrategy.COMMIX
-        )
-        if commix_targets.can_run:
-            commix_targets.target_urls = [f"[{gating['parameter_count']} parameter-carrying endpoints]"]
-            commix_targets.priority = self.ledger.get_priority("commix")
-            commix_targets.reason = f"Command injection on {gating['parameter_count']} parameters"
-            logger.info(f"[GatingLoop] commix ENABLED: {len(commix_targets.target_urls)} targets")
-        else:
-            commix_targets.reason = "No parameters or tool disabled"
-            logger.info(f"[GatingLoop] commix DISABLED: {commix_targets.reason}")
-
-        targets_map["commix"] = commix_targets
-
         self._targets_cache = targets_map
+        self._targets_version = self._current_ledger_version()
         return targets_map
 
+    def _targets_current(self) -> bool:
+        """Targets exist and were built against the current ledger"""
+        return bool(self._targets_cache) and self._targets_version == self._current_ledger_version()
+
+    def _ensure_built(self):
+        """
+        Build targets once (and again after a ledger change), even if
+        several threads ask at the same time
+        """
+        if self._targets_current():
+            return
+        with self._build_lock:
+            if not self._targets_current():
+                self.build_targets()
+
     def get_tool_targets(self, tool_name: str) -> List[str]:
         """
         Get target URLs for specific tool
@@ -222,8 +363,7 @@ class GatingLoopOrchestrator:
         Usage:
             urls = orchestrator.get_tool_targets("xsstrike")
         """
-        if not self._targets_cache:
-            self.build_targets()
+        self._ensure_built()
 
         targets = self._targets_cache.get(tool_name)
         if targets:
@@ -237,10 +377,23 @@ class GatingLoopOrchestrator:
         Returns:
             Dict[tool_name] → ToolTargets
         """
-        if not self._targets_cache:
-            self.build_targets()
+        self._ensure_built()
         return self._targets_cache
 
+    def iter_tool_dicts(self, **export_opts) -> Iterator[Tuple[str, dict]]:
+        """
+        Yield (tool_name, ToolTargets.to_dict()) one tool at a time
+        
+        Lets exporters stream per-tool records without building the
+        full 'tools' mapping first.
+        
+        Args:
+            **export_opts: inline_urls / max_urls, see ToolTargets.to_dict
+        """
+        self._ensure_built()
+        for tool, targets in self._targets_cache.items():
+            yield tool, targets.to_dict(**export_opts)
+
     def should_run_tool(self, tool_name: str) -> bool:
         """
         Check if tool should run (gated decision)
@@ -251,12 +404,72 @@ class GatingLoopOrchestrator:
         Returns:
             bool: True if tool should run
         """
-        return self.ledger.should_run_payload_tool_with_crawl(tool_name, self.adapter)
+        return self._decide(tool_name)
+
+    def _decide(self, tool_name: str) -> bool:
+        """Ledger decision for tool, evaluated once per adapter and ledger version"""
+        self._sync_ledger()
+        decision = self._decision_cache.get(tool_name)
+        if decision is None:
+            decision = self.ledger.should_run_payload_tool_with_crawl(tool_name, self.adapter)
+            self._decision_cache[tool_name] = decision
+        return decision
+
+    def invalidate(self, crawl_adapter=None):
+        """
+        Drop cached decisions and targets (call after crawl signals change)
+        
+        Args:
+            crawl_adapter: Optional replacement CrawlAdapter
+        """
+        if crawl_adapter is not None:
+            self.adapter = crawl_adapter
+        self._decision_cache.clear()
+        self._targets_cache = {}
+
+    def update_adapter(self, crawl_adapter) -> List[str]:
+        """
+        Switch to a refreshed CrawlAdapter, rebuilding only tools whose
+        input signals changed
+        
+        XSS tools depend on reflections/forms, sqlmap and commix on
+        parameters; a tool whose signals match the last build keeps its
+        decision and targets.
+        
+        Args:
+            crawl_adapter: CrawlAdapter with new crawl results
+            
+        Returns:
+            List[str]: Tools that were rebuilt
+        """
+        self.adapter = crawl_adapter
+        if not self._targets_current():
+            # Nothing built yet, or the ledger changed: every decision may differ
+            self._decision_cache.clear()
+            return list(self.build_targets())
+
+        gating = crawl_adapter.gating_signals
+        param_names = gating.get('parameter_names', [])
+        targets_map = dict(self._targets_cache)  # New map: summary header may change too
+        rebuilt = []
+        for spec in _TOOL_SPECS:
+            tool_name = spec[0]
+            fingerprint = _signal_fingerprint(spec, gating)
+            if self._signal_prints.get(tool_name) == fingerprint:
+                continue
+            self._decision_cache.pop(tool_name, None)
+            targets_map[tool_name] = self._build_tool(spec, gating, param_names, self._tool_priorities())
+            self._signal_prints[tool_name] = fingerprint
+            rebuilt.append(tool_name)
+
+        self._publish(targets_map)
+        return rebuilt
 
     def get_summary(self) -> str:
         """Get human-readable gating summary"""
-        if not self._targets_cache:
-            self.build_targets()
+        self._ensure_built()
+        if self._summary_for is self._targets_cache:
+            return self._summary_cache
 
         gating = self.adapter.gating_signals
         summary_lines = [
@@ -266,35 +479,38 @@ class GatingLoopOrchestrator:
             "Tool Decisions:"
         ]
 
-        for tool_name, targets in sorted(self._targets_cache.items()):
+        for tool_name in self._name_order:
+            targets = self._targets_cache[tool_name]
             status = "✓ RUN" if targets.can_run else "✗ SKIP"
             target_info = f"({len(targets.target_urls)} URLs)" if targets.target_urls else "(no targets)"
             summary_lines.append(f"  {tool_name}: {status} {target_info} - {targets.reason}")
 
         summary_lines.append("")
         summary_lines.append("Execution Order (by priority):")
-        sorted_tools = sorted(
-            [t for t in self._targets_cache.values() if t.can_run],
-            key=lambda x: -x.priority
-        )
-        for i, targets in enumerate(sorted_tools, 1):
+        for i, targets in enumerate(self._priority_order, 1):
             summary_lines.append(f"  {i}. {targets.tool_name} (priority {targets.priority})")
 
-        return "\n".join(summary_lines)
+        self._summary_cache = "\n".join(summary_lines)
+        self._summary_for = self._targets_cache
+        return self._summary_cache
 
-    def to_dict(self) -> dict:
-        """Export gating decisions as dict"""
-        if not self._targets_cache:
-            self.build_targets()
+    def to_dict(self, include_summary: bool = False, **export_opts) -> dict:
+        """
+        Export gating decisions as dict (human-readable summary on request)
+        
+        Args:
+            include_summary: Add get_summary() under 'summary'
+            **export_opts: inline_urls / max_urls, see ToolTargets.to_dict
+        """
+        self._ensure_built()
 
-        return {
+        export = {
             'crawl': self.adapter.gating_signals,
-            'tools': {
-                tool: targets.to_dict()
-                for tool, targets in self._targets_cache.items()
-            },
-            'summary': self.get_summary()
+            'tools': dict(self.iter_tool_dicts(**export_opts)),
         }
+        if include_summary:
+            export['summary'] = self.get_summary()
+        return export
 
 
 # ===== CLI TESTING =====
@@ -358,7 +574,7 @@ if __name__ == "__main__":
             if len(targets.target_urls) > 3:
                 print(f"  ... and {len(targets.target_urls) - 3} more")
         if targets.parameters:
-            param_count = sum(len(p) for p in targets.parameters.values())
+            param_count = targets.param_count
             print(f"  Parameters: {param_count}")
         print()
 
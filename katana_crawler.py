@@ -9,7 +9,7 @@ import subprocess
 import logging
 import re
 from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from urllib.parse import urlparse, parse_qs
 
 logger = logging.getLogger(__name__)
@@ -30,10 +30,19 @@ class CrawlResult:
     tags: Set[str] = field(default_factory=set)
 
     def to_dict(self):
-        """Convert to dict, handling sets"""
-        d = asdict(self)
-        d['tags'] = list(self.tags)
-        return d
+        """Convert to dict, handling sets (containers are shared, not copied)"""
+        return {
+            'url': self.url,
+            'status_code': self.status_code,
+            'title': self.title,
+            'method': self.method,
+            'body': self.body,
+            'headers': self.headers,
+            'params': self.params,
+            'is_api': self.is_api,
+            'form_fields': self.form_fields,
+            'tags': list(self.tags),
+        }
 
 
 class KatanaCrawler:
@@ -3,6 +3,8 @@ OWASP Top 10 Mapping - Phase 4 Hardening
 Purpose: Map tool findings to OWASP Top 10 2021 categories
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Optional
 from enum import Enum
 
@@ -22,8 +24,8 @@ class OWASPCategory(Enum):
     UNMAPPED = "Unmapped"
 
 
-# Mapping table: vulnerability type → OWASP category
-OWASP_MAPPING = {
+# Mapping table: vulnerability type → OWASP category (read-only)
+OWASP_MAPPING = MappingProxyType({
     # === A03: Injection ===
     "xss": OWASPCategory.A03_INJECTION,
     "xss_reflected": OWASPCategory.A03_INJECTION,
@@ -83,12 +85,16 @@ OWASP_MAPPING = {
     # === A10: SSRF ===
     "ssrf": OWASPCategory.A10_SSRF,
     "server_side_request_forgery": OWASPCategory.A10_SSRF,
-}
+})
 
 
+@lru_cache(maxsize=512)
 def map_to_owasp(vuln_type: str) -> OWASPCategory:
     """
     Map vulnerability type to OWASP Top 10 category
+
+    Memoized: findings of the same type resolve their category once,
+    including the partial-match scan over OWASP_MAPPING.
     
     Args:
         vuln_type: Vulnerability type (e.g., "xss", "sql_injection")
@@ -111,37 +117,40 @@ def map_to_owasp(vuln_type: str) -> OWASPCategory:
     return OWASPCategory.UNMAPPED
 
 
+_OWASP_DESCRIPTIONS = MappingProxyType({
+    OWASPCategory.A01_BROKEN_ACCESS_CONTROL: "Access control enforces policy such that users cannot act outside their intended permissions",
+    OWASPCategory.A02_CRYPTOGRAPHIC_FAILURES: "Failures related to cryptography (or lack thereof) which often lead to exposure of sensitive data",
+    OWASPCategory.A03_INJECTION: "Injection flaws, such as SQL, NoSQL, OS, and LDAP injection, occur when untrusted data is sent to an interpreter",
+    OWASPCategory.A04_INSECURE_DESIGN: "Missing or ineffective control design",
+    OWASPCategory.A05_SECURITY_MISCONFIGURATION: "Security misconfiguration is commonly a result of insecure default configurations",
+    OWASPCategory.A06_VULNERABLE_COMPONENTS: "Components with known vulnerabilities may allow attackers to compromise systems",
+    OWASPCategory.A07_AUTH_FAILURES: "Confirmation of user identity, authentication, and session management is critical",
+    OWASPCategory.A08_DATA_INTEGRITY: "Code and infrastructure that does not protect against integrity violations",
+    OWASPCategory.A09_LOGGING_FAILURES: "Logging and monitoring failures allow attackers to achieve their goals undetected",
+    OWASPCategory.A10_SSRF: "SSRF flaws occur when a web application fetches a remote resource without validating the user-supplied URL",
+    OWASPCategory.UNMAPPED: "Vulnerability not mapped to OWASP Top 10 2021"
+})
+
+_OWASP_SEVERITY = MappingProxyType({
+    OWASPCategory.A03_INJECTION: "CRITICAL",
+    OWASPCategory.A01_BROKEN_ACCESS_CONTROL: "HIGH",
+    OWASPCategory.A02_CRYPTOGRAPHIC_FAILURES: "HIGH",
+    OWASPCategory.A07_AUTH_FAILURES: "HIGH",
+    OWASPCategory.A10_SSRF: "HIGH",
+    OWASPCategory.A05_SECURITY_MISCONFIGURATION: "MEDIUM",
+    OWASPCategory.A06_VULNERABLE_COMPONENTS: "MEDIUM",
+    OWASPCategory.A04_INSECURE_DESIGN: "MEDIUM",
+    OWASPCategory.A08_DATA_INTEGRITY: "MEDIUM",
+    OWASPCategory.A09_LOGGING_FAILURES: "LOW",
+    OWASPCategory.UNMAPPED: "INFORMATIONAL"
+})
+
+
 def get_owasp_description(category: OWASPCategory) -> str:
     """Get description for OWASP category"""
-    descriptions = {
-        OWASPCategory.A01_BROKEN_ACCESS_CONTROL: "Access control enforces policy such that users cannot act outside their intended permissions",
-        OWASPCategory.A02_CRYPTOGRAPHIC_FAILURES: "Failures related to cryptography (or lack thereof) which often lead to exposure of sensitive data",
-        OWASPCategory.A03_INJECTION: "Injection flaws, such as SQL, NoSQL, OS, and LDAP injection, occur when untrusted data is sent to an interpreter",
-        OWASPCategory.A04_INSECURE_DESIGN: "Missing or ineffective control design",
-        OWASPCategory.A05_SECURITY_MISCONFIGURATION: "Security misconfiguration is commonly a result of insecure default configurations",
-        OWASPCategory.A06_VULNERABLE_COMPONENTS: "Components with known vulnerabilities may allow attackers to compromise systems",
-        OWASPCategory.A07_AUTH_FAILURES: "Confirmation of user identity, authentication, and session management is critical",
-        OWASPCategory.A08_DATA_INTEGRITY: "Code and infrastructure that does not protect against integrity violations",
-        OWASPCategory.A09_LOGGING_FAILURES: "Logging and monitoring failures allow attackers to achieve their goals undetected",
-        OWASPCategory.A10_SSRF: "SSRF flaws occur when a web application fetches a remote resource without validating the user-supplied URL",
-        OWASPCategory.UNMAPPED: "Vulnerability not mapped to OWASP Top 10 2021"
-    }
-    return descriptions.get(category, "No description available")
+    return _OWASP_DESCRIPTIONS.get(category, "No description available")
 
 
 def get_severity_for_owasp(category: OWASPCategory) -> str:
     """Get typical severity for OWASP category"""
-    severity_map = {
-        OWASPCategory.A03_INJECTION: "CRITICAL",
-        OWASPCategory.A01_BROKEN_ACCESS_CONTROL: "HIGH",
-        OWASPCategory.A02_CRYPTOGRAPHIC_FAILURES: "HIGH",
-        OWASPCategory.A07_AUTH_FAILURES: "HIGH",
-        OWASPCategory.A10_SSRF: "HIGH",
-        OWASPCategory.A05_SECURITY_MISCONFIGURATION: "MEDIUM",
-        OWASPCategory.A06_VULNERABLE_COMPONENTS: "MEDIUM",
-        OWASPCategory.A04_INSECURE_DESIGN: "MEDIUM",
-        OWASPCategory.A08_DATA_INTEGRITY: "MEDIUM",
-        OWASPCategory.A09_LOGGING_FAILURES: "LOW",
-        OWASPCategory.UNMAPPED: "INFORMATIONAL"
-    }
-    return severity_map.get(category, "MEDIUM")
+    return _OWASP_SEVERITY.get(category, "MEDIUM")